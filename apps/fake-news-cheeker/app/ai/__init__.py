@@ -1,3 +1,4 @@
 from .deepseek_client import DeepSeekClient
+from .resilience import RetryPolicy, CircuitBreaker, CircuitOpenError, RetryExhaustedError
 
-__all__ = ['DeepSeekClient']
+__all__ = ['DeepSeekClient', 'RetryPolicy', 'CircuitBreaker', 'CircuitOpenError', 'RetryExhaustedError']
@@ -1,47 +1,88 @@
+import asyncio
 import json
 import re
-import time
-from typing import Optional, Dict
-from huggingface_hub import InferenceClient
-from functools import wraps
-from ..config.settings import HF_TOKEN
+import weakref
+from typing import Optional, Dict, List
+import httpx
+from huggingface_hub.constants import INFERENCE_ENDPOINT
+from ..config.settings import (
+    HF_TOKEN, LLM_MODEL, LLM_MAX_INFLIGHT, LLM_TIMEOUT, LLM_RETRY_ATTEMPTS,
+    LLM_BREAKER_FAILURE_RATE, LLM_BREAKER_MIN_CALLS, LLM_BREAKER_WINDOW, LLM_BREAKER_OPEN_SECONDS
+)
 from ..utils.logger import logger
-
-def log_and_retry(fn):
-    @wraps(fn)
-    def wrapper(*args, **kwargs):
-        max_retries = kwargs.pop("max_retries", 3)
-        for attempt in range(max_retries):
-            try:
-                return fn(*args, **kwargs)
-            except Exception as e:
-                logger.warning(f"[DeepSeek] Attempt {attempt+1}/{max_retries} failed: {e}")
-                time.sleep(1.5 ** attempt)
-        logger.error("[DeepSeek] All retries failed")
-        raise RuntimeError("DeepSeek service unavailable after retries")
-    return wrapper
+from ..core.runtime import runtime
+from .limiter import InflightLimiter
+from .resilience import RetryPolicy, CircuitBreaker, with_resilience
 
 class NoJSONInResponseError(Exception):
     pass
 
+# Caps in-flight LLM calls across all threads and event loops in the process
+llm_limiter = InflightLimiter(LLM_MAX_INFLIGHT)
+
+llm_retry_policy = RetryPolicy(max_attempts=LLM_RETRY_ATTEMPTS)
+llm_breaker = CircuitBreaker(
+    "DeepSeek",
+    failure_rate=LLM_BREAKER_FAILURE_RATE,
+    min_calls=LLM_BREAKER_MIN_CALLS,
+    window=LLM_BREAKER_WINDOW,
+    open_seconds=LLM_BREAKER_OPEN_SECONDS
+)
+
+# One pooled HTTP client per event loop; httpx connections cannot cross loops
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+def _get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(LLM_TIMEOUT, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=LLM_MAX_INFLIGHT,
+                max_connections=LLM_MAX_INFLIGHT * 2
+            ),
+            headers={"Authorization": f"Bearer {HF_TOKEN}"} if HF_TOKEN else {}
+        )
+        _async_clients[loop] = client
+    return client
+
+async def close_async_client():
+    """Close the pooled client of the running loop"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+runtime.on_shutdown(close_async_client)
+
 class DeepSeekClient:
-    def __init__(self):
-        self.client = InferenceClient(token=HF_TOKEN)
+    def __init__(self, model: str = LLM_MODEL):
+        self.model = model
+        self.chat_url = f"{INFERENCE_ENDPOINT}/models/{model}/v1/chat/completions"
+
+    @with_resilience(llm_retry_policy, llm_breaker)
+    async def ask_async(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 512) -> str:
+        payload = {
+            "model": self.model,
+            "messages": self._build_messages(prompt, system_prompt),
+            "max_tokens": max_tokens,
+            "temperature": 0.8,
+            "stream": False,
+        }
+        async with llm_limiter:
+            resp = await _get_async_client().post(self.chat_url, json=payload)
+        resp.raise_for_status()
+        return self._extract_content(resp.json())
 
-    @log_and_retry
-    def ask(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    def _build_messages(self, prompt: str, system_prompt: Optional[str]) -> List[Dict]:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
+        return messages
 
-        raw_response = self.client.chat_completion(
-            messages=messages,
-            model="deepseek-ai/DeepSeek-V3",
-            max_tokens=512,
-            temperature=0.8,
-        )
-
+    def _extract_content(self, raw_response) -> str:
         # Normalize output depending on HF client response type
         if isinstance(raw_response, dict):
             # Try to extract the 'choices' field if present, else dump the dict
@@ -86,3 +127,52 @@ class DeepSeekClient:
             "confidence": max(0.0, min(100.0, float(data.get("confidence", 0.0)))),
             "reason": data.get("reason", "").strip()
         }
+
+
+    def _parse_batch_response(self, response: str, articles: List[Dict]) -> List[Dict]:
+        """Parse a JSON array of per-article verdicts, matched back to articles by index"""
+        code_block = re.search(r"```json\s*([\s\S]+?)```", response)
+        if code_block:
+            json_str = code_block.group(1)
+        else:
+            match = re.search(r'(\[.*\])', response, re.DOTALL)
+            if not match:
+                logger.error(f"No JSON array found in batch LLM response: {response!r}")
+                raise NoJSONInResponseError("No JSON array found in response")
+            json_str = match.group(1)
+        try:
+            items = json.loads(json_str)
+        except json.JSONDecodeError as e:
+            raise NoJSONInResponseError(f"Malformed JSON array: {e}") from e
+        if not isinstance(items, list):
+            raise NoJSONInResponseError("Batch response is not a JSON array")
+
+        by_index = {}
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get("index", position + 1)) - 1
+            except (TypeError, ValueError):
+                index = position
+            if 0 <= index < len(articles):
+                by_index.setdefault(index, item)
+
+        results = []
+        for index, article in enumerate(articles):
+            data = by_index.get(index)
+            if data is None:
+                results.append(None)
+                continue
+            try:
+                results.append({
+                    **article,
+                    "relevant": bool(data.get("relevant", False)),
+                    "support": str(data.get("support", "Unknown")).capitalize(),
+                    "confidence": max(0.0, min(100.0, float(data.get("confidence", 0.0)))),
+                    "reason": str(data.get("reason", "")).strip(),
+                    "authoritative": data.get("authoritative")
+                })
+            except (TypeError, ValueError):
+                results.append(None)
+        return results
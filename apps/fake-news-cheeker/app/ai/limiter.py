@@ -0,0 +1,94 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Deque, Optional, Tuple, Union
+
+
+class InflightLimiter:
+    """
+    Counting semaphore shared by every thread and event loop in the process.
+
+    ``asyncio.Semaphore`` is bound to a single loop, so it cannot cap LLM calls
+    made from worker threads and from coroutines at the same time. Slots are
+    handed directly to the oldest waiter on release, which keeps waiting fair.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._inflight = 0
+        self._lock = threading.Lock()
+        self._waiters: Deque[Tuple[Optional[asyncio.AbstractEventLoop], Union[asyncio.Future, threading.Event]]] = deque()
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self):
+        with self._lock:
+            if self._inflight < self.limit and not self._waiters:
+                self._inflight += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                    owned = False
+                except ValueError:
+                    # Release already handed us the slot
+                    owned = waiter[1].done() and not waiter[1].cancelled()
+            if owned:
+                self.release()
+            raise
+
+    def acquire_sync(self):
+        with self._lock:
+            if self._inflight < self.limit and not self._waiters:
+                self._inflight += 1
+                return
+            event = threading.Event()
+            self._waiters.append((None, event))
+        event.wait()
+
+    def release(self):
+        with self._lock:
+            if not self._waiters:
+                self._inflight -= 1
+                return
+            loop, waiter = self._waiters.popleft()
+        if loop is None:
+            waiter.set()
+        else:
+            try:
+                loop.call_soon_threadsafe(self._wake, waiter)
+            except RuntimeError:
+                # Waiter's loop is closed; pass the slot on
+                self.release()
+
+    def _wake(self, future: asyncio.Future):
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.release()
+
+    def __enter__(self):
+        self.acquire_sync()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
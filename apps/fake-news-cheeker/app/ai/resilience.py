@@ -0,0 +1,212 @@
+import asyncio
+import inspect
+import random
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Dict, Optional
+import httpx
+import requests
+from ..utils.logger import logger
+
+# Upstream conditions worth retrying; other 4xx responses are our own fault
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling upstream while the circuit breaker is open."""
+    pass
+
+
+class RetryExhaustedError(RuntimeError):
+    """Raised when every attempt of a retryable call failed."""
+    pass
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Jittered exponential backoff that only retries transient upstream errors"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        if isinstance(exc, CircuitOpenError):
+            return False
+        status = _status_code(exc)
+        if status is not None:
+            return status in RETRYABLE_STATUS
+        return isinstance(exc, (
+            httpx.TransportError,
+            requests.ConnectionError,
+            requests.Timeout,
+            ConnectionError,
+            TimeoutError,
+            asyncio.TimeoutError,
+        ))
+
+    def delay(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        # Full jitter keeps retrying workers from synchronizing against a recovering upstream
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        retry_after = _retry_after(exc) if exc is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker.
+
+    Opens when at least ``min_calls`` upstream calls were made within
+    ``window`` seconds and the failure ratio reaches ``failure_rate``. After
+    ``open_seconds`` a single probe call is let through (half-open); its
+    outcome closes the circuit or re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_rate: float = 0.5, min_calls: int = 10,
+                 window: float = 30.0, open_seconds: float = 30.0):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.open_seconds = open_seconds
+        self.state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._calls = deque()  # (timestamp, failed)
+        self._lock = threading.Lock()
+        self.counters = {"opened": 0, "half_opened": 0, "closed": 0, "rejected": 0,
+                         "successes": 0, "failures": 0}
+
+    def before_call(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    self.counters["rejected"] += 1
+                    raise CircuitOpenError(f"{self.name} circuit is open")
+                self._transition(self.HALF_OPEN)
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    self.counters["rejected"] += 1
+                    raise CircuitOpenError(f"{self.name} circuit is half-open, probe in flight")
+                self._probe_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.counters["successes"] += 1
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                self._calls.clear()
+                self._transition(self.CLOSED)
+                return
+            self._record(False)
+
+    def record_failure(self):
+        with self._lock:
+            self.counters["failures"] += 1
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                self._open()
+                return
+            self._record(True)
+            failures = sum(1 for _, failed in self._calls if failed)
+            if (self.state == self.CLOSED and len(self._calls) >= self.min_calls
+                    and failures / len(self._calls) >= self.failure_rate):
+                self._open()
+
+    def release_probe(self):
+        """Give up a half-open probe whose outcome says nothing about upstream health"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            self._prune(time.monotonic())
+            failures = sum(1 for _, failed in self._calls if failed)
+            return {
+                "name": self.name,
+                "state": self.state,
+                "window_calls": len(self._calls),
+                "window_error_rate": failures / len(self._calls) if self._calls else 0.0,
+                **self.counters,
+            }
+
+    def _record(self, failed: bool):
+        now = time.monotonic()
+        self._calls.append((now, failed))
+        self._prune(now)
+
+    def _prune(self, now: float):
+        while self._calls and now - self._calls[0][0] > self.window:
+            self._calls.popleft()
+
+    def _open(self):
+        self._opened_at = time.monotonic()
+        self._transition(self.OPEN)
+
+    def _transition(self, state: str):
+        if state == self.state:
+            return
+        logger.warning(f"[{self.name}] Circuit {self.state} -> {state}")
+        self.state = state
+        self.counters[{"open": "opened", "half_open": "half_opened", "closed": "closed"}[state]] += 1
+
+
+def with_resilience(policy: RetryPolicy, breaker: CircuitBreaker):
+    """Retry transient failures of a coroutine function with backoff, behind a circuit breaker"""
+    def on_error(exc: BaseException) -> bool:
+        retryable = policy.is_retryable(exc)
+        if retryable:
+            breaker.record_failure()
+        else:
+            breaker.release_probe()
+        return retryable
+
+    def decorate(fn):
+        if not inspect.iscoroutinefunction(fn):
+            # Backoff must not block a worker thread; callers await the retries
+            raise TypeError(f"with_resilience wraps coroutine functions, got {fn!r}")
+
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(policy.max_attempts):
+                breaker.before_call()
+                try:
+                    result = await fn(*args, **kwargs)
+                except asyncio.CancelledError:
+                    breaker.release_probe()
+                    raise
+                except Exception as e:
+                    if not on_error(e):
+                        raise
+                    logger.warning(f"[{breaker.name}] Attempt {attempt+1}/{policy.max_attempts} failed: {e}")
+                    if attempt + 1 < policy.max_attempts:
+                        await asyncio.sleep(policy.delay(attempt, e))
+                    continue
+                breaker.record_success()
+                return result
+            logger.error(f"[{breaker.name}] All retries failed")
+            raise RetryExhaustedError(f"{breaker.name} service unavailable after retries")
+        return wrapper
+    return decorate
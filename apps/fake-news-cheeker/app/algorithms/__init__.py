@@ -0,0 +1,3 @@
+from .minhash import MinHasher, MinHashLSH
+
+__all__ = ['MinHasher', 'MinHashLSH']
@@ -0,0 +1,246 @@
+import threading
+import time
+import zlib
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+import numpy as np
+
+# Universal hashing h(x) = (a*x + b) mod p over 32-bit token hashes, p = 2**32 + 15
+_PRIME = np.uint64((1 << 32) + 15)
+_MASK32 = np.uint64(0xFFFFFFFF)
+# Stored signatures keep the low 16 bits of each min-hash (b-bit MinHash)
+_BBIT_COLLISION = 1.0 / (1 << 16)
+
+
+class MinHasher:
+    """Computes MinHash signatures of token sets; stable across processes"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        # a < 2**31 keeps a*x + b below 2**64 for 32-bit x
+        self.a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self.b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+    def signature(self, tokens: Iterable[str]) -> Optional[np.ndarray]:
+        """Return a uint32 signature, or None for an empty token set"""
+        hashes = np.fromiter(
+            (zlib.crc32(t.encode("utf-8")) for t in set(tokens)),
+            dtype=np.uint64
+        )
+        if hashes.size == 0:
+            return None
+        permuted = (np.outer(hashes, self.a) + self.b) % _PRIME
+        return (permuted & _MASK32).min(axis=0).astype(np.uint32)
+
+
+class MinHashLSH:
+    """
+    Banded LSH index over MinHash signatures.
+
+    Each band is a sorted array of band hashes searched with bisection, plus a
+    small dict of recent inserts that is merged in once it grows past
+    ``merge_every``. Candidates are verified against the stored b-bit
+    signatures and must carry the same ``guard`` value as the query.
+
+    Each key is stored once with the time it was last added; ``evict``
+    drops entries older than a cutoff and rebuilds the bands from the
+    stored signatures.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.7,
+                 merge_every: int = 20000, max_bucket: int = 256):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.merge_every = merge_every
+        self.max_bucket = max_bucket
+
+        rng = np.random.RandomState(num_perm * 7919 + bands)
+        self._band_mult = (rng.randint(1, 1 << 62, size=self.rows, dtype=np.int64).astype(np.uint64)
+                           | np.uint64(1))
+
+        self.keys: List[Hashable] = []
+        self._index: Dict[Hashable, int] = {}
+        self._sigs = np.empty((1024, num_perm), dtype=np.uint16)
+        self._guards = np.empty(1024, dtype=np.uint32)
+        self._times = np.empty(1024, dtype=np.float64)
+        self._sorted_keys = [np.empty(0, dtype=np.uint64) for _ in range(bands)]
+        self._sorted_ids = [np.empty(0, dtype=np.int64) for _ in range(bands)]
+        self._pending: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._pending_count = 0
+        self._lock = threading.RLock()
+        self._evict_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+
+    def touch(self, key: Hashable, timestamp: Optional[float] = None) -> bool:
+        """Refresh the timestamp of an indexed key; False if the key is not indexed"""
+        with self._lock:
+            idx = self._index.get(key)
+            if idx is None:
+                return False
+            self._touch(idx, time.time() if timestamp is None else timestamp)
+            return True
+
+    def add(self, key: Hashable, signature: np.ndarray, guard: int = 0, timestamp: Optional[float] = None):
+        """Index ``key``; a key already present only has its timestamp refreshed"""
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            if key in self._index:
+                self._touch(self._index[key], timestamp)
+                return
+            idx = self._append(np.asarray(signature)[None, :], np.array([guard], dtype=np.uint32),
+                               np.array([timestamp]), [key])
+            band_keys = self._band_keys(signature[None, :])[0]
+            for band, band_key in enumerate(band_keys.tolist()):
+                self._pending[band].setdefault(band_key, []).append(idx)
+            self._pending_count += 1
+            if self._pending_count >= self.merge_every:
+                self._merge_pending()
+
+    def add_many(self, keys: List[Hashable], signatures: np.ndarray, guards: np.ndarray,
+                 timestamps: Optional[np.ndarray] = None):
+        """Bulk insert; merges straight into the sorted band arrays"""
+        if not keys:
+            return
+        timestamps = np.full(len(keys), time.time()) if timestamps is None else np.asarray(timestamps, dtype=np.float64)
+        with self._lock:
+            # Keys already indexed, or repeated within the batch, only refresh their timestamp
+            fresh: Dict[Hashable, int] = {}
+            for i, key in enumerate(keys):
+                if key in self._index:
+                    self._touch(self._index[key], timestamps[i])
+                elif key in fresh:
+                    timestamps[fresh[key]] = max(timestamps[fresh[key]], timestamps[i])
+                else:
+                    fresh[key] = i
+            if not fresh:
+                return
+            rows = np.fromiter(fresh.values(), dtype=np.int64, count=len(fresh))
+            signatures = signatures[rows]
+            first = self._append(signatures, guards[rows].astype(np.uint32), timestamps[rows], list(fresh))
+            ids = np.arange(first, first + len(fresh), dtype=np.int64)
+            band_keys = self._band_keys(signatures)
+            for band in range(self.bands):
+                self._merge_band(band, band_keys[:, band], ids)
+
+    def evict(self, older_than: float) -> int:
+        """
+        Drop entries last added before ``older_than``; returns how many were
+        dropped. The bands are rebuilt outside the lock, so lookups and
+        inserts go on meanwhile; inserts made during the rebuild are carried
+        over.
+        """
+        with self._evict_lock:
+            with self._lock:
+                count = len(self.keys)
+                keep = np.flatnonzero(self._times[:count] >= older_than)
+                if keep.size == count:
+                    return 0
+                sigs, guards = self._sigs[keep], self._guards[keep]
+
+            # Entries below ``count`` do not move until the swap below
+            keys = [self.keys[i] for i in keep.tolist()]
+            index = {key: i for i, key in enumerate(keys)}
+            # Stored b-bit signatures give the same band keys as the full ones
+            band_keys = self._band_keys(sigs)
+            ids = np.arange(len(keys), dtype=np.int64)
+            orders = [np.argsort(band_keys[:, band], kind="stable") for band in range(self.bands)]
+
+            with self._lock:
+                added = slice(count, len(self.keys))
+                added_keys = self.keys[added]
+                added_sigs, added_guards = self._sigs[added].copy(), self._guards[added].copy()
+                added_times = self._times[added].copy()
+                # Read now: picks up timestamps refreshed during the rebuild
+                times = self._times[keep]
+
+                self.keys, self._index = keys, index
+                self._sigs, self._guards, self._times = sigs, guards, times
+                self._sorted_keys = [band_keys[order, band] for band, order in enumerate(orders)]
+                self._sorted_ids = [ids[order] for order in orders]
+                self._pending = [{} for _ in range(self.bands)]
+                self._pending_count = 0
+                for i, key in enumerate(added_keys):
+                    self.add(key, added_sigs[i], int(added_guards[i]), float(added_times[i]))
+                return count - keep.size
+
+    def query(self, signature: np.ndarray, guard: int = 0) -> List[Tuple[Hashable, float]]:
+        """Return (key, estimated Jaccard) pairs at or above the threshold, best first"""
+        band_keys = self._band_keys(signature[None, :])[0]
+        with self._lock:
+            candidates = set()
+            for band, band_key in enumerate(band_keys):
+                sorted_keys = self._sorted_keys[band]
+                lo = np.searchsorted(sorted_keys, band_key, side="left")
+                hi = np.searchsorted(sorted_keys, band_key, side="right")
+                if hi > lo:
+                    # Newest entries win when a bucket is crowded
+                    candidates.update(self._sorted_ids[band][max(lo, hi - self.max_bucket):hi].tolist())
+                candidates.update(self._pending[band].get(int(band_key), ()))
+            if not candidates:
+                return []
+
+            ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            ids = ids[self._guards[ids] == np.uint32(guard)]
+            if ids.size == 0:
+                return []
+            matches = (self._sigs[ids] == (signature & 0xFFFF).astype(np.uint16)).mean(axis=1)
+            similarity = np.clip((matches - _BBIT_COLLISION) / (1.0 - _BBIT_COLLISION), 0.0, 1.0)
+            keep = similarity >= self.threshold
+            order = np.argsort(-similarity[keep], kind="stable")
+            return [(self.keys[i], float(s)) for i, s in zip(ids[keep][order].tolist(), similarity[keep][order].tolist())]
+
+    def _append(self, signatures: np.ndarray, guards: np.ndarray, timestamps: np.ndarray,
+                keys: List[Hashable]) -> int:
+        first = len(self.keys)
+        needed = first + len(keys)
+        if needed > len(self._sigs):
+            capacity = max(needed, 2 * len(self._sigs))
+            self._sigs = np.resize(self._sigs, (capacity, self.num_perm))
+            self._guards = np.resize(self._guards, capacity)
+            self._times = np.resize(self._times, capacity)
+        self._sigs[first:needed] = (signatures & 0xFFFF).astype(np.uint16)
+        self._guards[first:needed] = guards
+        self._times[first:needed] = timestamps
+        self._index.update((key, first + i) for i, key in enumerate(keys))
+        self.keys.extend(keys)
+        return first
+
+    def _touch(self, idx: int, timestamp: float):
+        self._times[idx] = max(self._times[idx], timestamp)
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        # Over the low 16 bits, as stored, so evict() can rebuild the bands
+        rows = (signatures & 0xFFFF).astype(np.uint64).reshape(len(signatures), self.bands, self.rows)
+        # uint64 arithmetic wraps, which is all a hash needs
+        return (rows * self._band_mult).sum(axis=2, dtype=np.uint64)
+
+    def _merge_band(self, band: int, band_keys: np.ndarray, ids: np.ndarray):
+        merged_keys = np.concatenate([self._sorted_keys[band], band_keys])
+        merged_ids = np.concatenate([self._sorted_ids[band], ids])
+        order = np.argsort(merged_keys, kind="stable")
+        self._sorted_keys[band] = merged_keys[order]
+        self._sorted_ids[band] = merged_ids[order]
+
+    def _merge_pending(self):
+        for band in range(self.bands):
+            pending = self._pending[band]
+            if not pending:
+                continue
+            band_keys = np.fromiter(
+                (k for k, ids in pending.items() for _ in ids), dtype=np.uint64
+            )
+            ids = np.fromiter(
+                (i for ids in pending.values() for i in ids), dtype=np.int64
+            )
+            self._merge_band(band, band_keys, ids)
+            self._pending[band] = {}
+        self._pending_count = 0
@@ -0,0 +1,54 @@
+from typing import Iterable
+from asgiref.wsgi import WsgiToAsgi
+from quart import Quart
+from quart_cors import cors
+from ..ai.deepseek_client import close_async_client
+from ..services.scrape_service import get_scrape_service
+from ..services.google_search_service import close_search_client
+from ..core.json_provider import init_json
+from .claim_routes import claim_bp
+from .search_routes import search_bp
+from .analyze_routes import analyze_bp
+
+
+class PathDispatcher:
+    """Send requests under ``prefixes`` to the async app and everything else to the fallback"""
+
+    def __init__(self, app, fallback, prefixes: Iterable[str]):
+        self.app = app
+        self.fallback = fallback
+        self.prefixes = tuple(p.rstrip("/") for p in prefixes)
+
+    async def __call__(self, scope, receive, send):
+        # Lifespan events drive the async app's startup/shutdown hooks
+        if scope["type"] == "lifespan" or self._matches(scope.get("path", "")):
+            await self.app(scope, receive, send)
+        else:
+            await self.fallback(scope, receive, send)
+
+    def _matches(self, path: str) -> bool:
+        return any(path == p or path.startswith(p + "/") for p in self.prefixes)
+
+
+def create_asgi_app(flask_app):
+    """
+    Serve the claim, search and analysis APIs as coroutines on the server's
+    event loop; every other route is handed to ``flask_app`` through a WSGI
+    adapter.
+    """
+    app = Quart(__name__)
+    init_json(app)
+    blueprints = (claim_bp, search_bp, analyze_bp)
+    for bp in blueprints:
+        app.register_blueprint(bp)
+
+    @app.after_serving
+    async def close_clients():
+        await get_scrape_service().close()
+        await close_async_client()
+        await close_search_client()
+
+    return PathDispatcher(cors(app), WsgiToAsgi(flask_app), [bp.url_prefix for bp in blueprints])
+
+
+__all__ = ['create_asgi_app', 'PathDispatcher']
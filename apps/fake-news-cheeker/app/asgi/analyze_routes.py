@@ -0,0 +1,54 @@
+from quart import Blueprint, jsonify, request
+from ..services.analyze_service import AnalyzeService
+from ..ai.deepseek_client import llm_breaker, llm_limiter
+from .errors import handle_error
+from ..utils.shaping import requested_fields, shape
+import time
+
+analyze_bp = Blueprint('analyze', __name__, url_prefix='/api/analysis')
+service = AnalyzeService()
+
+@analyze_bp.route('/analyze', methods=['POST'])
+@handle_error
+async def analyze_claim():
+    start_time = time.perf_counter()
+    if not request.is_json:
+        return jsonify({"error": "Request must be JSON"}), 400
+
+    data = await request.get_json()
+    claim = (data.get('claim') or '').strip()
+    articles = data.get('articles', [])
+
+    if not claim:
+        return jsonify({"error": "Missing claim in request body"}), 400
+
+    if not articles:
+        return jsonify({
+            "status": "error",
+            "message": "Both claim and articles are required",
+            "code": 400
+        }), 400
+
+    raw_results = await service.analyze_sources_async(claim, articles)
+    analysis = service.compute_final_verdict(claim, raw_results)
+
+    return jsonify({
+        "status": "success",
+        "verdict": analysis["verdict"],
+        "confidence": analysis["confidence"],
+        "explanation": analysis["explanation"],
+        "conclusion": analysis.get("conclusion"),
+        "category": analysis["category"],
+        "sources": shape(analysis["sources"], requested_fields(request.args.get("include"))),
+        "processing_time": f"{(time.perf_counter() - start_time):.3f}s"
+    })
+
+@analyze_bp.route('/llm-status', methods=['GET'])
+async def llm_status():
+    """Circuit breaker state/transitions and in-flight LLM calls"""
+    return jsonify({
+        "circuit_breaker": llm_breaker.metrics(),
+        "inflight": llm_limiter.inflight,
+        "waiting": llm_limiter.waiting,
+        "max_inflight": llm_limiter.limit
+    })
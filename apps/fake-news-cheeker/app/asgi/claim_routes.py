@@ -0,0 +1,89 @@
+from quart import Blueprint, Response, jsonify, request
+from ..services.claim_service import ClaimService
+from ..services.verdict_cache import verdict_cache
+from ..services.claim_index import claim_index
+from ..services.article_cache import article_cache
+from ..services.search_cache import search_cache
+from ..core.response_cache import response_cache
+from ..services.persistence import persistence_queue
+from ..utils.sse import format_sse
+from ..utils.shaping import requested_fields, shape
+from .errors import handle_error
+
+claim_bp = Blueprint('claims', __name__, url_prefix='/api/claims')
+service = ClaimService()
+
+@claim_bp.route('/verify', methods=['POST'])
+@handle_error
+async def verify_claim():
+    """Route for claim verification"""
+    if not request.is_json:
+        return jsonify({
+            "status": "error",
+            "message": "Request must be JSON",
+            "code": 400
+        }), 400
+
+    data = await request.get_json()
+    claim_text = data.get('claim')
+
+    if not claim_text or not isinstance(claim_text, str):
+        return jsonify({
+            "status": "error",
+            "message": "Valid claim text is required",
+            "code": 400
+        }), 400
+
+    result = await service.verify_claim_async(claim_text)
+    return jsonify(shape(result, requested_fields(request.args.get('include')))), 200 if result.get("status") == "success" else 400
+
+@claim_bp.route('/verify/stream', methods=['GET', 'POST'])
+@handle_error
+async def verify_claim_stream():
+    """Claim verification streamed as Server-Sent Events"""
+    if request.method == "GET":
+        claim_text = request.args.get('claim')
+    else:
+        data = await request.get_json(silent=True) or {}
+        claim_text = data.get('claim')
+
+    if not claim_text or not isinstance(claim_text, str):
+        return jsonify({
+            "status": "error",
+            "message": "Valid claim text is required",
+            "code": 400
+        }), 400
+
+    include = requested_fields(request.args.get('include'))
+
+    async def stream():
+        async for event, data in service.verify_claim_events(claim_text):
+            yield format_sse(event, shape(data, include))
+
+    response = Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+    # A verification can outlive Quart's default response timeout
+    response.timeout = None
+    return response
+
+@claim_bp.route('/cache-stats', methods=['GET'])
+async def cache_stats():
+    """Verdict cache, near-duplicate index, article, search and public response cache counters"""
+    return jsonify({
+        "verdict_cache": dict(verdict_cache.stats),
+        "near_duplicate_index": claim_index.stats(),
+        "article_cache": dict(article_cache.stats),
+        "search_cache": {**search_cache.stats, "entries": len(search_cache)},
+        "response_cache": dict(response_cache.stats)
+    })
+
+@claim_bp.route('/write-queue', methods=['GET'])
+async def write_queue_status():
+    """Write-behind persistence queue depth and counters"""
+    return jsonify({
+        "depth": persistence_queue.depth,
+        **persistence_queue.stats
+    })
@@ -1,18 +1,10 @@
-from flask import Blueprint, request, jsonify
-from ..services.scrape_service import ScrapeService
-from ..services.google_search_service import GoogleSearchService
-from ..core.error_handler import handle_error
-from ..utils.logger import logger
+from quart import Blueprint, jsonify, request
+from ..services.search_provider import get_search_provider
+from .errors import handle_error
 import time
-import asyncio
 
 search_bp = Blueprint('search', __name__, url_prefix='/api/search')
-scrape_service = ScrapeService()
-google_service = GoogleSearchService()
-
-# Simple cache implementation for async functions
-cache = {}
-CACHE_DURATION = 300  # 5 minutes
+search_provider = get_search_provider()
 
 def classify_category(claim, articles=None):
     if articles is None:
@@ -38,29 +30,16 @@ def classify_category(claim, articles=None):
 
 @search_bp.route('/web', methods=['POST'])
 @handle_error
-def web_search():  # Removed async decorator
+async def web_search():
     start_time = time.time()
-    data = request.get_json() or {}
+    data = await request.get_json() or {}
     query = data.get("query", "").strip()
 
     if not query:
         return jsonify({"error": "Query is required"}), 400
 
     max_results = min(int(data.get("max_results", 5)), 20)
-    cache_key = f"{query}-{max_results}"
-
-    # Check cache first
-    if cache_key in cache:
-        cache_time, cached_data = cache[cache_key]
-        if time.time() - cache_time < CACHE_DURATION:
-            logger.debug(f"Using cached results for: {query}")
-            articles = cached_data
-        else:
-            del cache[cache_key]  # Remove expired cache
-    else:
-        # Get fresh results if not in cache
-        articles = google_service.search(query, max_results)
-        cache[cache_key] = (time.time(), articles)
+    articles = await search_provider.search_async(query, max_results)
 
     processing_time = time.time() - start_time
 
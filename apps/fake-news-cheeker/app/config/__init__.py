@@ -1,4 +1,30 @@
 # app/config/__init__.py
-from .settings import DATABASE_URL, HF_TOKEN, GOOGLE_API_KEY, GOOGLE_CX
+from .settings import (
+    DATABASE_URL, HF_TOKEN, GOOGLE_API_KEY, GOOGLE_CX,
+    VERDICT_CACHE_SIZE, VERDICT_CACHE_DEFAULT_TTL, VERDICT_CACHE_TTLS,
+    NEAR_DUPLICATE_THRESHOLD, MINHASH_NUM_PERM, MINHASH_BANDS,
+    ANALYZE_BATCH_SIZE, LLM_MODEL, LLM_MAX_INFLIGHT, LLM_TIMEOUT, LLM_RETRY_ATTEMPTS,
+    LLM_BREAKER_FAILURE_RATE, LLM_BREAKER_MIN_CALLS, LLM_BREAKER_WINDOW, LLM_BREAKER_OPEN_SECONDS,
+    EARLY_TERMINATION, EARLY_TERMINATION_BATCH_SIZE, ARTICLE_CACHE_SIZE, ARTICLE_CACHE_FRESHNESS,
+    PERSIST_WRITE_BEHIND, PERSIST_QUEUE_SIZE, PERSIST_BATCH_SIZE, PERSIST_FLUSH_INTERVAL,
+    PERSIST_ENQUEUE_TIMEOUT, PERSIST_SPILL_DIR, SEARCH_LANGUAGES, EXPORT_BATCH_SIZE,
+    STATS_REFRESH_INTERVAL, STATS_REFRESH_LOOKBACK_HOURS, RESPONSE_CACHE_SIZE,
+    CONTENT_PREVIEW_CHARS, SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL, SEARCH_CACHE_STALE_TTL,
+    SEARCH_CACHE_PATH, SEARCH_PROVIDER, LOCAL_SEARCH_REFRESH,
+    EXTRACTION_BACKEND, EXTRACTION_PROCESSES, EXTRACTION_THREADS, EXTRACTION_PROCESS_MIN_BYTES
+)
 
-__all__ = ['DATABASE_URL', 'HF_TOKEN', 'GOOGLE_API_KEY', 'GOOGLE_CX']
+__all__ = [
+    'DATABASE_URL', 'HF_TOKEN', 'GOOGLE_API_KEY', 'GOOGLE_CX',
+    'VERDICT_CACHE_SIZE', 'VERDICT_CACHE_DEFAULT_TTL', 'VERDICT_CACHE_TTLS',
+    'NEAR_DUPLICATE_THRESHOLD', 'MINHASH_NUM_PERM', 'MINHASH_BANDS',
+    'ANALYZE_BATCH_SIZE', 'LLM_MODEL', 'LLM_MAX_INFLIGHT', 'LLM_TIMEOUT', 'LLM_RETRY_ATTEMPTS',
+    'LLM_BREAKER_FAILURE_RATE', 'LLM_BREAKER_MIN_CALLS', 'LLM_BREAKER_WINDOW', 'LLM_BREAKER_OPEN_SECONDS',
+    'EARLY_TERMINATION', 'EARLY_TERMINATION_BATCH_SIZE', 'ARTICLE_CACHE_SIZE', 'ARTICLE_CACHE_FRESHNESS',
+    'PERSIST_WRITE_BEHIND', 'PERSIST_QUEUE_SIZE', 'PERSIST_BATCH_SIZE', 'PERSIST_FLUSH_INTERVAL',
+    'PERSIST_ENQUEUE_TIMEOUT', 'PERSIST_SPILL_DIR', 'SEARCH_LANGUAGES', 'EXPORT_BATCH_SIZE',
+    'STATS_REFRESH_INTERVAL', 'STATS_REFRESH_LOOKBACK_HOURS', 'RESPONSE_CACHE_SIZE',
+    'CONTENT_PREVIEW_CHARS', 'SEARCH_CACHE_SIZE', 'SEARCH_CACHE_TTL', 'SEARCH_CACHE_STALE_TTL',
+    'SEARCH_CACHE_PATH', 'SEARCH_PROVIDER', 'LOCAL_SEARCH_REFRESH',
+    'EXTRACTION_BACKEND', 'EXTRACTION_PROCESSES', 'EXTRACTION_THREADS', 'EXTRACTION_PROCESS_MIN_BYTES'
+]
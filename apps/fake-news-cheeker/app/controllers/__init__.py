@@ -1,4 +1,3 @@
-from .claim_controller import ClaimController
 from .search_controller import SearchController
 
-__all__ = ['ClaimController', 'SearchController']
+__all__ = ['SearchController']
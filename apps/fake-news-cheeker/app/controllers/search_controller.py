@@ -1,12 +1,12 @@
 from flask import request, jsonify
-from ..services.scrape_service import ScrapeService
+from ..services.scrape_service import get_scrape_service
 from ..core.error_handler import handle_error
-import asyncio
+from ..core.runtime import runtime
 import uuid
 
 class SearchController:
     def __init__(self):
-        self.service = ScrapeService()
+        self.service = get_scrape_service()
 
     @handle_error
     def search_web(self):
@@ -26,7 +26,7 @@ class SearchController:
             max_results = 5
 
         try:
-            articles = asyncio.run(self.service.search_news_async(query, max_results, scrape_content=False))
+            articles = runtime.run(self.service.search_news_async(query, max_results, scrape_content=False))
             if not isinstance(articles, list):
                 raise TypeError("search_news did not return a list")
             analysis = {
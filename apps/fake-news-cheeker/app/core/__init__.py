@@ -1,4 +1,9 @@
 from .error_handler import handle_error
 from .exceptions import ScrapingError, AnalysisError
+from .runtime import AsyncRuntime, runtime
+from .response_cache import ResponseCache, CachePolicy, response_cache, write_generation
+from .extraction_pool import ExtractionPool, extraction_pool
 
-__all__ = ['handle_error', 'ScrapingError', 'AnalysisError']
+__all__ = ['handle_error', 'ScrapingError', 'AnalysisError', 'AsyncRuntime', 'runtime',
+           'ResponseCache', 'CachePolicy', 'response_cache', 'write_generation',
+           'ExtractionPool', 'extraction_pool']
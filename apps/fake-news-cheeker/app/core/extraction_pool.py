@@ -0,0 +1,140 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, Union
+from ..config.settings import (
+    EXTRACTION_BACKEND, EXTRACTION_PROCESSES, EXTRACTION_THREADS, EXTRACTION_PROCESS_MIN_BYTES
+)
+from ..utils.logger import logger
+from .runtime import runtime
+
+BACKENDS = ("auto", "thread", "process")
+
+WARM_UP_HTML = "<html><body><article>" + "<p>warm up</p>" * 40 + "</article></body></html>"
+
+
+def _decode(data: Union[bytes, str], encoding: Optional[str]) -> str:
+    if isinstance(data, str):
+        return data
+    try:
+        return data.decode(encoding or "utf-8", errors="replace")
+    except LookupError:  # Unknown charset in the response headers
+        return data.decode("utf-8", errors="replace")
+
+
+def _run_decoded(fn: Callable[..., str], data: Union[bytes, str], encoding: Optional[str], args: tuple) -> str:
+    """Task body on either executor: decoding is CPU work too, so it happens on the worker"""
+    return fn(_decode(data, encoding), *args)
+
+
+def _warm_up():
+    """Process initializer: pay the app imports and the parser's first-use setup once per worker"""
+    from ..utils.extraction import extract_content
+    extract_content(WARM_UP_HTML)
+
+
+def _ping() -> bool:
+    return True
+
+
+class ExtractionPool:
+    """
+    Executor for CPU-bound HTML-to-text extraction.
+
+    Small documents run on a thread pool. Documents of at least
+    ``process_min_bytes`` run on worker processes (backend "auto"), where
+    concurrent pages parse in parallel instead of taking turns on the GIL;
+    below that size pickling the page costs more than the parse. HTML goes
+    to the workers as the raw response bytes and is decoded there. Workers
+    are spawned by ``start()`` at app start-up and import the extraction
+    code in their initializer, so a task never pays for imports. A broken
+    process pool is replaced on the next call, and the failed task is
+    retried on a thread.
+    """
+
+    def __init__(self, backend: str = EXTRACTION_BACKEND, processes: int = EXTRACTION_PROCESSES,
+                 threads: int = EXTRACTION_THREADS, process_min_bytes: int = EXTRACTION_PROCESS_MIN_BYTES):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown extraction backend {backend!r}, expected one of {', '.join(BACKENDS)}")
+        self.backend = backend if processes > 0 else "thread"
+        self.processes = processes
+        self.threads = threads
+        self.process_min_bytes = process_min_bytes
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Spawn and warm up the worker processes now instead of on the first large page"""
+        # Workers import the app too; only the serving process may start a pool
+        if self.backend == "thread" or multiprocessing.parent_process() is not None:
+            return
+        pool = self._processes()
+        for _ in range(self.processes):
+            pool.submit(_ping)
+
+    def uses_processes(self, size: int) -> bool:
+        return self.backend == "process" or (self.backend == "auto" and size >= self.process_min_bytes)
+
+    def submit(self, fn: Callable[..., str], html: Union[bytes, str], encoding: Optional[str] = None,
+               *args) -> Future:
+        """Run ``fn(decoded_html, *args)``; ``fn`` must be a module-level function so workers can unpickle it"""
+        executor = self._processes() if self.uses_processes(len(html)) else self._threads()
+        return executor.submit(_run_decoded, fn, html, encoding, args)
+
+    async def run(self, fn: Callable[..., str], html: Union[bytes, str], encoding: Optional[str] = None,
+                  *args) -> str:
+        try:
+            return await asyncio.wrap_future(self.submit(fn, html, encoding, *args))
+        except BrokenProcessPool as e:
+            logger.error(f"Extraction process pool broke, retrying on a thread: {e}")
+            self._discard_processes()
+            return await asyncio.wrap_future(self._threads().submit(_run_decoded, fn, html, encoding, args))
+
+    def run_sync(self, fn: Callable[..., str], html: Union[bytes, str], encoding: Optional[str] = None,
+                 *args) -> str:
+        """Blocking variant for synchronous scrapers"""
+        try:
+            return self.submit(fn, html, encoding, *args).result()
+        except BrokenProcessPool as e:
+            logger.error(f"Extraction process pool broke, retrying on a thread: {e}")
+            self._discard_processes()
+            return _run_decoded(fn, html, encoding, args)
+
+    def _threads(self) -> Executor:
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="extract")
+            return self._thread_pool
+
+    def _processes(self) -> Executor:
+        with self._lock:
+            if self._process_pool is None:
+                # spawn, not fork: the parent runs event loop and DB threads whose locks a fork would copy
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_up
+                )
+            return self._process_pool
+
+    def _discard_processes(self):
+        with self._lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def close(self):
+        """Shut both pools down; the next call starts fresh ones"""
+        with self._lock:
+            pools = [self._thread_pool, self._process_pool]
+            self._thread_pool = self._process_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+
+extraction_pool = ExtractionPool()
+runtime.on_shutdown(extraction_pool.close)
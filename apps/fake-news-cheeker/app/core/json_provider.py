@@ -0,0 +1,56 @@
+import json
+from typing import Any
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib provider is used without it
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask/Quart JSON provider on orjson. Datetimes, dates and UUIDs are
+    encoded natively (datetimes as ISO 8601; naive ones, as SQLite returns
+    them, are UTC and say so), numpy scalars/arrays too;
+    anything else falls back to Flask's ``default``. Keys keep insertion
+    order unless ``sort_keys`` is set.
+    """
+
+    sort_keys = False
+    base_option = (orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+    def _option(self, indent: bool = False) -> int:
+        option = self.base_option
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._option(bool(kwargs.get("indent")))).decode()
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        # Bytes straight into the response: no str round trip
+        body = orjson.dumps(obj, default=self.default, option=self._option(indent) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_json(app):
+    """Use the orjson provider on a Flask or Quart app when orjson is installed"""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    return app
+
+
+def dumps(obj: Any) -> str:
+    """JSON text outside a response (e.g. SSE payloads), with the same encoder as the app"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=OrjsonProvider.base_option).decode()
+    return json.dumps(obj, default=str, ensure_ascii=False)
@@ -0,0 +1,122 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from flask import Blueprint, Response, g, request
+from ..config.settings import RESPONSE_CACHE_SIZE
+
+
+class WriteGeneration:
+    """Process-wide counter bumped after every committed write; cached responses from older generations are stale"""
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self):
+        with self._lock:
+            self._value += 1
+
+
+write_generation = WriteGeneration()
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl: int  # Seconds an entry is served without re-running the view
+    max_age: int = 0  # Client Cache-Control max-age; 0 means revalidate with the ETag every time
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    mimetype: str
+    etag: str
+    generation: int
+    stored_at: float
+
+
+class ResponseCache:
+    """
+    In-memory LRU of rendered GET responses for a blueprint, keyed by path
+    and query args.
+
+    Entries are dropped as soon as a write bumps ``write_generation`` in this
+    process; ``ttl`` bounds how stale an entry can get when the write
+    happened in another worker. Every cached response carries a strong ETag
+    (hash of the body), so clients revalidating with If-None-Match get a
+    304 without a body.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.policies: Dict[str, CachePolicy] = {}
+        self._entries: "OrderedDict[Tuple, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0}
+
+    def register(self, blueprint: Blueprint, policies: Dict[str, CachePolicy]):
+        """Cache the blueprint's view functions named in ``policies``"""
+        self.policies.update({f"{blueprint.name}.{view}": policy for view, policy in policies.items()})
+        blueprint.before_request(self._lookup)
+        blueprint.after_request(self._store)
+
+    def _lookup(self) -> Optional[Response]:
+        policy = self.policies.get(request.endpoint)
+        if policy is None or request.method != "GET":
+            return None
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        generation = write_generation.value
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.generation == generation and time.monotonic() - entry.stored_at < policy.ttl:
+                    self._entries.move_to_end(key)
+                else:
+                    del self._entries[key]
+                    entry = None
+        if entry is not None:
+            self.stats["hits"] += 1
+            response = Response(entry.body, mimetype=entry.mimetype)
+            return self._finish(response, entry.etag, policy)
+        self.stats["misses"] += 1
+        # Captured before the view runs: a write during the query makes the entry stale at once
+        g.response_cache = (key, generation, policy)
+        return None
+
+    def _store(self, response: Response) -> Response:
+        pending = g.pop("response_cache", None)
+        if pending is None or response.status_code != 200 or response.is_streamed:
+            return response
+        key, generation, policy = pending
+        body = response.get_data()
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        with self._lock:
+            self._entries[key] = CachedResponse(body, response.mimetype, etag, generation, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return self._finish(response, etag, policy)
+
+    def _finish(self, response: Response, etag: str, policy: CachePolicy) -> Response:
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = (
+            f"public, max-age={policy.max_age}" if policy.max_age else "no-cache"
+        )
+        response.make_conditional(request)
+        if response.status_code == 304:
+            self.stats["not_modified"] += 1
+        return response
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
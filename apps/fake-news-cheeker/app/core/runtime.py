@@ -0,0 +1,93 @@
+import asyncio
+import atexit
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Awaitable, Callable, List, Optional, TypeVar
+from ..utils.logger import logger
+
+T = TypeVar("T")
+
+
+class AsyncRuntime:
+    """
+    One long-lived event loop on a background thread, shared by every sync
+    request handler in the process.
+
+    Pooled async clients (httpx, the LLM client) bind their connections to the
+    loop they first run on. Running all coroutines here instead of in a fresh
+    ``asyncio.run`` loop per request lets keep-alive and HTTP/2 connections be
+    reused across requests.
+    """
+
+    def __init__(self, name: str = "async-runtime"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        self.start()
+        return self._loop
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+            logger.info(f"[{self.name}] Event loop started")
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the shared loop and block the calling thread for its result"""
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("AsyncRuntime.run() called from the runtime loop; await the coroutine instead")
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except (FutureTimeoutError, KeyboardInterrupt):
+            future.cancel()
+            raise
+
+    def on_shutdown(self, hook: Callable[[], Awaitable[None]]):
+        """Register an async cleanup callback, run on the loop at shutdown"""
+        self._shutdown_hooks.append(hook)
+
+    def shutdown(self, timeout: float = 10.0):
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+
+        async def close_all():
+            for hook in reversed(self._shutdown_hooks):
+                try:
+                    await hook()
+                except Exception as e:
+                    logger.warning(f"[{self.name}] Shutdown hook failed: {e}")
+
+        try:
+            asyncio.run_coroutine_threadsafe(close_all(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"[{self.name}] Graceful shutdown incomplete: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        loop.close()
+        logger.info(f"[{self.name}] Event loop stopped")
+
+
+runtime = AsyncRuntime()
+atexit.register(runtime.shutdown)
@@ -1,7 +1,9 @@
 from .claim_model import Claim
 from .analysis import Analysis
 from .source import Source
+from .stat_counter import StatCounter
+from .stat_bucket import StatBucket
 
 
 
-__all__ = ['Claim', 'Analysis', 'Source']
+__all__ = ['Claim', 'Analysis', 'Source', 'StatCounter', 'StatBucket']
@@ -13,6 +13,7 @@ class Claim(Base):
     explanation = Column(Text, nullable=False)
     conclusion = Column(Text, nullable=False)
     category = Column(String(50), nullable=False)
+    fingerprint = Column(String(64), index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
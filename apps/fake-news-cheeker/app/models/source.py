@@ -16,6 +16,9 @@ class Source(Base):
     source_name = Column(String(100), nullable=False)
     credibility_score = Column(Float, default=1.0)
     last_scraped_at = Column(DateTime(timezone=True))
+    # HTTP validators from the last fetch, for conditional revalidation
+    etag = Column(Text)
+    last_modified = Column(String(64))
 
     def to_dict(self):
         return {
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, String, BigInteger, DateTime
+from ..database import Base
+
+class StatBucket(Base):
+    """Rows per hour for one slice, e.g. ``analyses:support:Supported`` at 2026-01-01 13:00 UTC"""
+    __tablename__ = 'stat_buckets'
+
+    metric = Column(String(255), primary_key=True)
+    bucket = Column(DateTime(timezone=True), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, BigInteger
+from ..database import Base
+
+class StatCounter(Base):
+    """Running row tally for one slice of a table, e.g. ``claims:verdict:True``"""
+    __tablename__ = 'stat_counters'
+
+    name = Column(String(255), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
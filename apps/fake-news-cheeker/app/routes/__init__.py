@@ -1,9 +1,5 @@
-from .claim_routes import claim_bp
-from .search_routes import search_bp
-from .analyze_routes import analyze_bp
+from .public_routes import public_bp
 
 __all__ = [
-    "claim_bp",
-    "search_bp",
-    "analyze_bp"
+    "public_bp"
 ]
@@ -1,9 +1,28 @@
-from flask import Blueprint, jsonify, request
-from app.services.public_service import PublicService
+from flask import Blueprint, Response, current_app, jsonify, request
+from app.services.public_service import PublicService, InvalidCursorError
+from app.utils.export import EXPORT_FORMATS, export_chunks, gzip_chunks
+from app.core.response_cache import CachePolicy, response_cache
+from app.utils.shaping import requested_fields, shape
 import time
 
 public_bp = Blueprint("public_bp", __name__)
 
+MAX_SERIES_HOURS = 90 * 24
+
+# Server TTL / client max-age per view. Listings revalidate on every open
+# (cheap 304s); the newest-first views stay short so new verifications show up
+response_cache.register(public_bp, {
+    "get_all_claims": CachePolicy(ttl=60),
+    "high_confidence_claims": CachePolicy(ttl=120, max_age=30),
+    "get_claims_by_category": CachePolicy(ttl=120, max_age=30),
+    "get_all_sources": CachePolicy(ttl=60),
+    "get_sources_by_domain": CachePolicy(ttl=120, max_age=30),
+    "get_all_analyses": CachePolicy(ttl=60),
+    "get_supported_analyses": CachePolicy(ttl=120, max_age=30),
+    "get_latest_analyses": CachePolicy(ttl=15),
+    "get_system_stats": CachePolicy(ttl=30, max_age=15),
+})
+
 def get_pagination_params():
     try:
         page = int(request.args.get("page", 1))
@@ -12,6 +31,18 @@ def get_pagination_params():
     except ValueError:
         return 1, 10
 
+def listing(data):
+    """JSON response for a listing, with bulky fields trimmed unless ?include= names them"""
+    return jsonify(shape(data, requested_fields(request.args.get("include"))))
+
+def get_cursor():
+    """Opaque keyset cursor; present (even empty) switches a listing to cursor mode"""
+    return request.args.get("cursor")
+
+@public_bp.errorhandler(InvalidCursorError)
+def invalid_cursor(e):
+    return jsonify({"error": str(e)}), 400
+
 @public_bp.route("/public/claims", methods=["GET"])
 def get_all_claims():
     page, limit = get_pagination_params()
@@ -19,17 +50,17 @@ def get_all_claims():
     category = request.args.get("category", "all")
     verdict = request.args.get("verdict", "all")
     
-    return jsonify(PublicService.get_all_claims(page, limit, search, category, verdict))
+    return listing(PublicService.get_all_claims(page, limit, search, category, verdict, get_cursor()))
 
 @public_bp.route("/public/claims/high-confidence", methods=["GET"])
 def high_confidence_claims():
     page, limit = get_pagination_params()
-    return jsonify(PublicService.get_high_confidence_claims(page, limit))
+    return listing(PublicService.get_high_confidence_claims(page, limit, get_cursor()))
 
 @public_bp.route("/public/claims/by-category/<string:category>", methods=["GET"])
 def get_claims_by_category(category):
     page, limit = get_pagination_params()
-    return jsonify(PublicService.get_claims_by_category(category, page, limit))
+    return listing(PublicService.get_claims_by_category(category, page, limit, get_cursor()))
 
 @public_bp.route("/public/sources", methods=["GET"])
 def get_all_sources():
@@ -37,12 +68,12 @@ def get_all_sources():
     search = request.args.get("search", "").strip() or None
     domain = request.args.get("domain", "all")
     
-    return jsonify(PublicService.get_all_sources(page, limit, search, domain))
+    return listing(PublicService.get_all_sources(page, limit, search, domain, get_cursor()))
 
 @public_bp.route("/public/sources/by-domain/<string:domain>", methods=["GET"])
 def get_sources_by_domain(domain):
     page, limit = get_pagination_params()
-    return jsonify(PublicService.get_sources_by_domain(domain, page, limit))
+    return listing(PublicService.get_sources_by_domain(domain, page, limit, get_cursor()))
 
 @public_bp.route("/public/analyses", methods=["GET"])
 def get_all_analyses():
@@ -50,69 +81,102 @@ def get_all_analyses():
     search = request.args.get("search", "").strip() or None
     support = request.args.get("support", "all")
     
-    return jsonify(PublicService.get_all_analyses(page, limit, search, support))
+    return listing(PublicService.get_all_analyses(page, limit, search, support, get_cursor()))
 
 @public_bp.route("/public/analyses/supported", methods=["GET"])
 def get_supported_analyses():
     page, limit = get_pagination_params()
-    return jsonify(PublicService.get_supported_analyses(page, limit))
+    return listing(PublicService.get_supported_analyses(page, limit, get_cursor()))
 
 @public_bp.route("/public/analyses/latest", methods=["GET"])
 def get_latest_analyses():
     page, limit = get_pagination_params()
-    return jsonify(PublicService.get_latest_analyses(page, limit))
+    return listing(PublicService.get_latest_analyses(page, limit, get_cursor()))
 
 @public_bp.route("/public/stats", methods=["GET"])
 def get_system_stats():
-    """Get comprehensive system statistics for admin dashboard"""
-    return jsonify(PublicService.get_system_stats())
+    """
+    Get comprehensive system statistics for admin dashboard.
+    ``series=hour|day`` adds time-series counts over the last ``hours``
+    (default 24, or 30 days by day), optionally limited to ``metrics``
+    prefixes such as ``claims:verdict,analyses:support``.
+    """
+    stats = PublicService.get_system_stats()
+    granularity = request.args.get("series")
+    if granularity in ("hour", "day"):
+        default_hours = 24 if granularity == "hour" else 30 * 24
+        try:
+            hours = min(max(int(request.args.get("hours", default_hours)), 1), MAX_SERIES_HOURS)
+        except ValueError:
+            hours = default_hours
+        metrics = request.args.get("metrics", "").split(",")
+        stats["series"] = PublicService.get_stats_series(granularity, hours, metrics)
+    return jsonify(stats)
+
+# Export endpoints: streamed as JSON (default), CSV or NDJSON
+def get_export_format():
+    fmt = request.args.get("format", "json").lower()
+    return fmt if fmt in EXPORT_FORMATS else None
+
+def export_response(name, fmt, rows, filters):
+    """Stream an export; ``gzip=true`` compresses it for clients that accept gzip"""
+    chunks = export_chunks(rows, fmt, current_app.json.dumps, filters)
+    headers = {"Vary": "Accept-Encoding"}
+    if fmt != "json":
+        headers["Content-Disposition"] = f'attachment; filename="{name}.{fmt}"'
+    if request.args.get("gzip", "").lower() in ("1", "true", "yes") and request.accept_encodings["gzip"]:
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return Response(chunks, mimetype=EXPORT_FORMATS[fmt], headers=headers)
+
+def invalid_export_format():
+    return jsonify({"error": f"format must be one of: {', '.join(EXPORT_FORMATS)}"}), 400
 
-# Export endpoints for CSV
 @public_bp.route("/public/export/claims", methods=["GET"])
 def export_claims_csv():
-    """Export claims data as CSV with filters"""
+    """Export claims data with filters"""
+    fmt = get_export_format()
+    if fmt is None:
+        return invalid_export_format()
     search = request.args.get("search", "").strip() or None
     category = request.args.get("category", "all")
     verdict = request.args.get("verdict", "all")
     
-    data = PublicService.export_claims_csv(search, category, verdict)
-    return jsonify({
-        "data": data,
-        "filters": {
-            "search": search,
-            "category": category,
-            "verdict": verdict
-        }
+    rows = PublicService.export_claims_csv(search, category, verdict)
+    return export_response("claims", fmt, rows, {
+        "search": search,
+        "category": category,
+        "verdict": verdict
     })
 
 @public_bp.route("/public/export/sources", methods=["GET"])
 def export_sources_csv():
-    """Export sources data as CSV with filters"""
+    """Export sources data with filters"""
+    fmt = get_export_format()
+    if fmt is None:
+        return invalid_export_format()
     search = request.args.get("search", "").strip() or None
     domain = request.args.get("domain", "all")
     
-    data = PublicService.export_sources_csv(search, domain)
-    return jsonify({
-        "data": data,
-        "filters": {
-            "search": search,
-            "domain": domain
-        }
+    rows = PublicService.export_sources_csv(search, domain)
+    return export_response("sources", fmt, rows, {
+        "search": search,
+        "domain": domain
     })
 
 @public_bp.route("/public/export/analyses", methods=["GET"])
 def export_analyses_csv():
-    """Export analyses data as CSV with filters"""
+    """Export analyses data with filters"""
+    fmt = get_export_format()
+    if fmt is None:
+        return invalid_export_format()
     search = request.args.get("search", "").strip() or None
     support = request.args.get("support", "all")
     
-    data = PublicService.export_analyses_csv(search, support)
-    return jsonify({
-        "data": data,
-        "filters": {
-            "search": search,
-            "support": support
-        }
+    rows = PublicService.export_analyses_csv(search, support)
+    return export_response("analyses", fmt, rows, {
+        "search": search,
+        "support": support
     })
 
 @public_bp.route("/health", methods=["GET"])
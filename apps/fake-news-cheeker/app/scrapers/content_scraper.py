@@ -1,7 +1,5 @@
-import os
 import json
 import logging
-import requests
 import re
 from urllib.parse import urljoin
 from dataclasses import dataclass
@@ -11,13 +9,13 @@ from bs4 import BeautifulSoup
 from readability import Document as ReadabilityDocument
 from typing import List, Optional
 from langdetect import detect, LangDetectException
+from ..services.search_provider import get_search_provider
+from ..core.extraction_pool import extraction_pool
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger("news_scraper")
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-GOOGLE_CX = os.getenv("GOOGLE_CX")
 PLAYWRIGHT_TIMEOUT = 15000  # 30 seconds
 
 
@@ -163,44 +161,47 @@ class NewsScraper:
             # Ensure html is str and UTF-8 decoded
             if isinstance(html, bytes):
                 html = html.decode('utf-8', errors='replace')
-            doc = ReadabilityDocument(html)
-            content_html = doc.summary()
-
-            soup = BeautifulSoup(content_html, 'html.parser')
-
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'header', 'footer', 'nav',
-                                 'aside', 'form', 'button', 'iframe', 'noscript']):
-                element.decompose()
-
-            # Remove non-content classes
-            non_content_classes = [
-                'ad', 'ads', 'advertisement', 'banner', 'sidebar',
-                'related', 'comments', 'share', 'social', 'newsletter'
-            ]
-            for cls in non_content_classes:
-                for div in soup.find_all('div', class_=cls):
-                    div.decompose()
-
-            text = soup.get_text(separator='\n')
-            text = re.sub(r'\n\s*\n', '\n\n', text)
-            text = re.sub(r'[ \t]+', ' ', text).strip()
-
-            # Log if Arabic text is detected
-            import re as _re
-            if _re.search(r'[\u0600-\u06FF]', text):
-                logger.info(f"[ARABIC] Extracted content: {text[:500]}")
-
-            return text
+            return extraction_pool.run_sync(article_text, html)
         except Exception as e:
             logger.error(f"Error extracting article content: {e}")
             return ""
 
 
-def google_search_by_query(query: str, max_results: int = 5) -> List[str]:
-    if not (GOOGLE_API_KEY and GOOGLE_CX):
-        raise RuntimeError("Set GOOGLE_API_KEY and GOOGLE_CX in .env")
+def article_text(html: str) -> str:
+    """Readability summary of a page as plain text; module-level so it can run in an extraction worker"""
+    doc = ReadabilityDocument(html)
+    content_html = doc.summary()
+
+    soup = BeautifulSoup(content_html, 'html.parser')
+
+    # Remove unwanted elements
+    for element in soup(['script', 'style', 'header', 'footer', 'nav',
+                         'aside', 'form', 'button', 'iframe', 'noscript']):
+        element.decompose()
+
+    # Remove non-content classes
+    non_content_classes = [
+        'ad', 'ads', 'advertisement', 'banner', 'sidebar',
+        'related', 'comments', 'share', 'social', 'newsletter'
+    ]
+    for cls in non_content_classes:
+        for div in soup.find_all('div', class_=cls):
+            div.decompose()
+
+    text = soup.get_text(separator='\n')
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = re.sub(r'[ \t]+', ' ', text).strip()
+
+    # Log if Arabic text is detected
+    import re as _re
+    if _re.search(r'[\u0600-\u06FF]', text):
+        logger.info(f"[ARABIC] Extracted content: {text[:500]}")
 
+    return text
+
+
+def google_search_by_query(query: str, max_results: int = 5) -> List[str]:
+    """Result URLs for ``query`` from the configured search provider (see SEARCH_PROVIDER)"""
     try:
         try:
             lang = detect(query)
@@ -214,23 +215,8 @@ def google_search_by_query(query: str, max_results: int = 5) -> List[str]:
         else:
             logger.info(f"[SEARCH] No language restrict parameter used for lang: {lang}")
 
-        params = {
-            "key": GOOGLE_API_KEY,
-            "cx": GOOGLE_CX,
-            "q": query,
-            "num": max_results,
-        }
-        if lr_param:
-            params["lr"] = lr_param
-
-        resp = requests.get(
-            "https://www.googleapis.com/customsearch/v1",
-            params=params,
-            timeout=15
-        )
-        resp.raise_for_status()
-        items = resp.json().get("items", [])
-        return [item["link"] for item in items if "link" in item]
+        results = get_search_provider().search(query, max_results, lr_param)
+        return [r["url"] for r in results if r.get("url")]
     except Exception as e:
-        logger.error(f"Google search API error: {e}")
+        logger.error(f"Search provider error: {e}")
         return []
@@ -4,10 +4,47 @@ from readability import Document as ReadabilityDocument
 from typing import List, Optional
 import re
 import logging
+from ..core.extraction_pool import extraction_pool
 
 logger = logging.getLogger(__name__)
 
 
+def readability_text(html: str, max_length: int) -> str:
+    """Readability summary of a page as plain text; module-level so it can run in an extraction worker"""
+    doc = ReadabilityDocument(html)
+    content_html = doc.summary()
+
+    soup = BeautifulSoup(content_html, 'html.parser')
+
+    # Remove unwanted elements
+    for element in soup(['script', 'style', 'header', 'footer', 'nav',
+                         'aside', 'form', 'button', 'iframe', 'noscript']):
+        element.decompose()
+
+    # Remove non-content classes
+    non_content_classes = [
+        'ad', 'ads', 'advertisement', 'banner', 'sidebar',
+        'related', 'comments', 'share', 'social', 'newsletter',
+        'menu', 'footer', 'header', 'nav', 'cookie'
+    ]
+    for div in soup.find_all('div', class_=non_content_classes):
+        div.decompose()
+
+    # Extract text
+    text = soup.get_text()
+
+    # Clean and truncate
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = re.sub(r'[ \t]+', ' ', text).strip()
+
+    # Remove common boilerplate
+    text = re.sub(r'©\s*\S+', '', text)
+    text = re.sub(r'All rights reserved\.?', '', text)
+    text = re.sub(r'Sign up for .+ newsletters?', '', text)
+
+    return text[:max_length]
+
+
 class GenericScraper(BaseScraper):
     MAX_CONTENT_LENGTH = 10000
 
@@ -72,38 +109,7 @@ class GenericScraper(BaseScraper):
     async def extract_article_content(self) -> str:
         try:
             html = await self.page.content()
-            doc = ReadabilityDocument(html)
-            content_html = doc.summary()
-
-            soup = BeautifulSoup(content_html, 'html.parser')
-
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'header', 'footer', 'nav',
-                                 'aside', 'form', 'button', 'iframe', 'noscript']):
-                element.decompose()
-
-            # Remove non-content classes
-            non_content_classes = [
-                'ad', 'ads', 'advertisement', 'banner', 'sidebar',
-                'related', 'comments', 'share', 'social', 'newsletter',
-                'menu', 'footer', 'header', 'nav', 'cookie'
-            ]
-            for div in soup.find_all('div', class_=non_content_classes):
-                div.decompose()
-
-            # Extract text
-            text = soup.get_text()
-
-            # Clean and truncate
-            text = re.sub(r'\n\s*\n', '\n\n', text)
-            text = re.sub(r'[ \t]+', ' ', text).strip()
-
-            # Remove common boilerplate
-            text = re.sub(r'©\s*\S+', '', text)
-            text = re.sub(r'All rights reserved\.?', '', text)
-            text = re.sub(r'Sign up for .+ newsletters?', '', text)
-
-            return text[:self.MAX_CONTENT_LENGTH]
+            return await extraction_pool.run(readability_text, html, None, self.MAX_CONTENT_LENGTH)
         except Exception as e:
             logger.error(f"Content extraction failed: {str(e)}")
             return ""
@@ -1,5 +1,10 @@
 from .claim_service import ClaimService
-from .scrape_service import ScrapeService
-from .google_search_service import GoogleSearchService
+from .scrape_service import ScrapeService, get_scrape_service
+from .google_search_service import GoogleSearchService, google_search
+from .search_cache import SearchCache, SqliteSearchStore, search_cache
+from .search_provider import SearchProvider, get_search_provider
+from .local_search import LocalSearchProvider, local_search
 
-__all__ = ['ClaimService', 'ScrapeService', 'GoogleSearchService']
+__all__ = ['ClaimService', 'ScrapeService', 'get_scrape_service', 'GoogleSearchService', 'google_search',
+           'SearchCache', 'SqliteSearchStore', 'search_cache',
+           'SearchProvider', 'get_search_provider', 'LocalSearchProvider', 'local_search']
@@ -0,0 +1,185 @@
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import func, or_, select, text
+from ..config.settings import STATS_REFRESH_INTERVAL, STATS_REFRESH_LOOKBACK_HOURS
+from ..database import get_db
+from ..models.claim_model import Claim
+from ..models.source import Source
+from ..models.analysis import Analysis
+from ..models.stat_bucket import StatBucket
+from .counters import claim_counter_keys, analyses_key
+from ..utils.logger import logger
+
+# Marker row: its bucket is the time of the last completed refresh
+REFRESHED = "_refreshed"
+
+# Arbitrary key shared by every worker: one refresh at a time
+REFRESH_LOCK_ID = 7_241_906
+
+
+def analyses_domain_key(domain: str) -> str:
+    return f"analyses:domain:{domain}"
+
+
+def hour_floor(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def _as_utc(value) -> datetime:
+    if isinstance(value, str):  # SQLite returns strftime buckets as text
+        value = datetime.fromisoformat(value)
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+class HourlyAggregates:
+    """
+    Row counts per hour for each claim verdict/category, analysis support
+    and analysis source domain, kept in the stat_buckets table.
+
+    A background job recomputes only the hours since the last refresh (plus
+    ``lookback_hours`` for rows written late by the write-behind queue), so
+    the dashboard reads a handful of aggregate rows instead of scanning
+    claims and analyses. Readers get None until the first refresh has run.
+    """
+
+    def __init__(self, interval: float = STATS_REFRESH_INTERVAL,
+                 lookback_hours: int = STATS_REFRESH_LOOKBACK_HOURS):
+        self.interval = interval
+        self.lookback_hours = lookback_hours
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _hour(self, db, column):
+        if db.get_bind().dialect.name == "postgresql":
+            return func.date_trunc("hour", func.timezone("UTC", column))
+        return func.strftime("%Y-%m-%d %H:00:00", column)
+
+    def refresh(self, full: bool = False) -> bool:
+        """Recompute the recent buckets (all of them if ``full``); False if another worker is refreshing"""
+        with get_db() as db:
+            if db.get_bind().dialect.name == "postgresql":
+                if not db.execute(text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": REFRESH_LOCK_ID}).scalar():
+                    return False
+
+            start = None
+            if not full:
+                latest = db.execute(
+                    select(func.max(StatBucket.bucket)).where(StatBucket.metric != REFRESHED)
+                ).scalar()
+                if latest is not None:
+                    start = _as_utc(latest) - timedelta(hours=self.lookback_hours)
+
+            totals = Counter()
+            hour = self._hour(db, Claim.created_at)
+            claims = (
+                select(hour, Claim.verdict, Claim.category, Claim.confidence > 0.8, func.count())
+                .group_by(hour, Claim.verdict, Claim.category, Claim.confidence > 0.8)
+            )
+            if start is not None:
+                claims = claims.where(Claim.created_at >= start)
+            for bucket, verdict, category, high_confidence, count in db.execute(claims):
+                if bucket is None:
+                    continue
+                for key in claim_counter_keys(verdict, category, 1.0 if high_confidence else 0.0):
+                    totals[key, _as_utc(bucket)] += count
+
+            hour = self._hour(db, Analysis.created_at)
+            analyses = (
+                select(hour, Analysis.support, Source.domain, func.count())
+                .join(Source, Analysis.source_id == Source.id)
+                .group_by(hour, Analysis.support, Source.domain)
+            )
+            if start is not None:
+                analyses = analyses.where(Analysis.created_at >= start)
+            for bucket, support, domain, count in db.execute(analyses):
+                if bucket is None:
+                    continue
+                for key in (analyses_key(), analyses_key(support), analyses_domain_key(domain)):
+                    totals[key, _as_utc(bucket)] += count
+
+            buckets = StatBucket.__table__
+            delete = buckets.delete()
+            if start is not None:
+                delete = delete.where(buckets.c.bucket >= start)
+            db.execute(delete)
+            db.execute(buckets.delete().where(buckets.c.metric == REFRESHED))
+            rows = [{"metric": metric, "bucket": bucket, "value": value}
+                    for (metric, bucket), value in totals.items()]
+            rows.append({"metric": REFRESHED, "bucket": datetime.now(timezone.utc), "value": 0})
+            db.execute(buckets.insert(), rows)
+            db.commit()
+        logger.info(f"Hourly aggregates refreshed: {len(rows) - 1} buckets since {start or 'the beginning'}")
+        return True
+
+    def refreshed_at(self) -> Optional[datetime]:
+        with get_db() as db:
+            value = db.execute(select(StatBucket.bucket).where(StatBucket.metric == REFRESHED)).scalar()
+        return _as_utc(value) if value is not None else None
+
+    def window_total(self, metric: str, hours: int = 24) -> Optional[int]:
+        """Rows in the last ``hours`` (whole hours, current one included), or None before the first refresh"""
+        since = hour_floor(datetime.now(timezone.utc)) - timedelta(hours=hours - 1)
+        with get_db() as db:
+            rows = dict(db.execute(
+                select(StatBucket.metric, func.sum(StatBucket.value))
+                .where(StatBucket.metric.in_([metric, REFRESHED]))
+                .where((StatBucket.bucket >= since) | (StatBucket.metric == REFRESHED))
+                .group_by(StatBucket.metric)
+            ).all())
+        if REFRESHED not in rows:
+            return None
+        return int(rows.get(metric) or 0)
+
+    def series(self, hours: int, granularity: str = "hour",
+               prefixes: Optional[Iterable[str]] = None) -> Optional[Dict[str, List]]:
+        """``{metric: [[bucket_iso, value], ...]}`` over the last ``hours``, by hour or by day"""
+        if self.refreshed_at() is None:
+            return None
+        since = hour_floor(datetime.now(timezone.utc)) - timedelta(hours=hours - 1)
+        query = (
+            select(StatBucket.metric, StatBucket.bucket, StatBucket.value)
+            .where(StatBucket.bucket >= since, StatBucket.metric != REFRESHED)
+            .order_by(StatBucket.bucket)
+        )
+        prefixes = [p for p in (prefixes or []) if p]
+        if prefixes:
+            query = query.where(or_(*(StatBucket.metric.startswith(p) for p in prefixes)))
+        with get_db() as db:
+            rows = db.execute(query).all()
+
+        series = defaultdict(Counter)
+        for metric, bucket, value in rows:
+            bucket = _as_utc(bucket)
+            if granularity == "day":
+                bucket = bucket.replace(hour=0)
+            series[metric][bucket] += value
+        return {
+            metric: [[bucket.isoformat(), value] for bucket, value in counts.items()]
+            for metric, counts in sorted(series.items())
+        }
+
+    def start_refresher(self):
+        """Refresh now and then every ``interval`` seconds on a daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        def run():
+            while True:
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logger.error(f"Hourly aggregate refresh failed: {e}")
+                if self._stop.wait(self.interval):
+                    return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=run, name="stat-buckets-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+hourly_aggregates = HourlyAggregates()
@@ -1,8 +1,11 @@
+import asyncio
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from ..ai.deepseek_client import DeepSeekClient, NoJSONInResponseError
+from ..ai.resilience import CircuitOpenError, RetryExhaustedError
+from ..config.settings import ANALYZE_BATCH_SIZE
+from ..core.runtime import runtime
 from ..utils.logger import logger
 
 class AnalyzeService:
@@ -37,10 +40,57 @@ Your response MUST be ONLY the following JSON structure, with no extra text, mar
 }}
 """
 
-    def __init__(self):
+    BATCH_SYSTEM_PROMPT = f"""
+Today's date is {CURRENT_DATE}.
+
+You are an expert fact-checking analyst. Your task is to evaluate the following claim against each of the numbered articles below, judging every article independently. Consider the context and category of each article, and determine whether it supports, refutes, partially supports, or does not address the claim.
+
+Note: The claim and articles may be in any language, including Arabic. Respond in the same language as the claim if possible.
+
+Instructions:
+- Carefully read the claim and every article.
+- Assess if each article is relevant to the claim.
+- Judge the level of support each article provides for the claim:
+    - "True": The article clearly supports the claim.
+    - "False": The article clearly refutes the claim.
+    - "Partial": The article provides partial or ambiguous support/refutation.
+    - "Unknown": The article does not address the claim or is irrelevant.
+- Assign a confidence score (0-100) based on the strength and clarity of the evidence.
+- Briefly explain your reasoning in 1-2 sentences.
+- Mark the article as "authoritative" if it is from a well-known, official, or primary source (e.g., NASA, WHO, Reuters, government agencies, peer-reviewed journals).
+
+Your response MUST be ONLY a JSON array with exactly one object per article, in article order, with no extra text, markdown, or explanation:
+[
+  {{
+    "index": integer,                   // The article number from its "### ARTICLE n" header
+    "relevant": boolean,                // Is the article relevant to the claim?
+    "support": "True"|"False"|"Partial"|"Unknown", // Level of support
+    "confidence": integer,              // 0-100
+    "reason": "string",                 // Brief explanation (1-2 sentences), depending on the language of the claim, arabic, Turkish, French, English, etc
+    "authoritative": boolean            // Is the source authoritative?
+  }}
+]
+"""
+
+    # Completion budget per article in a batched call
+    BATCH_TOKENS_PER_ARTICLE = 200
+
+    AUTHORITATIVE_DOMAINS = ["nasa.gov", "who.int", "reuters.com", "apnews.com", "bbc.co.uk"]
+
+    SOURCE_CREDIBILITY = {
+        "reuters": 1.3, "ap": 1.3, "bbc": 1.3,
+        "nytimes": 1.2, "washingtonpost": 1.2, "nasa": 1.2,
+        "who": 1.2, "nature": 1.2, "science": 1.1,
+        "nationalgeographic": 1.1, "cnn": 1.1, "generic": 1.0
+    }
+
+    SUPPORT_SCORES = {"True": 1.0, "Partial": 0.5, "False": 0.0, "Unknown": 0.0}
+
+    def __init__(self, batch_size: int = ANALYZE_BATCH_SIZE):
         self.ai_client = DeepSeekClient()
+        self.batch_size = batch_size
 
-    def analyze_source(self, claim: str, article: Dict) -> Dict:
+    async def analyze_source_async(self, claim: str, article: Dict) -> Dict:
         import re
         # Log claim and article content if claim contains Arabic characters
         if re.search(r'[\u0600-\u06FF]', claim):
@@ -49,45 +99,81 @@ Your response MUST be ONLY the following JSON structure, with no extra text, mar
             logger.info(f"[ARABIC] Article Content: {article.get('content', '')[:500]}")
         prompt = self._build_analysis_prompt(claim, article)
         try:
-            raw_response = self.ai_client.ask(prompt, system_prompt=self.SYSTEM_PROMPT)
+            raw_response = await self.ai_client.ask_async(prompt, system_prompt=self.SYSTEM_PROMPT)
             parsed = self.ai_client._parse_response(raw_response, article)
-            if "authoritative" not in parsed or parsed["authoritative"] is None:
-                authoritative_domains = ["nasa.gov", "who.int", "reuters.com", "apnews.com", "bbc.co.uk"]
-                parsed["authoritative"] = any(domain in article.get("source", "").lower() for domain in authoritative_domains)
-            if "nasa.gov" in article.get("source", "").lower():
-                parsed["authoritative"] = True
-            logger.info(f"Analyzed {article.get('source')} → support={parsed['support']} conf={parsed['confidence']} auth={parsed.get('authoritative')}")
-            return parsed
+            return self._finalize_analysis(parsed, article)
+        except (CircuitOpenError, RetryExhaustedError):
+            return self._unknown_analysis(article, "LLM service temporarily unavailable")
         except NoJSONInResponseError:
             # Retry once
             retry_prompt = (
                 prompt + "\n\nYou MUST return only JSON. No markdown or extra explanation."
             )
             try:
-                raw_retry = self.ai_client.ask(retry_prompt, system_prompt=self.SYSTEM_PROMPT)
-                return self.ai_client._parse_response(raw_retry, article)
+                raw_retry = await self.ai_client.ask_async(retry_prompt, system_prompt=self.SYSTEM_PROMPT)
+                return self._finalize_analysis(self.ai_client._parse_response(raw_retry, article), article)
+            except (CircuitOpenError, RetryExhaustedError):
+                return self._unknown_analysis(article, "LLM service temporarily unavailable")
             except NoJSONInResponseError:
                 logger.error(f"Failed to parse LLM response for {article.get('url')}")
-                return {
-                    **article,
-                    "relevant": False,
-                    "support": "Unknown",
-                    "confidence": 0,
-                    "reason": "Failed to parse JSON",
-                    "authoritative": False
-                }
+                return self._unknown_analysis(article, "Failed to parse JSON")
+
+    async def analyze_batch_async(self, claim: str, articles: List[Dict]) -> List[Dict]:
+        """Analyze several articles in one LLM call, falling back per article on bad output"""
+        if len(articles) <= 1:
+            return [await self.analyze_source_async(claim, article) for article in articles]
+
+        prompt = self._build_batch_prompt(claim, articles)
+        try:
+            raw_response = await self.ai_client.ask_async(
+                prompt,
+                system_prompt=self.BATCH_SYSTEM_PROMPT,
+                max_tokens=self.BATCH_TOKENS_PER_ARTICLE * len(articles) + 64
+            )
+            parsed = self.ai_client._parse_batch_response(raw_response, articles)
+        except (CircuitOpenError, RetryExhaustedError) as e:
+            # Re-asking per article would only hit the unavailable upstream again
+            logger.warning(f"LLM unavailable ({e}), skipping analysis of {len(articles)} articles")
+            return [self._unknown_analysis(article, "LLM service temporarily unavailable") for article in articles]
+        except Exception as e:
+            logger.warning(f"Batch analysis of {len(articles)} articles failed, falling back per article: {e}")
+            parsed = [None] * len(articles)
+
+        results = [
+            self._finalize_analysis(result, article) if result is not None else None
+            for result, article in zip(parsed, articles)
+        ]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"Batch response missing {len(missing)}/{len(articles)} verdicts, re-asking individually")
+            retried = await asyncio.gather(*(self.analyze_source_async(claim, articles[i]) for i in missing))
+            for i, result in zip(missing, retried):
+                results[i] = result
+        return results
+
+    async def analyze_sources_async(self, claim: str, articles: List[Dict]) -> List[Dict]:
+        results = await asyncio.gather(*(self.analyze_batch_async(claim, batch) for batch in self.batches(articles)))
+        return [result for batch in results for result in batch]
+
+    def batches(self, articles: List[Dict]) -> List[List[Dict]]:
+        size = max(1, self.batch_size)
+        return [articles[i:i + size] for i in range(0, len(articles), size)]
+
+    def analyze_source(self, claim: str, article: Dict) -> Dict:
+        return runtime.run(self.analyze_source_async(claim, article))
+
+    def analyze_batch(self, claim: str, articles: List[Dict]) -> List[Dict]:
+        return runtime.run(self.analyze_batch_async(claim, articles))
 
-    def analyze_sources(self, claim: str, articles: List[Dict], max_workers: int = 5) -> List[Dict]:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(self.analyze_source, claim, article) for article in articles]
-            return [f.result() for f in futures]
+    def analyze_sources(self, claim: str, articles: List[Dict]) -> List[Dict]:
+        return runtime.run(self.analyze_sources_async(claim, articles))
 
     def compute_final_verdict(self, claim: str, raw_results: List[Dict]) -> Dict:
         relevant = self._filter_and_weight_sources(raw_results)
         print("Relevant sources for override:", relevant)
         for src in relevant:
             print(f"Source: {src.get('source')}, Support: {src.get('support')}, Confidence: {src.get('confidence')}, Authoritative: {src.get('authoritative')}")
-            if src["support"] == "True" and src["confidence"] >= 80 and src.get("authoritative"):
+            if self._triggers_override(src):
                 print("Authoritative override triggered!")
                 return {
                     "verdict": "True",
@@ -115,6 +201,38 @@ Your response MUST be ONLY the following JSON structure, with no extra text, mar
             "sources": raw_results
         }
 
+    def _triggers_override(self, src: Dict) -> bool:
+        return src["support"] == "True" and src["confidence"] >= 80 and bool(src.get("authoritative"))
+
+    def _unknown_analysis(self, article: Dict, reason: str) -> Dict:
+        return {
+            **article,
+            "relevant": False,
+            "support": "Unknown",
+            "confidence": 0,
+            "reason": reason,
+            "authoritative": False
+        }
+
+    def _finalize_analysis(self, parsed: Dict, article: Dict) -> Dict:
+        if "authoritative" not in parsed or parsed["authoritative"] is None:
+            parsed["authoritative"] = any(domain in article.get("source", "").lower() for domain in self.AUTHORITATIVE_DOMAINS)
+        if "nasa.gov" in article.get("source", "").lower():
+            parsed["authoritative"] = True
+        logger.info(f"Analyzed {article.get('source')} → support={parsed['support']} conf={parsed['confidence']} auth={parsed.get('authoritative')}")
+        return parsed
+
+    def _build_batch_prompt(self, claim: str, articles: List[Dict]) -> str:
+        parts = [f"### CLAIM:\n{claim}\n"]
+        for index, article in enumerate(articles, start=1):
+            parts.append(
+                f"### ARTICLE {index}:\nTitle: {article.get('title', 'Untitled')}\n"
+                f"Date: {article.get('date', 'Unknown')}\n"
+                f"Source: {article.get('source', 'Unknown')}\n"
+                f"### CONTENT {index}:\n{article.get('content', '')[:3000]}\n"
+            )
+        return "\n".join(parts)
+
     def _build_analysis_prompt(self, claim: str, article: Dict) -> str:
         return (
             f"### CLAIM:\n{claim}\n\n"
@@ -162,18 +280,20 @@ Your response MUST be ONLY the following JSON structure, with no extra text, mar
             return 0.5
 
     def _source_weight(self, source: str) -> float:
-        credibility = {
-            "reuters": 1.3, "ap": 1.3, "bbc": 1.3,
-            "nytimes": 1.2, "washingtonpost": 1.2, "nasa": 1.2,
-            "who": 1.2, "nature": 1.2, "science": 1.1,
-            "nationalgeographic": 1.1, "cnn": 1.1, "generic": 1.0
-        }
-        return credibility.get(source.lower(), 1.0)
+        return self.SOURCE_CREDIBILITY.get(source.lower(), 1.0)
+
+    def _verdict_label(self, weighted_support: float) -> str:
+        if weighted_support >= 0.75:
+            return "True"
+        elif weighted_support >= 0.4:
+            return "Partial"
+        elif weighted_support > 0.1:
+            return "Uncertain"
+        return "False"
 
     def _calculate_verdict(self, sources: List[Dict]) -> Tuple[str, float]:
         weights = [self._source_weight(s["source"]) * s["temporal_weight"] for s in sources]
-        support_map = {"True": 1.0, "Partial": 0.5, "False": 0.0, "Unknown": 0.0}
-        scores = [support_map.get(s["support"], 0.0) for s in sources]
+        scores = [self.SUPPORT_SCORES.get(s["support"], 0.0) for s in sources]
         confs = [s["confidence"] for s in sources]
 
         # PATCH: Handle empty or zero weights robustly
@@ -183,11 +303,12 @@ Your response MUST be ONLY the following JSON structure, with no extra text, mar
         weighted_support = np.average(scores, weights=weights)
         weighted_confidence = np.average(confs, weights=weights)
 
-        if weighted_support >= 0.75:
+        verdict = self._verdict_label(weighted_support)
+        if verdict == "True":
             return "True", float(weighted_confidence)
-        elif weighted_support >= 0.4:
+        elif verdict == "Partial":
             return "Partial", float(weighted_confidence * 0.8)
-        elif weighted_support > 0.1:
+        elif verdict == "Uncertain":
             return "Uncertain", float(weighted_confidence * 0.5 + 5)
         return "False", float(weighted_confidence * 0.3)
 
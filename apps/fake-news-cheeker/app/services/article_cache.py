@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timezone
+from typing import Dict, Iterable, List, Optional
+from ..config.settings import ARTICLE_CACHE_SIZE, ARTICLE_CACHE_FRESHNESS
+from ..database import get_db
+from ..models.source import Source
+from ..utils.logger import logger
+
+
+@dataclass
+class CachedArticle:
+    url: str
+    content: str
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ArticleCache:
+    """
+    Extracted article text keyed by URL: in-process LRU in front of the
+    sources table. Stale entries are kept so their validators can be used to
+    revalidate with the origin instead of re-downloading.
+    """
+
+    def __init__(self, max_size: int = ARTICLE_CACHE_SIZE, freshness: int = ARTICLE_CACHE_FRESHNESS):
+        self.max_size = max_size
+        self.freshness = freshness
+        self._entries: "OrderedDict[str, CachedArticle]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "revalidated": 0, "fetched": 0, "db_loaded": 0}
+
+    def get(self, url: str) -> Optional[CachedArticle]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def is_fresh(self, entry: CachedArticle) -> bool:
+        return time.time() - entry.fetched_at < self.freshness
+
+    def put(self, url: str, content: str, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, fetched_at: Optional[float] = None) -> CachedArticle:
+        entry = CachedArticle(url, content, fetched_at or time.time(), etag, last_modified)
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def touch(self, entry: CachedArticle, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> CachedArticle:
+        """Record a 304: the cached text is current again"""
+        self.stats["revalidated"] += 1
+        return self.put(entry.url, entry.content, etag or entry.etag,
+                        last_modified or entry.last_modified)
+
+    def conditional_headers(self, entry: Optional[CachedArticle]) -> Dict[str, str]:
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    async def prefetch(self, urls: Iterable[str]):
+        """Load the stored articles of URLs missing from memory with one query"""
+        missing = [url for url in dict.fromkeys(urls) if url and self.get(url) is None]
+        if not missing:
+            return
+        try:
+            await asyncio.to_thread(self._load_from_db, missing)
+        except Exception as e:
+            logger.warning(f"Article cache DB lookup failed: {e}")
+
+    def _load_from_db(self, urls: List[str]):
+        with get_db() as db:
+            rows = (
+                db.query(Source.url, Source.content, Source.last_scraped_at, Source.etag, Source.last_modified)
+                .filter(Source.url.in_(urls), Source.last_scraped_at.isnot(None))
+                .all()
+            )
+        for url, content, scraped_at, etag, last_modified in rows:
+            if not content:
+                continue
+            if scraped_at.tzinfo is None:
+                scraped_at = scraped_at.replace(tzinfo=timezone.utc)
+            self.put(url, content, etag, last_modified, fetched_at=scraped_at.timestamp())
+            self.stats["db_loaded"] += 1
+
+
+article_cache = ArticleCache()
@@ -0,0 +1,209 @@
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set, Tuple
+import numpy as np
+from ..algorithms.minhash import MinHasher, MinHashLSH
+from ..config.settings import (
+    NEAR_DUPLICATE_THRESHOLD, MINHASH_NUM_PERM, MINHASH_BANDS, VERDICT_CACHE_TTLS, VERDICT_CACHE_DEFAULT_TTL
+)
+from ..database import get_db
+from ..models.claim_model import Claim
+from ..utils.cleaner import clean_text
+from ..utils.logger import logger
+
+STOPWORDS = frozenset("""
+a an the and or but of in on at to for by with from as is are was were be been being
+has have had do does did this that these those it its into over about than then so
+says said claims claim reportedly report reports just also very
+""".split())
+
+# Negations and numbers flip a claim's meaning while barely moving its Jaccard
+# similarity, so candidates must agree on them exactly
+NEGATIONS = frozenset("""
+not no never none nobody nothing neither nor without
+dont doesnt didnt isnt arent wasnt werent wont cant cannot hasnt havent hadnt
+لا لم لن ليس ليست غير değil yok hiç pas jamais aucun
+""".split())
+
+# Reporting verbs that paraphrases swap freely, mapped to one stem. Irregular
+# forms are listed because the suffix rules below do not reach them.
+SYNONYMS = {
+    word: base
+    for base, words in {
+        "discover": "find finds finding found discover uncover detect reveal",
+        "ban": "ban prohibit outlaw",
+        "approve": "approve authorize authorise",
+        "win": "win wins winning won",
+        "lose": "lose loses losing lost",
+        "die": "die dies dying died dead",
+    }.items()
+    for word in words.split()
+}
+
+
+def stem(word: str) -> str:
+    """Light English stemming: synonyms, then -ing, -ed or plural -s; other scripts are left alone"""
+    if word in SYNONYMS:
+        return SYNONYMS[word]
+    if not word.isascii():
+        return word
+    for suffix, min_length in (("ing", 6), ("ed", 5), ("s", 4)):
+        if word.endswith(suffix) and len(word) >= min_length and not word.endswith("ss"):
+            word = word[:-len(suffix)]
+            break
+    # "approv(ed)" and "bann(ed)" still find their synonym group
+    for candidate in (word, word + "e", word[:-1]):
+        if candidate in SYNONYMS:
+            return SYNONYMS[candidate]
+    return word
+
+
+def claim_tokens(text: str) -> Tuple[Set[str], int]:
+    """Token set used for MinHash, plus a guard hash over negations and numbers"""
+    words = clean_text(text).split()
+    tokens = {stem(w) for w in words if w not in STOPWORDS}
+    guard_terms = sorted(w for w in words if w in NEGATIONS or w.isdigit())
+    return tokens, zlib.crc32(" ".join(guard_terms).encode("utf-8"))
+
+
+def max_verdict_ttl() -> int:
+    """How long the longest-lived verdict category stays in the verdict cache"""
+    return max([VERDICT_CACHE_DEFAULT_TTL, *VERDICT_CACHE_TTLS.values()])
+
+
+# Claims older than the index's max_age are dropped at most this often (seconds)
+EVICT_EVERY = 600
+
+
+class ClaimIndex:
+    """
+    Near-duplicate lookup over recent claims, keyed by claim fingerprint.
+
+    Claims are kept for ``max_age`` seconds after they were last verified
+    (by default the longest verdict TTL, past which no verdict is left to
+    reuse); older ones are evicted as new claims come in.
+    """
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_THRESHOLD,
+                 num_perm: int = MINHASH_NUM_PERM, bands: int = MINHASH_BANDS,
+                 max_age: Optional[float] = None):
+        self.hasher = MinHasher(num_perm=num_perm)
+        self.lsh = MinHashLSH(num_perm=num_perm, bands=bands, threshold=threshold)
+        self.max_age = max_verdict_ttl() if max_age is None else max_age
+        self.counters = {"hits": 0, "misses": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        self._build_thread: Optional[threading.Thread] = None
+        self._evict_thread: Optional[threading.Thread] = None
+        self._evicted_at = time.time()
+
+    def add(self, fingerprint: str, text: str, timestamp: Optional[float] = None):
+        """Index a verified claim; re-verifying one only refreshes its age"""
+        key = bytes.fromhex(fingerprint)
+        if not self.lsh.touch(key, timestamp):
+            tokens, guard = claim_tokens(text)
+            signature = self.hasher.signature(tokens)
+            if signature is not None:
+                self.lsh.add(key, signature, guard, timestamp=timestamp)
+        self._schedule_eviction()
+
+    def evict_expired(self) -> int:
+        """Drop claims last verified more than max_age seconds ago"""
+        evicted = self.lsh.evict(time.time() - self.max_age)
+        if evicted:
+            with self._lock:
+                self.counters["evicted"] += evicted
+            logger.info(f"Evicted {evicted} claims older than {self.max_age}s from the claim index")
+        return evicted
+
+    def _schedule_eviction(self):
+        """Start an eviction off the request path, at most every EVICT_EVERY seconds"""
+        now = time.time()
+        with self._lock:
+            if now - self._evicted_at < EVICT_EVERY:
+                return
+            self._evicted_at = now
+
+        def run():
+            try:
+                self.evict_expired()
+            except Exception as e:
+                logger.error(f"Claim index eviction failed: {e}")
+
+        self._evict_thread = threading.Thread(target=run, name="claim-index-evict", daemon=True)
+        self._evict_thread.start()
+
+    def find(self, text: str) -> Optional[Tuple[str, float]]:
+        """Return (fingerprint, similarity) of the closest indexed claim, if any"""
+        tokens, guard = claim_tokens(text)
+        signature = self.hasher.signature(tokens)
+        matches = self.lsh.query(signature, guard) if signature is not None else []
+        if not matches:
+            return None
+        key, similarity = matches[0]
+        return key.hex(), similarity
+
+    def record(self, hit: bool):
+        """Count a lookup; a hit is a match whose verdict was actually reused"""
+        with self._lock:
+            self.counters["hits" if hit else "misses"] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+            "size": len(self.lsh),
+            "threshold": self.lsh.threshold,
+        }
+
+    def build_from_db(self, batch_size: int = 10000):
+        """Index claims young enough to still have a reusable verdict"""
+        start = time.perf_counter()
+        since = datetime.now(timezone.utc) - timedelta(seconds=self.max_age)
+        with get_db() as db:
+            rows = (
+                db.query(Claim.fingerprint, Claim.text, Claim.created_at)
+                .filter(Claim.fingerprint.isnot(None), Claim.created_at >= since)
+                .order_by(Claim.created_at.asc())
+                .yield_per(batch_size)
+            )
+            keys, signatures, guards, timestamps = [], [], [], []
+            for fingerprint, text, created_at in rows:
+                tokens, guard = claim_tokens(text)
+                signature = self.hasher.signature(tokens)
+                if signature is None:
+                    continue
+                keys.append(bytes.fromhex(fingerprint))
+                signatures.append(signature)
+                guards.append(guard)
+                # SQLite hands back naive datetimes; they are UTC
+                timestamps.append((created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc)).timestamp())
+                if len(keys) >= batch_size:
+                    self._flush(keys, signatures, guards, timestamps)
+                    keys, signatures, guards, timestamps = [], [], [], []
+            self._flush(keys, signatures, guards, timestamps)
+        logger.info(f"Claim index built with {len(self.lsh)} claims in {time.perf_counter() - start:.2f}s")
+
+    def build_in_background(self):
+        if self._build_thread and self._build_thread.is_alive():
+            return
+
+        def run():
+            try:
+                self.build_from_db()
+            except Exception as e:
+                logger.error(f"Claim index build failed: {e}")
+
+        self._build_thread = threading.Thread(target=run, name="claim-index-build", daemon=True)
+        self._build_thread.start()
+
+    def _flush(self, keys, signatures, guards, timestamps):
+        if keys:
+            self.lsh.add_many(keys, np.stack(signatures), np.array(guards, dtype=np.uint32), np.array(timestamps))
+
+
+claim_index = ClaimIndex()
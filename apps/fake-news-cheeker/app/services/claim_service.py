@@ -4,100 +4,187 @@ from ..models.source import Source
 from ..models.analysis import Analysis
 from ..database import get_db
 from ..utils.logger import logger
-from .scrape_service import ScrapeService
+from ..utils.cleaner import claim_fingerprint
+from .scrape_service import get_scrape_service
 from .analyze_service import AnalyzeService
+from .verdict_cache import verdict_cache
+from .article_cache import article_cache
+from .persistence import persistence_queue, write_verifications
+from .claim_index import claim_index
+from .verdict_engine import IncrementalVerdict
+from ..config.settings import EARLY_TERMINATION, EARLY_TERMINATION_BATCH_SIZE, PERSIST_WRITE_BEHIND
+from ..core.runtime import runtime
 import uuid
 import asyncio
 import time
-from typing import Dict
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Tuple
 
 class ClaimService:
     def __init__(self):
-        from .scrape_service import ScrapeService
-        from .analyze_service import AnalyzeService
-        self.scraper = ScrapeService()
+        self.scraper = get_scrape_service()
         self.analyzer = AnalyzeService()
+        self.verdict_cache = verdict_cache
+        self.article_cache = article_cache
+        self.persistence = persistence_queue
+        self.write_behind = PERSIST_WRITE_BEHIND
+        self.claim_index = claim_index
+        self.early_termination = EARLY_TERMINATION
+        # Small batches let the verdict engine check partial results; one big
+        # batch would only report once every source is in
+        self.stream_batch_size = (
+            min(EARLY_TERMINATION_BATCH_SIZE, self.analyzer.batch_size) if EARLY_TERMINATION
+            else self.analyzer.batch_size
+        )
 
     def verify_claim(self, claim_text: str) -> dict:
-        return asyncio.run(self.verify_claim_async(claim_text))
+        return runtime.run(self.verify_claim_async(claim_text))
 
     async def verify_claim_async(self, claim_text: str) -> dict:
+        result = None
+        async for event, data in self.verify_claim_events(claim_text):
+            if event in ("verdict", "error"):
+                result = data
+        return result
+
+    async def verify_claim_events(self, claim_text: str) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Run the verification pipeline, yielding (event, data) as each stage completes:
+        "search", one "article" per scraped page, one "analysis" per source, then
+        "verdict" (the full verify_claim_async result) or "error".
+        """
         timings = {}
         try:
-            # Stage 1: Scraping
+            # Stage 0: Verdict cache (repeat claims skip search, scraping and the LLM)
             start = time.perf_counter()
-            articles = await self.scraper.search_news_async(claim_text, max_results=4, scrape_content=True)
-            timings['scraping'] = time.perf_counter() - start
+            fingerprint = claim_fingerprint(claim_text)
+            cached = await asyncio.to_thread(self.verdict_cache.get, fingerprint)
+            near_duplicate = None
+            if cached is None:
+                # Paraphrases of a recently verified claim reuse its verdict
+                match = self.claim_index.find(claim_text)
+                if match is not None:
+                    cached = await asyncio.to_thread(self.verdict_cache.get, match[0])
+                    if cached is not None:
+                        near_duplicate = {"claim_id": cached["claim_id"], "similarity": round(match[1], 3)}
+                self.claim_index.record(near_duplicate is not None)
+            timings['cache'] = time.perf_counter() - start
+            if cached is not None:
+                logger.info(f"Verdict cache hit for claim {cached['claim_id']}")
+                yield "verdict", {**cached, "cached": True, "near_duplicate": near_duplicate, "timings": timings}
+                return
 
-            # Stage 2: Parallel Analysis
+            # Stage 1: Search, then scraping; each batch of scraped articles goes
+            # to the analyzer as soon as it fills up
             start = time.perf_counter()
-            analysis_tasks = [
-                asyncio.to_thread(self.analyzer.analyze_source, claim_text, art)
-                for art in articles
-            ]
-            raw_results = await asyncio.gather(*analysis_tasks)
+            search_results = await self.scraper.search_async(claim_text, max_results=4)
+            timings['search'] = time.perf_counter() - start
+            yield "search", {"results": [self._article_event(r) for r in search_results]}
+
+            # Scrape and analysis completions arrive on one queue so the verdict
+            # engine can stop both stages as soon as the outcome is settled
+            events: asyncio.Queue = asyncio.Queue()
+            search_urls = [r["url"] for r in search_results if r.get("url")]
+            engine = IncrementalVerdict(self.analyzer, total=len(search_urls))
+
+            async def scrape_all():
+                try:
+                    async for article in self.scraper.iter_scraped(search_results):
+                        await events.put(("article", article))
+                    await events.put(("scraped", None))
+                except Exception as e:
+                    await events.put(("failed", e))
+
+            async def analyze(batch: List[Dict]):
+                try:
+                    await events.put(("analyzed", await self.analyzer.analyze_batch_async(claim_text, batch)))
+                except Exception as e:
+                    await events.put(("failed", e))
+
+            articles, pending, raw_results, tasks = [], [], [], []
+            analysis_start = None
+            outstanding, scraping_done, early_stop = 0, False, False
+
+            def launch(batch: List[Dict]):
+                nonlocal analysis_start, outstanding
+                analysis_start = analysis_start or time.perf_counter()
+                outstanding += 1
+                tasks.append(asyncio.ensure_future(analyze(batch)))
+
+            tasks.append(asyncio.ensure_future(scrape_all()))
+            try:
+                while not (scraping_done and outstanding == 0):
+                    kind, payload = await events.get()
+                    if kind == "failed":
+                        raise payload
+                    if kind == "article":
+                        articles.append(payload)
+                        yield "article", self._article_event(payload)
+                        pending.append(payload)
+                        if len(pending) >= max(1, self.stream_batch_size):
+                            launch(pending)
+                            pending = []
+                    elif kind == "scraped":
+                        scraping_done = True
+                        timings['scraping'] = time.perf_counter() - start
+                        if pending:
+                            launch(pending)
+                            pending = []
+                    elif kind == "analyzed":
+                        outstanding -= 1
+                        # Stage 2: per-source analyses, streamed as they complete
+                        for result in payload:
+                            engine.add(result)
+                            raw_results.append(result)
+                            yield "analysis", self._analysis_event(result)
+                        if self.early_termination and engine.remaining and engine.is_decided():
+                            early_stop = True
+                            logger.info(
+                                f"Verdict settled after {len(raw_results)}/{engine.total} sources, "
+                                f"cancelling remaining scrapes and analyses"
+                            )
+                            break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Let cancelled scrapes and LLM calls unwind before moving on
+                await asyncio.gather(*tasks, return_exceptions=True)
+            timings.setdefault('scraping', time.perf_counter() - start)
+
             # Use AnalyzeService's compute_final_verdict to get the final analysis and conclusion
             analysis = self.analyzer.compute_final_verdict(claim_text, raw_results)
-            timings['analysis'] = time.perf_counter() - start
+            timings['analysis'] = time.perf_counter() - (analysis_start or time.perf_counter())
 
-            # Stage 3: Database Operations
+            # Stage 3: Database Operations (queued for the write-behind worker
+            # unless disabled; only a full queue makes the request wait)
             start = time.perf_counter()
-            with get_db() as db:
-                claim = Claim(
-                    id=uuid.uuid4(),
-                    text=claim_text,
-                    verdict=analysis["verdict"],
-                    confidence=float(analysis["confidence"]),
-                    explanation=analysis["explanation"],
-                    conclusion=analysis["conclusion"],
-                    category=analysis.get("category", "general")
-                )
-                db.add(claim)
-                
-                # Process sources
-                for article in articles:
-                    source = db.query(Source).filter(Source.url == article['url']).first()
-                    if not source:
-                        source = Source(
-                            id=uuid.uuid4(),
-                            url=article['url'],
-                            domain=self._extract_domain(article['url']),
-                            title=article.get('title', ''),
-                            snippet=article.get('snippet', ''),
-                            content=article.get('content', ''),
-                            source_name=article.get('source', 'unknown')
-                        )
-                        db.add(source)
-                    
-                    analysis_entry = Analysis(
-                        id=uuid.uuid4(),
-                        claim_id=claim.id,
-                        source_id=source.id,
-                        support=article.get("support", "Uncertain"),
-                        confidence=float(article.get("confidence", 50.0)),
-                        reason=article.get("reason", ""),
-                        analysis_text=article.get("content", "")[:500]
-                    )
-                    db.add(analysis_entry)
-                
-                db.commit()
-                timings['database'] = time.perf_counter() - start
-
-                return {
-                    "status": "success",
-                    "claim_id": claim.id,
-                    "verdict": claim.verdict,
-                    "confidence": claim.confidence,
-                    "explanation": claim.explanation,
-                    "conclusion": claim.conclusion,
-                    "category": claim.category,
-                    "sources": analysis["sources"],
-                    "timings": timings
-                }
+            claim_id = str(uuid.uuid4())
+            record = self._verification_record(claim_id, claim_text, fingerprint, analysis, raw_results)
+            if self.write_behind:
+                await asyncio.to_thread(self.persistence.submit, record)
+            else:
+                await asyncio.to_thread(write_verifications, [record])
+            timings['database'] = time.perf_counter() - start
+
+            result = {
+                "status": "success",
+                "claim_id": claim_id,
+                "verdict": analysis["verdict"],
+                "confidence": float(analysis["confidence"]),
+                "explanation": analysis["explanation"],
+                "conclusion": analysis["conclusion"],
+                "category": analysis.get("category", "general"),
+                "sources": analysis["sources"]
+            }
+            if early_stop:
+                result["early_stop"] = {"analyzed": len(raw_results), "total": engine.total}
+            self.verdict_cache.put(fingerprint, result)
+            self.claim_index.add(fingerprint, claim_text)
+            yield "verdict", {**result, "cached": False, "timings": timings}
 
         except Exception as e:
             logger.error(f"Claim verification failed: {str(e)}")
-            return {
+            yield "error", {
                 "status": "error",
                 "message": "Failed to verify claim",
                 "error": str(e),
@@ -105,6 +192,71 @@ class ClaimService:
                 "sources": []
             }
 
+    def _verification_record(self, claim_id: str, claim_text: str, fingerprint: str,
+                             analysis: Dict, results: List[Dict]) -> Dict:
+        """JSON-serializable rows for the persistence queue (and its spill file)"""
+        sources = []
+        for article in results:
+            # The article cache holds what was actually fetched, with its validators
+            cached = self.article_cache.get(article['url'])
+            sources.append({
+                "url": article['url'],
+                "domain": self._extract_domain(article['url']),
+                "title": article.get('title', ''),
+                "snippet": article.get('snippet', ''),
+                "content": cached.content if cached else article.get('content', ''),
+                "source_name": article.get('source', 'unknown'),
+                "last_scraped_at": cached.fetched_at if cached else None,
+                "etag": cached.etag if cached else None,
+                "last_modified": cached.last_modified if cached else None,
+            })
+        return {
+            "claim": {
+                "id": claim_id,
+                "text": claim_text,
+                "verdict": analysis["verdict"],
+                "confidence": float(analysis["confidence"]),
+                "explanation": analysis["explanation"],
+                "conclusion": analysis["conclusion"],
+                "category": analysis.get("category", "general"),
+                "fingerprint": fingerprint,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            },
+            "sources": sources,
+            "analyses": [{
+                "id": str(uuid.uuid4()),
+                "url": article['url'],
+                "support": article.get("support", "Uncertain"),
+                "confidence": float(article.get("confidence", 50.0)),
+                "reason": article.get("reason", ""),
+                "analysis_text": article.get("content", "")[:500]
+            } for article in results],
+        }
+
+    def _article_event(self, article: Dict) -> Dict:
+        content = article.get("content") or ""
+        return {
+            "url": article.get("url", ""),
+            "title": article.get("title", ""),
+            "snippet": article.get("snippet", ""),
+            "source": article.get("source", ""),
+            "date": article.get("date", ""),
+            "status": article.get("status"),
+            "content_length": len(content),
+        }
+
+    def _analysis_event(self, result: Dict) -> Dict:
+        return {
+            "url": result.get("url", ""),
+            "title": result.get("title", ""),
+            "source": result.get("source", ""),
+            "relevant": result.get("relevant"),
+            "support": result.get("support"),
+            "confidence": result.get("confidence"),
+            "reason": result.get("reason", ""),
+            "authoritative": result.get("authoritative"),
+        }
+
     def _generate_human_conclusion(self, claim: str, analysis: dict) -> str:
         verdict = analysis["verdict"]
         confidence = analysis["confidence"]
@@ -0,0 +1,154 @@
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import func, select, text
+from ..database import get_db, upsert
+from ..models.claim_model import Claim
+from ..models.source import Source
+from ..models.analysis import Analysis
+from ..models.stat_counter import StatCounter
+from ..utils.logger import logger
+
+# Written once the counters hold a full tally of the existing rows
+INITIALIZED = "_initialized"
+
+HIGH_CONFIDENCE = 0.8
+
+
+def claims_key(category: Optional[str] = None, verdict: Optional[str] = None) -> str:
+    key = "claims"
+    if category:
+        key += f":category:{category}"
+    if verdict:
+        key += f":verdict:{verdict}"
+    return key
+
+
+def sources_key(domain: Optional[str] = None) -> str:
+    return f"sources:domain:{domain}" if domain else "sources"
+
+
+def analyses_key(support: Optional[str] = None) -> str:
+    return f"analyses:support:{support}" if support else "analyses"
+
+
+def claim_counter_keys(verdict: str, category: str, confidence: float) -> List[str]:
+    """Every counter a new claim row contributes to"""
+    keys = [
+        claims_key(),
+        claims_key(category=category),
+        claims_key(verdict=verdict),
+        claims_key(category, verdict),
+    ]
+    if confidence is not None and confidence > HIGH_CONFIDENCE:
+        keys.append("claims:high_confidence")
+    return keys
+
+
+class StatCounters:
+    """
+    Per-slice row counts kept in the stat_counters table.
+
+    Writers add deltas in the same transaction as their inserts, so reading a
+    total is a primary-key lookup instead of a COUNT(*) over the filtered
+    query. Until the first full tally has been taken, readers get None and
+    fall back to counting (or to the planner's estimate for whole tables).
+    """
+
+    def __init__(self):
+        self._initialized = False
+        self._build_thread: Optional[threading.Thread] = None
+
+    def increment(self, db, deltas: Dict[str, int]):
+        """Add deltas inside the caller's transaction"""
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        table = StatCounter.__table__
+        stmt = upsert(table, db.get_bind()).values(
+            # Sorted so concurrent writers lock counter rows in the same order
+            [{"name": name, "value": deltas[name]} for name in sorted(deltas)]
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.name],
+            set_={"value": table.c.value + stmt.excluded.value}
+        ))
+
+    def get(self, name: str) -> Optional[int]:
+        values = self.get_many([name])
+        return None if values is None else values[name]
+
+    def get_many(self, names: Iterable[str]) -> Optional[Dict[str, int]]:
+        """Exact counts (0 for slices with no rows), or None before the first tally"""
+        names = list(names)
+        with get_db() as db:
+            rows = dict(db.execute(
+                select(StatCounter.name, StatCounter.value)
+                .where(StatCounter.name.in_(names + [INITIALIZED]))
+            ).all())
+        if INITIALIZED not in rows:
+            return None
+        self._initialized = True
+        return {name: rows.get(name, 0) for name in names}
+
+    def approximate_total(self, table: str) -> Optional[int]:
+        """Planner row estimate for a whole table (Postgres only)"""
+        with get_db() as db:
+            if db.get_bind().dialect.name != "postgresql":
+                return None
+            estimate = db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                {"table": table}
+            ).scalar()
+        # -1 means the table was never analyzed
+        return int(estimate) if estimate is not None and estimate >= 0 else None
+
+    def rebuild(self):
+        """Recount every slice from the base tables"""
+        with get_db() as db:
+            if db.get_bind().dialect.name == "postgresql":
+                # Writers wait for the recount, so no increment falls between
+                # the snapshot and the overwrite
+                db.execute(text("LOCK TABLE stat_counters IN EXCLUSIVE MODE"))
+
+            totals = Counter()
+            claims = db.execute(
+                select(Claim.verdict, Claim.category, Claim.confidence > HIGH_CONFIDENCE, func.count())
+                .group_by(Claim.verdict, Claim.category, Claim.confidence > HIGH_CONFIDENCE)
+            ).all()
+            for verdict, category, high_confidence, count in claims:
+                for key in claim_counter_keys(verdict, category, 1.0 if high_confidence else 0.0):
+                    totals[key] += count
+            for domain, count in db.execute(select(Source.domain, func.count()).group_by(Source.domain)).all():
+                totals[sources_key()] += count
+                totals[sources_key(domain)] += count
+            for support, count in db.execute(select(Analysis.support, func.count()).group_by(Analysis.support)).all():
+                totals[analyses_key()] += count
+                totals[analyses_key(support)] += count
+            for key in (claims_key(), sources_key(), analyses_key(), "claims:high_confidence"):
+                totals.setdefault(key, 0)
+            totals[INITIALIZED] = 1
+
+            db.execute(StatCounter.__table__.delete())
+            db.execute(StatCounter.__table__.insert(), [{"name": k, "value": v} for k, v in totals.items()])
+            db.commit()
+        self._initialized = True
+        logger.info(f"Stat counters rebuilt: {len(totals) - 1} slices")
+
+    def ensure_initialized_in_background(self):
+        """Take the first full tally without blocking startup"""
+        if self._initialized or (self._build_thread and self._build_thread.is_alive()):
+            return
+
+        def run():
+            try:
+                if self.get(claims_key()) is None:
+                    self.rebuild()
+            except Exception as e:
+                logger.error(f"Stat counter rebuild failed: {e}")
+
+        self._build_thread = threading.Thread(target=run, name="stat-counters-build", daemon=True)
+        self._build_thread.start()
+
+
+stat_counters = StatCounters()
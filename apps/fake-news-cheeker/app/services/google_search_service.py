@@ -1,10 +1,15 @@
+import asyncio
 import os
-import requests
 import logging
+import math
+import weakref
+import httpx
 from dotenv import load_dotenv
-from typing import List, Dict
+from typing import Dict, List, Optional, Tuple
 import time
-import concurrent.futures
+from ..core.runtime import runtime
+from .search_cache import SearchCache, search_cache
+from .search_provider import SearchProvider
 
 load_dotenv()
 
@@ -12,99 +17,134 @@ logger = logging.getLogger(__name__)
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GOOGLE_CX = os.getenv("GOOGLE_CX")
-CACHE_EXPIRY = 300  # 5 minutes
-
-class GoogleSearchService:
-    def __init__(self):
-        self.cache = {}
-        self.last_cleaned = time.time()
-
-    def _clean_cache(self):
-        """Remove expired cache entries"""
-        current_time = time.time()
-        if current_time - self.last_cleaned > 40:  # Clean every minute
-            expired_keys = [k for k, (_, ts) in self.cache.items()
-                            if current_time - ts > CACHE_EXPIRY]
-            for key in expired_keys:
-                del self.cache[key]
-            self.last_cleaned = current_time
-
-    def search(self, query: str, max_results: int = 3, lang: str = None) -> List[Dict]:
+GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+PAGE_SIZE = 10  # Custom Search API maximum per request
+
+# One pooled client per event loop (the ASGI server's and the shared runtime's)
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+def _get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(5.0, connect=3.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        )
+        _async_clients[loop] = client
+    return client
+
+async def close_search_client():
+    """Close the pooled client of the running loop"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+runtime.on_shutdown(close_search_client)
+
+class GoogleSearchService(SearchProvider):
+    """
+    Custom Search API client. Result pages are fetched concurrently over a
+    pooled HTTP/2 connection, and concurrent identical queries share one
+    upstream call (single-flight), so a burst of the same claim costs one
+    request against the API quota. Results go through the shared
+    ``search_cache``; a stale hit is returned at once and refreshed in the
+    background.
+    """
+
+    name = "google"
+
+    def __init__(self, cache: SearchCache = search_cache):
+        self.cache = cache
+        # In-flight fetches per event loop, keyed like the cache
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = weakref.WeakKeyDictionary()
+        self.stats = {"coalesced": 0, "revalidations": 0, "upstream_calls": 0}
+
+    async def search_async(self, query: str, max_results: int = 3, lang: str = None) -> List[Dict]:
         if not (GOOGLE_API_KEY and GOOGLE_CX):
             raise RuntimeError("GOOGLE_API_KEY and GOOGLE_CX must be set in .env")
 
-        # Check cache first
         cache_key = f"{query}-{max_results}-{lang or 'auto'}"
-        self._clean_cache()
-
-        if cache_key in self.cache:
+        entry = await self.cache.get_async(cache_key)
+        if entry is not None:
+            if not self.cache.is_fresh(entry):
+                # Stale-while-revalidate: answer now, refresh for the next caller
+                task, started = self._start_fetch(query, max_results, lang, cache_key)
+                if started:
+                    self.stats["revalidations"] += 1
             logger.debug(f"Using cached results for: {query}")
-            return self.cache[cache_key][0]
-
-        try:
-            logger.info(f"Searching Google: {query}")
-            start_time = time.time()
-
-            # Use concurrent requests for multiple pages
-            results = []
-            pages = (max_results // 10) + 1
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                futures = []
-                for page in range(1, pages + 1):
-                    futures.append(
-                        executor.submit(
-                            self._search_page,
-                            query,
-                            min(10, max_results - (page - 1) * 10),
-                            lang,
-                            page
-                        )
-                    )
-
-                for future in concurrent.futures.as_completed(futures):
-                    results.extend(future.result())
-
-            # Cache results
-            self.cache[cache_key] = (results, time.time())
-
-            logger.info(f"Found {len(results)} results in {time.time() - start_time:.2f}s")
-            return results[:max_results]
-        except Exception as e:
-            logger.error(f"Google Search API error: {e}")
-            return []
-
-    def _search_page(self, query: str, num: int, lang: str = None, page: int = 1) -> List[Dict]:
+            return list(entry.results)
+
+        task, started = self._start_fetch(query, max_results, lang, cache_key)
+        if not started:
+            logger.debug(f"Joining in-flight search for: {query}")
+            self.stats["coalesced"] += 1
+        # Shielded: a caller that gives up must not cancel the fetch others are waiting on
+        return list(await asyncio.shield(task))
+
+    def _start_fetch(self, query: str, max_results: int, lang: Optional[str],
+                     cache_key: str) -> Tuple[asyncio.Task, bool]:
+        """The in-flight fetch for ``cache_key`` on this loop, and whether it was just started"""
+        inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        task = inflight.get(cache_key)
+        if task is not None:
+            return task, False
+        task = asyncio.ensure_future(self._fetch(query, max_results, lang, cache_key))
+        inflight[cache_key] = task
+        task.add_done_callback(lambda _: inflight.pop(cache_key, None))
+        return task, True
+
+    async def _fetch(self, query: str, max_results: int, lang: Optional[str], cache_key: str) -> List[Dict]:
+        logger.info(f"Searching Google: {query}")
+        start_time = time.time()
+
+        pages = max(1, math.ceil(max_results / PAGE_SIZE))
+        page_results = await asyncio.gather(*(
+            self._search_page(query, min(PAGE_SIZE, max_results - (page - 1) * PAGE_SIZE), lang, page)
+            for page in range(1, pages + 1)
+        ), return_exceptions=True)
+        failures = [r for r in page_results if isinstance(r, BaseException)]
+        for error in failures:
+            logger.error(f"Google Search API error: {error}")
+        results = [r for page in page_results if not isinstance(page, BaseException) for r in page][:max_results]
+
+        # Partial answers are not cached: they would replace a complete (if stale) entry
+        if not failures:
+            await self.cache.put_async(cache_key, results)
+
+        logger.info(f"Found {len(results)} results in {time.time() - start_time:.2f}s")
+        return results
+
+    async def _search_page(self, query: str, num: int, lang: str = None, page: int = 1) -> List[Dict]:
         """Search a single page of results"""
-        try:
-            params = {
-                "key": GOOGLE_API_KEY,
-                "cx": GOOGLE_CX,
-                "q": query,
-                "num": num,
-                "start": (page - 1) * 10 + 1,
-                "safe": "active"
-            }
-            if lang:
-                params["lr"] = lang
-            response = requests.get(
-                "https://www.googleapis.com/customsearch/v1",
-                params=params,
-                timeout=5
-            )
-            response.raise_for_status()
-            print("GOOGLE API RAW RESPONSE:", response.text)
-            data = response.json()
-
-            results = []
-            for item in data.get("items", []):
-                results.append({
-                    "url": item.get("link"),
-                    "title": item.get("title"),
-                    "snippet": item.get("snippet"),
-                    "date": item.get("pagemap", {}).get("metatags", [{}])[0].get("article:published_time", "")
-                })
-
-            return results
-        except Exception as e:
-            logger.warning(f"Google Search page {page} error: {e}")
-            return []
+        params = {
+            "key": GOOGLE_API_KEY,
+            "cx": GOOGLE_CX,
+            "q": query,
+            "num": num,
+            "start": (page - 1) * PAGE_SIZE + 1,
+            "safe": "active"
+        }
+        if lang:
+            params["lr"] = lang
+        self.stats["upstream_calls"] += 1
+        response = await _get_async_client().get(GOOGLE_SEARCH_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
+        logger.debug(f"Google Search page {page}: {len(data.get('items', []))} items")
+
+        results = []
+        for item in data.get("items", []):
+            results.append({
+                "url": item.get("link"),
+                "title": item.get("title"),
+                "snippet": item.get("snippet"),
+                "date": item.get("pagemap", {}).get("metatags", [{}])[0].get("article:published_time", "")
+            })
+
+        return results
+
+
+# Shared so the cache and in-flight coalescing span every caller
+google_search = GoogleSearchService()
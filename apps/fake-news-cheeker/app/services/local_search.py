@@ -0,0 +1,164 @@
+import asyncio
+import heapq
+import math
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from ..config.settings import LOCAL_SEARCH_REFRESH
+from ..database import get_db
+from ..models.source import Source
+from .claim_index import STOPWORDS
+from .search_provider import SearchProvider
+from ..utils.logger import logger
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Snippet length when a source has none of its own
+SNIPPET_CHARS = 200
+
+
+def search_terms(text: str) -> List[str]:
+    """Lowercased word tokens without stopwords; language-agnostic (Arabic, Turkish, ... tokenize the same way)"""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+class LocalSearchProvider(SearchProvider):
+    """
+    Okapi BM25 over the title, snippet and stored content of previously
+    scraped sources, in an in-memory inverted index. The index is built on
+    the first search and then picks up sources scraped since its watermark
+    every ``refresh_interval`` seconds. Results carry the stored article
+    text, so the verify pipeline runs without any network call for search
+    or scraping. ``lang`` is ignored: one index serves every language.
+    """
+
+    name = "local"
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, refresh_interval: float = LOCAL_SEARCH_REFRESH):
+        self.k1 = k1
+        self.b = b
+        self.refresh_interval = refresh_interval
+        self._postings: Dict[str, Dict[object, int]] = {}  # term -> {source id: term frequency}
+        self._doc_terms: Dict[object, Tuple[str, ...]] = {}
+        self._doc_lengths: Dict[object, int] = {}
+        self._total_length = 0
+        self._watermark: Optional[datetime] = None
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    async def search_async(self, query: str, max_results: int = 3, lang: str = None) -> List[Dict]:
+        return await asyncio.to_thread(self._search, query, max_results)
+
+    def _search(self, query: str, max_results: int) -> List[Dict]:
+        self._refresh_if_due()
+        ranked = self.rank(query, max_results)
+        if not ranked:
+            return []
+        with get_db() as db:
+            rows = {
+                row.id: row for row in
+                db.query(Source.id, Source.url, Source.title, Source.snippet, Source.content, Source.published_date)
+                .filter(Source.id.in_([source_id for source_id, _ in ranked]))
+            }
+        results = []
+        for source_id, score in ranked:
+            row = rows.get(source_id)
+            if row is None or not row.content:
+                continue
+            results.append({
+                "url": row.url,
+                "title": row.title or "",
+                "snippet": row.snippet or row.content[:SNIPPET_CHARS],
+                "date": row.published_date.strftime("%Y-%m-%d") if row.published_date else "",
+                "content": row.content,
+                "score": round(score, 3),
+            })
+        return results
+
+    def rank(self, query: str, limit: int) -> List[Tuple[object, float]]:
+        """``[(source id, BM25 score), ...]`` of the best ``limit`` sources for ``query``"""
+        terms = set(search_terms(query))
+        scores: Dict[object, float] = {}
+        with self._lock:
+            total = len(self._doc_lengths)
+            if not total or not terms:
+                return []
+            average = self._total_length / total
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+                for source_id, tf in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[source_id] / average)
+                    scores[source_id] = scores.get(source_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def _refresh_if_due(self):
+        if self._refreshed_at is not None and time.monotonic() - self._refreshed_at < self.refresh_interval:
+            return
+        # Until the first build completes every caller waits for it; afterwards
+        # one thread refreshes while the others keep reading the current index
+        if not self._refresh_lock.acquire(blocking=self._refreshed_at is None):
+            return
+        try:
+            if self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.refresh_interval:
+                self.refresh()
+        except Exception as e:
+            logger.warning(f"Local search index refresh failed: {e}")
+        finally:
+            self._refresh_lock.release()
+
+    def refresh(self, batch_size: int = 1000):
+        """Index sources scraped since the last refresh (all of them the first time)"""
+        start = time.perf_counter()
+        initial = self._watermark is None
+        count = 0
+        with get_db() as db:
+            query = (
+                db.query(Source.id, Source.title, Source.snippet, Source.content, Source.last_scraped_at)
+                .filter(Source.content.isnot(None), Source.content != "")
+            )
+            if self._watermark is not None:
+                # Inclusive: rows written later with the same timestamp are re-added, not missed
+                query = query.filter(Source.last_scraped_at >= self._watermark)
+            for source_id, title, snippet, content, scraped_at in query.yield_per(batch_size):
+                self.add(source_id, " ".join(filter(None, (title, snippet, content))))
+                if scraped_at is not None and (self._watermark is None or scraped_at > self._watermark):
+                    self._watermark = scraped_at
+                count += 1
+        self._refreshed_at = time.monotonic()
+        (logger.info if initial else logger.debug)(
+            f"Local search index: {count} sources indexed in {time.perf_counter() - start:.2f}s ({len(self)} total)"
+        )
+
+    def add(self, source_id, text: str):
+        """(Re)index one source"""
+        tf = Counter(search_terms(text))
+        with self._lock:
+            self._remove(source_id)
+            for term, count in tf.items():
+                self._postings.setdefault(term, {})[source_id] = count
+            self._doc_terms[source_id] = tuple(tf)
+            length = sum(tf.values())
+            self._doc_lengths[source_id] = length
+            self._total_length += length
+
+    def _remove(self, source_id):
+        for term in self._doc_terms.pop(source_id, ()):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(source_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(source_id, 0)
+
+
+local_search = LocalSearchProvider()
@@ -0,0 +1,361 @@
+import atexit
+import glob
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import case
+from sqlalchemy.exc import InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
+from ..config.settings import (
+    PERSIST_QUEUE_SIZE, PERSIST_BATCH_SIZE, PERSIST_FLUSH_INTERVAL,
+    PERSIST_ENQUEUE_TIMEOUT, PERSIST_SPILL_DIR
+)
+from ..database import get_db, upsert
+from ..models.claim_model import Claim
+from ..models.source import Source
+from ..models.analysis import Analysis
+from .counters import stat_counters, claim_counter_keys, sources_key, analyses_key
+from ..core.response_cache import write_generation
+from ..utils.logger import logger
+
+# Errors that mean the database cannot take writes right now. Anything else a
+# record raises when written on its own is a problem with the record itself.
+UNAVAILABLE_ERRORS = (OperationalError, InterfaceError, PoolTimeoutError, ConnectionError)
+
+
+def write_verifications(records: List[Dict]):
+    """
+    Write the claims, sources and analyses of many verifications in one
+    transaction: one statement per table. Re-writing a record is a no-op, so
+    spilled records can be replayed safely.
+    """
+    if not records:
+        return
+    with get_db() as db:
+        bind = db.get_bind()
+        claims = Claim.__table__
+        # RETURNING yields only rows actually inserted, which is what the counters need
+        new_claims = db.execute(
+            upsert(claims, bind)
+            .values([{**r["claim"], "created_at": datetime.fromisoformat(r["claim"]["created_at"])} for r in records])
+            .on_conflict_do_nothing(index_elements=[claims.c.id])
+            .returning(claims.c.verdict, claims.c.category, claims.c.confidence)
+        ).all()
+
+        source_ids, new_domains = _upsert_sources(db, [source for r in records for source in r["sources"]])
+
+        analysis_rows = [{
+            **{k: v for k, v in analysis.items() if k != "url"},
+            "id": uuid.UUID(analysis["id"]),
+            "claim_id": uuid.UUID(r["claim"]["id"]),
+            "source_id": source_ids[analysis["url"]],
+        } for r in records for analysis in r["analyses"]]
+        new_supports = []
+        if analysis_rows:
+            analyses = Analysis.__table__
+            new_supports = db.execute(
+                upsert(analyses, bind)
+                .values(analysis_rows)
+                .on_conflict_do_nothing(index_elements=[analyses.c.id])
+                .returning(analyses.c.support)
+            ).scalars().all()
+
+        deltas = Counter()
+        for verdict, category, confidence in new_claims:
+            deltas.update(claim_counter_keys(verdict, category, confidence))
+        for domain in new_domains:
+            deltas.update([sources_key(), sources_key(domain)])
+        for support in new_supports:
+            deltas.update([analyses_key(), analyses_key(support)])
+        stat_counters.increment(db, deltas)
+
+        db.commit()
+    # Cached public API responses no longer reflect the tables
+    write_generation.bump()
+
+
+def _upsert_sources(db, source_rows: List[Dict]) -> Tuple[Dict[str, uuid.UUID], List[str]]:
+    """Insert new sources and refresh re-scraped ones; returns source ids by URL and the new rows' domains"""
+    rows = {}
+    for source in source_rows:
+        current = rows.get(source["url"])
+        # Several claims may cite the same URL; keep the most recent scrape
+        if current is None or (source["last_scraped_at"] or 0) > (current["last_scraped_at"] or 0):
+            rows[source["url"]] = source
+    if not rows:
+        return {}, []
+
+    sources = Source.__table__
+    values = [{
+        **rows[url],
+        "id": uuid.uuid4(),
+        "last_scraped_at": (datetime.fromtimestamp(rows[url]["last_scraped_at"], timezone.utc)
+                            if rows[url]["last_scraped_at"] else None),
+    } for url in sorted(rows)]  # Sorted so concurrent writers lock shared URLs in the same order
+    stmt = upsert(sources, db.get_bind()).values(values)
+    # Existing rows keep their metadata; scrape fields only move forward
+    rescraped = stmt.excluded.last_scraped_at.isnot(None)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[sources.c.url],
+        set_={
+            col: case((rescraped, stmt.excluded[col]), else_=sources.c[col])
+            for col in ("content", "last_scraped_at", "etag", "last_modified")
+        }
+    ).returning(sources.c.url, sources.c.id, sources.c.domain)
+
+    proposed_ids = {row["url"]: row["id"] for row in values}
+    source_ids, new_domains = {}, []
+    for url, source_id, domain in db.execute(stmt):
+        source_ids[url] = source_id
+        # A conflicting row keeps its own id, so ours coming back means it was inserted
+        if source_id == proposed_ids[url]:
+            new_domains.append(domain)
+    return source_ids, new_domains
+
+
+class PersistenceQueue:
+    """
+    Write-behind buffer for verification records.
+
+    Requests enqueue and return; a worker thread groups records from many
+    requests into one transaction. A full queue blocks producers for up to
+    ``enqueue_timeout`` (backpressure). Records that still do not fit, or
+    whose batch cannot be written, are appended to a JSONL spill file and
+    replayed once the database accepts writes again. When a batch fails, its
+    records are retried one at a time; a record the database rejects on its
+    own, and any spill file line that does not parse, goes to a dead-letter
+    file instead of holding back the records behind it.
+    """
+
+    def __init__(self, writer: Callable[[List[Dict]], None] = write_verifications,
+                 max_size: int = PERSIST_QUEUE_SIZE, batch_size: int = PERSIST_BATCH_SIZE,
+                 flush_interval: float = PERSIST_FLUSH_INTERVAL,
+                 enqueue_timeout: float = PERSIST_ENQUEUE_TIMEOUT,
+                 spill_dir: str = PERSIST_SPILL_DIR, write_attempts: int = 3,
+                 replay_interval: float = 30.0):
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.spill_dir = os.path.abspath(spill_dir)
+        self.write_attempts = write_attempts
+        self.replay_interval = replay_interval
+        self._last_replay = 0.0
+        self._queue: "queue.Queue[Dict]" = queue.Queue(maxsize=max_size)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._spill_pending = False
+        self.stats = {"enqueued": 0, "written": 0, "batches": 0, "failed_batches": 0,
+                      "spilled": 0, "replayed": 0, "dead_lettered": 0}
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+
+    def submit(self, record: Dict) -> bool:
+        """Queue a record; returns False if it had to be spilled to disk instead"""
+        self.start()
+        try:
+            self._queue.put(record, timeout=self.enqueue_timeout)
+        except queue.Full:
+            logger.warning(f"Write-behind queue full ({self._queue.maxsize}), spilling record to disk")
+            self._spill([record])
+            return False
+        self.stats["enqueued"] += 1
+        return True
+
+    def close(self, timeout: float = 10.0):
+        """Flush queued records, spilling whatever is left when the timeout expires"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        leftover = []
+        while True:
+            try:
+                leftover.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if leftover:
+            logger.warning(f"Write-behind shutdown with {len(leftover)} unwritten records, spilling to disk")
+            self._spill(leftover)
+
+    def _run(self):
+        self._replay_spill()
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            unwritten = self._flush(batch)
+            if unwritten:
+                self._spill(unwritten)
+            # The database is back: drain the spill file, at most once per interval
+            elif self._spill_pending and time.monotonic() - self._last_replay >= self.replay_interval:
+                self._replay_spill()
+
+    def _next_batch(self) -> List[Dict]:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        # Linger briefly so concurrent requests share a transaction
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: List[Dict]) -> List[Dict]:
+        """Write a batch; returns the records left unwritten because the database is unavailable"""
+        if self._write(batch):
+            return []
+        # Retry one at a time so a single bad record cannot sink the whole batch
+        for i, record in enumerate(batch):
+            try:
+                self.writer([record])
+            except UNAVAILABLE_ERRORS as e:
+                logger.warning(f"Database unavailable, keeping {len(batch) - i} write-behind records: {e}")
+                return batch[i:]
+            except Exception as e:
+                logger.error(f"Write-behind record rejected, moving it to the dead-letter file: {e}")
+                self._dead_letter({"error": str(e), "record": record})
+                continue
+            self.stats["written"] += 1
+        return []
+
+    def _write(self, batch: List[Dict]) -> bool:
+        for attempt in range(self.write_attempts):
+            try:
+                self.writer(batch)
+            except Exception as e:
+                self.stats["failed_batches"] += 1
+                logger.warning(f"Write-behind batch of {len(batch)} failed (attempt {attempt+1}/{self.write_attempts}): {e}")
+                if attempt + 1 < self.write_attempts and not self._stop.is_set():
+                    time.sleep(0.5 * (2 ** attempt))
+                continue
+            self.stats["written"] += len(batch)
+            self.stats["batches"] += 1
+            return True
+        return False
+
+    def _spill_path(self) -> str:
+        return os.path.join(self.spill_dir, f"pending-{os.getpid()}.jsonl")
+
+    def _dead_letter_path(self) -> str:
+        return os.path.join(self.spill_dir, f"dead-{os.getpid()}.jsonl")
+
+    def _spill(self, records: List[Dict]):
+        try:
+            with self._lock:
+                self._append(self._spill_path(), records)
+                self._spill_pending = True
+            self.stats["spilled"] += len(records)
+        except OSError as e:
+            logger.error(f"Failed to spill {len(records)} write-behind records: {e}")
+
+    def _dead_letter(self, entry: Dict):
+        try:
+            with self._lock:
+                self._append(self._dead_letter_path(), [{**entry, "failed_at": datetime.now(timezone.utc).isoformat()}])
+            self.stats["dead_lettered"] += 1
+        except OSError as e:
+            logger.error(f"Failed to dead-letter write-behind record: {e}")
+
+    def _append(self, path: str, entries: List[Dict]):
+        os.makedirs(self.spill_dir, exist_ok=True)
+        # A crash mid-write leaves a partial last line; start on a fresh one
+        # so only that line is lost, not the record appended after it
+        torn = False
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+        with open(path, "a", encoding="utf-8") as f:
+            if torn:
+                f.write("\n")
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+
+    def _claim_spill_files(self) -> List[str]:
+        """
+        Rename every replayable spill file to ``<name>.replay-<our pid>``. The
+        rename is the claim, so workers never replay the same file twice.
+        Files claimed by a worker that died before finishing are taken over.
+        """
+        pid = os.getpid()
+        claimed = []
+        for path in glob.glob(os.path.join(self.spill_dir, "pending-*.jsonl*")):
+            base, _, owner = path.partition(".replay-")
+            if owner:
+                if not owner.isdigit() or (int(owner) != pid and _pid_alive(int(owner))):
+                    continue
+            elif not path.endswith(".jsonl"):
+                continue
+            target = f"{base}.replay-{pid}"
+            try:
+                with self._lock:
+                    os.rename(path, target)
+            except OSError:
+                continue  # Another worker got it first
+            claimed.append(target)
+        return claimed
+
+    def _read_spill(self, path: str) -> List[Dict]:
+        records = []
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError as e:
+                    logger.error(f"Unreadable line in {os.path.basename(path)}, moving it to the dead-letter file: {e}")
+                    self._dead_letter({"error": str(e), "line": line.rstrip("\n")})
+        return records
+
+    def _replay_spill(self):
+        """Write spilled records from any worker process"""
+        self._spill_pending = False
+        self._last_replay = time.monotonic()
+        for path in self._claim_spill_files():
+            records = self._read_spill(path)
+            for i in range(0, len(records), self.batch_size):
+                unwritten = self._flush(records[i:i + self.batch_size])
+                if unwritten:
+                    self._spill(unwritten + records[i + self.batch_size:])
+                    os.remove(path)
+                    return
+                self.stats["replayed"] += min(self.batch_size, len(records) - i)
+            os.remove(path)
+            logger.info(f"Replayed {len(records)} spilled write-behind records")
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+persistence_queue = PersistenceQueue()
+atexit.register(persistence_queue.close)
@@ -1,5 +1,82 @@
 from app.database import get_db
+from app.config.settings import EXPORT_BATCH_SIZE
+from app.services.counters import stat_counters, claims_key, sources_key, analyses_key
+from app.services.text_search import text_search
+from app.services.aggregates import hourly_aggregates
+from app.models.claim_model import Claim
+from app.models.source import Source
 from sqlalchemy import text
+from datetime import datetime, timedelta, timezone
+import base64
+import json
+import uuid
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class Keyset:
+    """Newest-first sort key for cursor pagination: a timestamp plus a unique tiebreaker"""
+
+    def __init__(self, sort_col, id_col, nullable=False, uuid_ids=False, ranked=False):
+        self.sort_col = sort_col
+        self.id_col = id_col
+        self.nullable = nullable
+        self.uuid_ids = uuid_ids
+        self.ranked = ranked
+
+    def validate(self, sort_value, row_id):
+        """Reject cursor values the columns cannot hold, before they reach the database"""
+        if sort_value is None:
+            valid = self.nullable
+        elif self.ranked:
+            valid = isinstance(sort_value, (int, float)) and not isinstance(sort_value, bool)
+        else:
+            valid = isinstance(sort_value, datetime)
+        if not valid or not isinstance(row_id, str):
+            raise InvalidCursorError("Invalid pagination cursor")
+        if self.uuid_ids:
+            try:
+                row_id = str(uuid.UUID(row_id))
+            except ValueError as e:
+                raise InvalidCursorError("Invalid pagination cursor") from e
+        return sort_value, row_id
+
+    @property
+    def order_by(self):
+        nulls = " NULLS LAST" if self.nullable else ""
+        return f"{self.sort_col} DESC{nulls}, {self.id_col} DESC"
+
+    def after(self, sort_value):
+        """WHERE condition for rows strictly after the cursor position"""
+        if sort_value is None:
+            return f"({self.sort_col} IS NULL AND {self.id_col} < :_cursor_id)"
+        condition = f"({self.sort_col}, {self.id_col}) < (:_cursor_sort, :_cursor_id)"
+        if self.nullable:
+            condition = f"({condition} OR {self.sort_col} IS NULL)"
+        return condition
+
+
+# Mapped columns only: keeps the search_vector column out of responses
+CLAIM_COLUMNS = ", ".join(column.name for column in Claim.__table__.columns)
+SOURCE_COLUMNS = ", ".join(column.name for column in Source.__table__.columns)
+
+CLAIMS_KEYSET = Keyset("created_at", "id")
+SOURCES_KEYSET = Keyset("last_scraped_at", "id", nullable=True, uuid_ids=True)
+ANALYSES_KEYSET = Keyset("a.created_at", "a.id", uuid_ids=True)
+
+
+def search_keyset(match, id_col, uuid_ids=False):
+    """Most relevant first; cursors then carry the rank instead of a timestamp"""
+    return Keyset(match.rank, id_col, uuid_ids=uuid_ids, ranked=True)
+
+
+ANALYSES_FROM = """
+            FROM analyses a
+            JOIN claims c ON a.claim_id = c.id
+            JOIN sources s ON a.source_id = s.id"""
+
 
 class PublicService:
     @staticmethod
@@ -20,6 +97,21 @@ class PublicService:
             cols = result.keys()
             return [dict(zip(cols, row)) for row in result.fetchall()]
 
+    @staticmethod
+    def stream_query(sql, params=None, batch_size=EXPORT_BATCH_SIZE):
+        """
+        Yield the column names, then rows as dicts from a server-side cursor,
+        ``batch_size`` at a time, so memory stays flat however many rows
+        match. The names come first so an export with no rows still has a
+        header. The session is held until the generator is exhausted or closed.
+        """
+        with get_db() as session:
+            result = session.execute(text(sql), params or {}, execution_options={"yield_per": batch_size})
+            cols = list(result.keys())
+            yield cols
+            for row in result:
+                yield dict(zip(cols, row))
+
     @staticmethod
     def get_count(sql, params=None):
         """Get total count for a query"""
@@ -29,6 +121,18 @@ class PublicService:
             row = result.fetchone()
             return row[0] if row else 0
 
+    @staticmethod
+    def get_total(counter, sql, params=None):
+        """Maintained counter when one covers the filters, else COUNT(*) over the query"""
+        if counter is not None:
+            total = stat_counters.get(counter)
+            if total is None and counter in ("claims", "sources", "analyses"):
+                # Counters still being tallied: the planner estimate is close enough for paging
+                total = stat_counters.approximate_total(counter)
+            if total is not None:
+                return total
+        return PublicService.get_count(sql, params)
+
     @staticmethod
     def get_paginated_response(data, total_count, page, limit):
         """Create a standardized paginated response"""
@@ -46,13 +150,89 @@ class PublicService:
         }
 
     @staticmethod
-    def get_all_claims(page=1, limit=10, search=None, category=None, verdict=None):
+    def encode_cursor(sort_value, row_id):
+        if isinstance(sort_value, datetime):
+            sort_value = {"dt": sort_value.isoformat()}
+        raw = json.dumps([sort_value, str(row_id)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor, keyset):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            sort_value, row_id = json.loads(raw)
+            if isinstance(sort_value, dict):
+                sort_value = datetime.fromisoformat(sort_value["dt"])
+        except (ValueError, TypeError, KeyError) as e:
+            raise InvalidCursorError("Invalid pagination cursor") from e
+        return keyset.validate(sort_value, row_id)
+
+    @staticmethod
+    def query_keyset(columns, from_where, params, keyset, cursor, limit):
+        """
+        Seek to the page after ``cursor`` on the keyset index instead of
+        skipping rows with OFFSET, so every page costs the same as the first.
+        An empty cursor starts from the newest row. ``from_where`` must end in
+        a WHERE clause.
+        """
+        full_params = dict(params or {})
+        conditions = ""
+        if cursor:
+            sort_value, row_id = PublicService.decode_cursor(cursor, keyset)
+            conditions = f" AND {keyset.after(sort_value)}"
+            full_params.update({"_cursor_sort": sort_value, "_cursor_id": row_id})
+        full_params["limit"] = limit + 1
+
+        sql = (
+            f"SELECT {columns}, {keyset.sort_col} AS _cursor_sort, {keyset.id_col} AS _cursor_id"
+            f" {from_where}{conditions} ORDER BY {keyset.order_by} LIMIT :limit"
+        )
+        with get_db() as session:
+            result = session.execute(text(sql), full_params)
+            cols = list(result.keys())
+            rows = [dict(zip(cols, row)) for row in result.fetchall()]
+
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_next:
+            next_cursor = PublicService.encode_cursor(rows[-1]["_cursor_sort"], rows[-1]["_cursor_id"])
+        for row in rows:
+            del row["_cursor_sort"], row["_cursor_id"]
+        return {
+            "data": rows,
+            "pagination": {
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "has_next": has_next
+            }
+        }
+
+    @staticmethod
+    def list_page(columns, from_where, params, keyset, page, limit, cursor=None, counter=None):
+        """
+        Offset page (with totals) by default; keyset page when a cursor is given.
+        ``counter`` names the stat counter that matches the filters, if any.
+        """
+        if cursor is not None:
+            return PublicService.query_keyset(columns, from_where, params, keyset, cursor, limit)
+        # Same order as cursor mode; the id tiebreaker keeps offset pages stable too
+        sql = f"SELECT {columns} {from_where} ORDER BY {keyset.order_by}"
+        data = PublicService.query_all(sql, params, page, limit)
+        total_count = PublicService.get_total(counter, sql, params)
+        return PublicService.get_paginated_response(data, total_count, page, limit)
+
+    @staticmethod
+    def get_all_claims(page=1, limit=10, search=None, category=None, verdict=None, cursor=None):
         conditions = []
         params = {}
+        keyset = CLAIMS_KEYSET
         
         if search:
-            conditions.append("text ILIKE :search")
-            params["search"] = f"%{search}%"
+            match = text_search.match("claims", search)
+            conditions.append(match.condition)
+            params.update(match.params)
+            keyset = search_keyset(match, "claims.id")
         
         if category and category != "all":
             conditions.append("category = :category")
@@ -63,85 +243,89 @@ class PublicService:
             params["verdict"] = verdict
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        sql = f"SELECT * FROM claims WHERE {where_clause} ORDER BY created_at DESC"
-        
-        data = PublicService.query_all(sql, params, page, limit)
-        total_count = PublicService.get_count(sql, params)
-        
-        return PublicService.get_paginated_response(data, total_count, page, limit)
+        return PublicService.list_page(
+            CLAIM_COLUMNS, f"FROM claims WHERE {where_clause}", params,
+            keyset, page, limit, cursor,
+            counter=None if search else claims_key(params.get("category"), params.get("verdict"))
+        )
 
     @staticmethod
     def get_claims_count():
-        return PublicService.get_count("SELECT * FROM claims")
+        return PublicService.get_total(claims_key(), "SELECT * FROM claims")
 
     @staticmethod
-    def get_high_confidence_claims(page=1, limit=10):
-        sql = "SELECT * FROM claims WHERE confidence > 0.8 ORDER BY created_at DESC"
-        data = PublicService.query_all(sql, page=page, limit=limit)
-        total_count = PublicService.get_count(sql)
-        return PublicService.get_paginated_response(data, total_count, page, limit)
+    def get_high_confidence_claims(page=1, limit=10, cursor=None):
+        return PublicService.list_page(
+            CLAIM_COLUMNS, "FROM claims WHERE confidence > 0.8", None,
+            CLAIMS_KEYSET, page, limit, cursor,
+            counter="claims:high_confidence"
+        )
 
     @staticmethod
     def get_high_confidence_claims_count():
-        return PublicService.get_count("SELECT * FROM claims WHERE confidence > 0.8")
+        return PublicService.get_total("claims:high_confidence", "SELECT * FROM claims WHERE confidence > 0.8")
 
     @staticmethod
-    def get_claims_by_category(category, page=1, limit=10):
-        sql = "SELECT * FROM claims WHERE category = :category ORDER BY created_at DESC"
-        params = {"category": category}
-        data = PublicService.query_all(sql, params, page=page, limit=limit)
-        total_count = PublicService.get_count(sql, params)
-        return PublicService.get_paginated_response(data, total_count, page, limit)
+    def get_claims_by_category(category, page=1, limit=10, cursor=None):
+        return PublicService.list_page(
+            CLAIM_COLUMNS, "FROM claims WHERE category = :category", {"category": category},
+            CLAIMS_KEYSET, page, limit, cursor,
+            counter=claims_key(category)
+        )
 
     @staticmethod
-    def get_all_sources(page=1, limit=10, search=None, domain=None):
+    def get_all_sources(page=1, limit=10, search=None, domain=None, cursor=None):
         conditions = []
         params = {}
+        keyset = SOURCES_KEYSET
         
         if search:
-            conditions.append("(title ILIKE :search OR domain ILIKE :search OR source_name ILIKE :search)")
-            params["search"] = f"%{search}%"
+            match = text_search.match("sources", search)
+            conditions.append(match.condition)
+            params.update(match.params)
+            keyset = search_keyset(match, "sources.id", uuid_ids=True)
         
         if domain and domain != "all":
             conditions.append("domain = :domain")
             params["domain"] = domain
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        sql = f"SELECT * FROM sources WHERE {where_clause} ORDER BY last_scraped_at DESC NULLS LAST"
-        
-        data = PublicService.query_all(sql, params, page, limit)
-        total_count = PublicService.get_count(sql, params)
-        
-        return PublicService.get_paginated_response(data, total_count, page, limit)
+        return PublicService.list_page(
+            SOURCE_COLUMNS, f"FROM sources WHERE {where_clause}", params,
+            keyset, page, limit, cursor,
+            counter=None if search else sources_key(params.get("domain"))
+        )
 
     @staticmethod
     def get_sources_count():
-        return PublicService.get_count("SELECT * FROM sources")
+        return PublicService.get_total(sources_key(), "SELECT * FROM sources")
 
     @staticmethod
-    def get_sources_by_domain(domain, page=1, limit=10):
-        sql = "SELECT * FROM sources WHERE domain = :domain ORDER BY last_scraped_at DESC NULLS LAST"
-        params = {"domain": domain}
-        data = PublicService.query_all(sql, params, page=page, limit=limit)
-        total_count = PublicService.get_count(sql, params)
-        return PublicService.get_paginated_response(data, total_count, page, limit)
+    def get_sources_by_domain(domain, page=1, limit=10, cursor=None):
+        return PublicService.list_page(
+            SOURCE_COLUMNS, "FROM sources WHERE domain = :domain", {"domain": domain},
+            SOURCES_KEYSET, page, limit, cursor,
+            counter=sources_key(domain)
+        )
 
     @staticmethod
-    def get_all_analyses(page=1, limit=10, search=None, support=None):
+    def get_all_analyses(page=1, limit=10, search=None, support=None, cursor=None):
         conditions = []
         params = {}
+        keyset = ANALYSES_KEYSET
         
         if search:
-            conditions.append("c.text ILIKE :search")
-            params["search"] = f"%{search}%"
+            match = text_search.match("claims", search, alias="c.")
+            conditions.append(match.condition)
+            params.update(match.params)
+            keyset = search_keyset(match, "a.id", uuid_ids=True)
         
         if support and support != "all":
             conditions.append("a.support = :support")
             params["support"] = support
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        sql = f"""
-            SELECT 
+        columns = """
                 a.id AS analysis_id,
                 c.text AS claim_text,
                 c.conclusion,
@@ -150,50 +334,39 @@ class PublicService:
                 a.confidence,
                 a.reason,
                 a.analysis_text,
-                a.created_at
-            FROM analyses a
-            JOIN claims c ON a.claim_id = c.id
-            JOIN sources s ON a.source_id = s.id
-            WHERE {where_clause}
-            ORDER BY a.created_at DESC
-        """
-        
-        data = PublicService.query_all(sql, params, page, limit)
-        total_count = PublicService.get_count(sql, params)
-        
-        return PublicService.get_paginated_response(data, total_count, page, limit)
+                a.created_at"""
+        return PublicService.list_page(
+            columns, f"{ANALYSES_FROM}\n            WHERE {where_clause}", params,
+            keyset, page, limit, cursor,
+            counter=None if search else analyses_key(params.get("support"))
+        )
 
     @staticmethod
     def get_analyses_count():
-        return PublicService.get_count("""
+        return PublicService.get_total(analyses_key(), """
             SELECT a.id FROM analyses a
             JOIN claims c ON a.claim_id = c.id
             JOIN sources s ON a.source_id = s.id
         """)
 
     @staticmethod
-    def get_supported_analyses(page=1, limit=10):
-        sql = """
-            SELECT 
+    def get_supported_analyses(page=1, limit=10, cursor=None):
+        columns = """
                 a.id,
                 c.text AS claim_text,
                 c.conclusion,
                 s.url AS source_url,
                 a.support,
-                a.confidence
-            FROM analyses a
-            JOIN claims c ON a.claim_id = c.id
-            JOIN sources s ON a.source_id = s.id
-            WHERE a.support = 'Supported'
-            ORDER BY a.created_at DESC
-        """
-        data = PublicService.query_all(sql, page=page, limit=limit)
-        total_count = PublicService.get_count(sql)
-        return PublicService.get_paginated_response(data, total_count, page, limit)
+                a.confidence"""
+        return PublicService.list_page(
+            columns, f"{ANALYSES_FROM}\n            WHERE a.support = 'Supported'", None,
+            ANALYSES_KEYSET, page, limit, cursor,
+            counter=analyses_key("Supported")
+        )
 
     @staticmethod
     def get_supported_analyses_count():
-        return PublicService.get_count("""
+        return PublicService.get_total(analyses_key("Supported"), """
             SELECT a.id FROM analyses a
             JOIN claims c ON a.claim_id = c.id
             JOIN sources s ON a.source_id = s.id
@@ -201,38 +374,56 @@ class PublicService:
         """)
 
     @staticmethod
-    def get_latest_analyses(page=1, limit=10):
-        sql = """
-            SELECT 
+    def get_latest_analyses(page=1, limit=10, cursor=None):
+        columns = """
                 a.id,
                 c.text AS claim_text,
                 c.conclusion,
                 s.url AS source_url,
                 a.support,
                 a.confidence,
-                a.created_at
-            FROM analyses a
-            JOIN claims c ON a.claim_id = c.id
-            JOIN sources s ON a.source_id = s.id
-            ORDER BY a.created_at DESC
-        """
-        data = PublicService.query_all(sql, page=page, limit=limit)
-        total_count = PublicService.get_count(sql)
-        return PublicService.get_paginated_response(data, total_count, page, limit)
+                a.created_at"""
+        return PublicService.list_page(
+            columns, f"{ANALYSES_FROM}\n            WHERE 1=1", None,
+            ANALYSES_KEYSET, page, limit, cursor,
+            counter=analyses_key()
+        )
 
     @staticmethod
     def get_latest_analyses_count():
-        return PublicService.get_count("""
+        return PublicService.get_total(analyses_key(), """
             SELECT a.id FROM analyses a
             JOIN claims c ON a.claim_id = c.id
             JOIN sources s ON a.source_id = s.id
-            ORDER BY a.created_at DESC
         """)
 
     @staticmethod
     def get_system_stats():
         """Get comprehensive system statistics"""
         try:
+            counts = stat_counters.get_many([
+                claims_key(), sources_key(), analyses_key(),
+                "claims:high_confidence", analyses_key("Supported")
+            ])
+            if counts is not None:
+                # Totals come from the maintained counters and the 24h window
+                # from the hourly aggregates; neither touches the base tables
+                recent = hourly_aggregates.window_total(analyses_key(), hours=24)
+                if recent is None:
+                    with get_db() as session:
+                        recent = session.execute(
+                            text("SELECT COUNT(*) FROM analyses WHERE created_at >= :since"),
+                            {"since": datetime.now(timezone.utc) - timedelta(hours=24)}
+                        ).scalar()
+                return {
+                    "total_claims": counts[claims_key()],
+                    "total_sources": counts[sources_key()],
+                    "total_analyses": counts[analyses_key()],
+                    "high_confidence_claims": counts["claims:high_confidence"],
+                    "supported_analyses": counts[analyses_key("Supported")],
+                    "recent_analyses": recent or 0
+                }
+
             with get_db() as session:
                 # Get all counts in a single query for efficiency
                 stats_query = """
@@ -276,16 +467,22 @@ class PublicService:
                 "recent_analyses": 0
             }
 
-    # Export methods for CSV (without pagination)
+    @staticmethod
+    def get_stats_series(granularity="hour", hours=24, metrics=None):
+        """Per-hour or per-day counts from the hourly aggregates, or None before their first refresh"""
+        return hourly_aggregates.series(hours, granularity, metrics)
+
+    # Export methods: unpaginated row streams for the export endpoints
     @staticmethod
     def export_claims_csv(search=None, category=None, verdict=None):
-        """Export claims data for CSV without pagination"""
+        """Stream every matching claim row for export"""
         conditions = []
         params = {}
         
         if search:
-            conditions.append("text ILIKE :search")
-            params["search"] = f"%{search}%"
+            match = text_search.match("claims", search)
+            conditions.append(match.condition)
+            params.update(match.params)
         
         if category and category != "all":
             conditions.append("category = :category")
@@ -296,38 +493,40 @@ class PublicService:
             params["verdict"] = verdict
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        sql = f"SELECT * FROM claims WHERE {where_clause} ORDER BY created_at DESC"
+        sql = f"SELECT {CLAIM_COLUMNS} FROM claims WHERE {where_clause} ORDER BY created_at DESC"
         
-        return PublicService.query_all(sql, params, page=1, limit=10000)  # Large limit for export
+        return PublicService.stream_query(sql, params)
 
     @staticmethod
     def export_sources_csv(search=None, domain=None):
-        """Export sources data for CSV without pagination"""
+        """Stream every matching source row for export"""
         conditions = []
         params = {}
         
         if search:
-            conditions.append("(title ILIKE :search OR domain ILIKE :search OR source_name ILIKE :search)")
-            params["search"] = f"%{search}%"
+            match = text_search.match("sources", search)
+            conditions.append(match.condition)
+            params.update(match.params)
         
         if domain and domain != "all":
             conditions.append("domain = :domain")
             params["domain"] = domain
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        sql = f"SELECT * FROM sources WHERE {where_clause} ORDER BY last_scraped_at DESC NULLS LAST"
+        sql = f"SELECT {SOURCE_COLUMNS} FROM sources WHERE {where_clause} ORDER BY last_scraped_at DESC NULLS LAST"
         
-        return PublicService.query_all(sql, params, page=1, limit=10000)  # Large limit for export
+        return PublicService.stream_query(sql, params)
 
     @staticmethod
     def export_analyses_csv(search=None, support=None):
-        """Export analyses data for CSV without pagination"""
+        """Stream every matching analysis row for export"""
         conditions = []
         params = {}
         
         if search:
-            conditions.append("c.text ILIKE :search")
-            params["search"] = f"%{search}%"
+            match = text_search.match("claims", search, alias="c.")
+            conditions.append(match.condition)
+            params.update(match.params)
         
         if support and support != "all":
             conditions.append("a.support = :support")
@@ -352,4 +551,4 @@ class PublicService:
             ORDER BY a.created_at DESC
         """
         
-        return PublicService.query_all(sql, params, page=1, limit=10000)  # Large limit for export
+        return PublicService.stream_query(sql, params)
@@ -1,15 +1,17 @@
 import asyncio
 import time
 import logging
-import re
-from typing import List, Dict, Optional, Tuple
+import threading
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 import httpx
-from selectolax.parser import HTMLParser
 from urllib.parse import urlparse
 from ..scrapers import get_scraper_for_page
-from ..services.google_search_service import GoogleSearchService
+from .search_provider import get_search_provider
+from .article_cache import article_cache
+from ..utils.extraction import extract_content
 from ..utils.logger import logger
-from concurrent.futures import ThreadPoolExecutor
+from ..core.runtime import runtime
+from ..core.extraction_pool import extraction_pool
 from dataclasses import dataclass
 
 @dataclass
@@ -22,7 +24,7 @@ class ScrapeResult:
 
 class ScrapeService:
     def __init__(self):
-        self.search_service = GoogleSearchService()
+        self.search_service = get_search_provider()
         self.max_results = 5
         self.timeout = httpx.Timeout(10.0, connect=4.0)
         self.max_concurrent = 10
@@ -41,24 +43,8 @@ class ScrapeService:
                 "Accept-Language": "en-US,en;q=0.9",
             }
         )
-        self.executor = ThreadPoolExecutor(max_workers=8)
-        self.content_selectors = [
-            "article",
-            "[itemprop='articleBody']",
-            ".article-content",
-            ".post-content",
-            ".entry-content",
-            ".story-body",
-            ".content-body",
-            "main"
-        ]
-        self.boilerplate_patterns = [
-            r'\b(?:Advertisement|Sponsored|Related:|Also Read:|Read more:|Sign up for)\b.*',
-            r'©\s*\d{4}.*',
-            r'All rights reserved.*',
-            r'Terms of Use|Privacy Policy',
-            r'Comments.*'
-        ]
+        self.extractor = extraction_pool
+        self.article_cache = article_cache
 
     async def search_news_async(
         self,
@@ -74,9 +60,7 @@ class ScrapeService:
             # Get search results
             search_time = time.perf_counter()
             mx = min(max_results or self.max_results, 10)
-            search_results = await asyncio.to_thread(
-                self.search_service.search, query, mx
-            )
+            search_results = await self.search_service.search_async(query, mx)
             logger.info(f"Search completed in {time.perf_counter() - search_time:.2f}s")
 
             if not scrape_content:
@@ -84,8 +68,8 @@ class ScrapeService:
 
             # Parallel scraping
             scrape_time = time.perf_counter()
-            urls = [r["url"] for r in search_results if r.get("url")]
-            scraped = await self._parallel_scrape(urls)
+            urls = [r["url"] for r in search_results if r.get("url") and not r.get("content")]
+            scraped = {**self._provided_content(search_results), **await self._parallel_scrape(urls)}
             logger.info(f"Scraping completed in {time.perf_counter() - scrape_time:.2f}s")
 
             # Format results
@@ -98,9 +82,43 @@ class ScrapeService:
             logger.info(f"Total processing time: {time.perf_counter() - start_time:.2f}s")
             return results
 
+    async def search_async(self, query: str, max_results: Optional[int] = None) -> List[Dict]:
+        """Run the search stage only"""
+        mx = min(max_results or self.max_results, 10)
+        return await self.search_service.search_async(query, mx)
+
+    async def iter_scraped(self, search_results: List[Dict]) -> AsyncIterator[Dict]:
+        """Yield articles in completion order as each page finishes scraping"""
+        sem = asyncio.Semaphore(self.max_concurrent)
+
+        async def scrape_task(result: Dict) -> Dict:
+            if result.get("content"):
+                return self._combine_results([result], self._provided_content([result]))[0]
+            async with sem:
+                scraped = await self._scrape_url(result["url"])
+            return self._combine_results([result], {scraped.url: scraped})[0]
+
+        await self.article_cache.prefetch(r.get("url") for r in search_results if not r.get("content"))
+        tasks = [asyncio.ensure_future(scrape_task(r)) for r in search_results if r.get("url")]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early: drop scrapes nobody will read
+            for task in tasks:
+                task.cancel()
+
+    def _provided_content(self, search_results: List[Dict]) -> Dict[str, ScrapeResult]:
+        """Article text the search provider already returned (local index); these pages are not fetched"""
+        return {
+            r["url"]: ScrapeResult(url=r["url"], content=r["content"])
+            for r in search_results if r.get("url") and r.get("content")
+        }
+
     async def _parallel_scrape(self, urls: List[str]) -> Dict[str, ScrapeResult]:
         """Execute parallel scraping with rate limiting"""
         sem = asyncio.Semaphore(self.max_concurrent)
+        await self.article_cache.prefetch(urls)
         
         async def scrape_task(url: str) -> ScrapeResult:
             async with sem:
@@ -111,23 +129,36 @@ class ScrapeService:
         return {result.url: result for result in results}
 
     async def _scrape_url(self, url: str) -> ScrapeResult:
-        """Scrape and process a single URL"""
+        """Scrape and process a single URL, reusing cached text while it is fresh"""
+        cached = self.article_cache.get(url)
+        if cached is not None and self.article_cache.is_fresh(cached):
+            self.article_cache.stats["hits"] += 1
+            return ScrapeResult(url=url, content=cached.content)
+
         try:
-            # Fetch HTML
-            resp = await self.client.get(url, follow_redirects=True)
+            # Fetch HTML, revalidating a stale copy when we hold its validators
+            resp = await self.client.get(
+                url,
+                follow_redirects=True,
+                headers=self.article_cache.conditional_headers(cached)
+            )
+            if resp.status_code == 304 and cached is not None:
+                self.article_cache.touch(cached, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+                return ScrapeResult(url=url, content=cached.content)
             resp.raise_for_status()
             
             # Extract content
-            content = await asyncio.get_running_loop().run_in_executor(
-                self.executor,
-                self._extract_content,
-                resp.text,
-                url
-            )
+            content = await self._extract_content(resp.content, resp.encoding, url)
+            self.article_cache.stats["fetched"] += 1
+            if content:
+                self.article_cache.put(url, content, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
             
             return ScrapeResult(url=url, content=content)
             
         except Exception as e:
+            if cached is not None:
+                logger.warning(f"Failed to refresh {url}, serving cached copy: {str(e)}")
+                return ScrapeResult(url=url, content=cached.content)
             logger.warning(f"Failed to scrape {url}: {str(e)}")
             return ScrapeResult(
                 url=url,
@@ -137,63 +168,14 @@ class ScrapeService:
                 sources=[]
             )
 
-    def _extract_content(self, html: str, url: str) -> str:
-        """Optimized content extraction pipeline"""
-        if not html or len(html) < 100:
-            return ""
-
+    async def _extract_content(self, html: bytes, encoding: Optional[str], url: str) -> str:
+        """Article text of a fetched page (see app/utils/extraction.py), decoded and parsed off the event loop"""
         try:
-            # Generic extraction
-            tree = HTMLParser(html)
-            
-            # Remove unwanted elements
-            self._remove_unwanted_elements(tree)
-            
-            # Try content selectors in order
-            content = self._try_content_selectors(tree)
-            if content:
-                return self._clean_content(content)
-                
-            # Fallback to body
-            if body := tree.body:
-                return self._clean_content(body.text(deep=True, separator="\n"))
-                
-            return ""
+            return await self.extractor.run(extract_content, html, encoding, self.max_content_length)
         except Exception as e:
             logger.error(f"Content extraction error for {url}: {str(e)}")
             return ""
 
-    def _remove_unwanted_elements(self, tree):
-        """Remove non-content elements from DOM"""
-        for tag in ["script", "style", "noscript", "header", 
-                   "footer", "nav", "aside", "form", "iframe"]:
-            for node in tree.css(tag):
-                node.decompose()
-                
-        for cls in ["ad", "sidebar", "related", "comments", 
-                   "newsletter", "social", "share"]:
-            for node in tree.css(f".{cls}"):
-                node.decompose()
-
-    def _try_content_selectors(self, tree) -> Optional[str]:
-        """Try content selectors in priority order"""
-        for selector in self.content_selectors:
-            if node := tree.css_first(selector):
-                text = node.text(deep=True, separator="\n").strip()
-                if len(text) > 200:
-                    return text
-        return None
-
-    def _clean_content(self, text: str) -> str:
-        """Clean and normalize extracted content"""
-        # Remove boilerplate
-        for pattern in self.boilerplate_patterns:
-            text = re.sub(pattern, '', text, flags=re.I)
-            
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text[:self.max_content_length]
-
     def _format_search_results(self, search_results: List[Dict]) -> List[Dict]:
         """Format search results without scraping content"""
         return [{
@@ -228,8 +210,22 @@ class ScrapeService:
     async def close(self):
         """Cleanup resources"""
         await self.client.aclose()
-        self.executor.shutdown()
+        await self.extractor.close()
 
     def _calculate_verdict(self, sources: List[Dict]) -> Tuple[str, float]:
         # ... logic ...
-        return verdict, confidence
\ No newline at end of file
+        return verdict, confidence
+
+
+_shared_service: Optional[ScrapeService] = None
+_shared_lock = threading.Lock()
+
+
+def get_scrape_service() -> ScrapeService:
+    """Process-wide ScrapeService; its HTTP client and extraction pools are closed with the runtime"""
+    global _shared_service
+    with _shared_lock:
+        if _shared_service is None:
+            _shared_service = ScrapeService()
+            runtime.on_shutdown(_shared_service.close)
+        return _shared_service
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from ..config.settings import SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL, SEARCH_CACHE_STALE_TTL, SEARCH_CACHE_PATH
+from ..utils.logger import logger
+
+# Expired rows are purged from the persistent tier once every this many writes
+PURGE_EVERY = 256
+
+
+@dataclass
+class CachedSearch:
+    results: List[Dict]
+    stored_at: float
+
+
+class SqliteSearchStore:
+    """
+    Persistent tier of the search cache: one row per query key in a local
+    SQLite file, shared by every worker on the host and kept across restarts.
+    Any object with the same ``get``/``put``/``purge``/``clear`` methods can
+    be passed to ``SearchCache`` instead.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_results "
+                "(key TEXT PRIMARY KEY, results TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[CachedSearch]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT results, stored_at FROM search_results WHERE key = ?", (key,)
+            ).fetchone()
+        return CachedSearch(json.loads(row[0]), row[1]) if row else None
+
+    def put(self, key: str, entry: CachedSearch):
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO search_results (key, results, stored_at) VALUES (?, ?, ?)",
+                (key, json.dumps(entry.results, ensure_ascii=False), entry.stored_at)
+            )
+
+    def purge(self, older_than: float) -> int:
+        with self._lock:
+            return self._connect().execute(
+                "DELETE FROM search_results WHERE stored_at < ?", (older_than,)
+            ).rowcount
+
+    def clear(self):
+        with self._lock:
+            self._connect().execute("DELETE FROM search_results")
+
+
+class SearchCache:
+    """
+    Search results keyed by query: a size-bounded in-process LRU in front of
+    an optional persistent store.
+
+    Entries younger than ``ttl`` are fresh. For ``stale_ttl`` seconds after
+    that they are still returned, and the caller is expected to refresh them
+    in the background (stale-while-revalidate), so a hot query never waits on
+    the search API. Older entries are dropped.
+    """
+
+    def __init__(self, max_size: int = SEARCH_CACHE_SIZE, ttl: int = SEARCH_CACHE_TTL,
+                 stale_ttl: int = SEARCH_CACHE_STALE_TTL, store=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.store = store
+        self._entries: "OrderedDict[str, CachedSearch]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0,
+                      "expired": 0, "store_hits": 0, "store_errors": 0}
+
+    def is_fresh(self, entry: CachedSearch) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def _usable(self, entry: CachedSearch) -> bool:
+        return time.time() - entry.stored_at < self.ttl + self.stale_ttl
+
+    def get(self, key: str) -> Optional[CachedSearch]:
+        """Fresh or stale entry for ``key``, or None on a miss"""
+        entry = self._lookup(key)
+        if entry is None and self.store is not None:
+            entry = self._load(key)
+        return self._count(entry)
+
+    async def get_async(self, key: str) -> Optional[CachedSearch]:
+        """``get`` for event loop callers: a memory miss reads the store on a worker thread"""
+        entry = self._lookup(key)
+        if entry is None and self.store is not None:
+            entry = await asyncio.to_thread(self._load, key)
+        return self._count(entry)
+
+    def put(self, key: str, results: List[Dict]) -> CachedSearch:
+        entry = CachedSearch(results, time.time())
+        self._remember(key, entry)
+        if self.store is not None:
+            self._save(key, entry)
+        return entry
+
+    async def put_async(self, key: str, results: List[Dict]) -> CachedSearch:
+        """``put`` for event loop callers: the store is written on a worker thread"""
+        entry = CachedSearch(results, time.time())
+        self._remember(key, entry)
+        if self.store is not None:
+            await asyncio.to_thread(self._save, key, entry)
+        return entry
+
+    def _lookup(self, key: str) -> Optional[CachedSearch]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._usable(entry):
+                    self._entries.move_to_end(key)
+                else:
+                    del self._entries[key]
+                    self.stats["expired"] += 1
+                    entry = None
+        return entry
+
+    def _load(self, key: str) -> Optional[CachedSearch]:
+        try:
+            entry = self.store.get(key)
+        except Exception as e:
+            self.stats["store_errors"] += 1
+            logger.warning(f"Search cache store lookup failed: {e}")
+            return None
+        if entry is None or not self._usable(entry):
+            return None
+        self.stats["store_hits"] += 1
+        self._remember(key, entry)
+        return entry
+
+    def _save(self, key: str, entry: CachedSearch):
+        try:
+            self.store.put(key, entry)
+            self._writes += 1
+            if self._writes % PURGE_EVERY == 0:
+                self.store.purge(time.time() - self.ttl - self.stale_ttl)
+        except Exception as e:
+            self.stats["store_errors"] += 1
+            logger.warning(f"Search cache store write failed: {e}")
+
+    def _count(self, entry: Optional[CachedSearch]) -> Optional[CachedSearch]:
+        if entry is None:
+            self.stats["misses"] += 1
+        elif self.is_fresh(entry):
+            self.stats["hits"] += 1
+        else:
+            self.stats["stale_hits"] += 1
+        return entry
+
+    def _remember(self, key: str, entry: CachedSearch):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            self.store.clear()
+
+
+search_cache = SearchCache(store=SqliteSearchStore(SEARCH_CACHE_PATH) if SEARCH_CACHE_PATH else None)
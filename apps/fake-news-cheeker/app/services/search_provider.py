@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from ..config.settings import GOOGLE_API_KEY, GOOGLE_CX, SEARCH_PROVIDER
+from ..core.runtime import runtime
+
+PROVIDERS = ("google", "local")
+
+
+class SearchProvider(ABC):
+    """
+    Source of candidate articles for a claim. ``search_async`` returns
+    ``[{"url", "title", "snippet", "date"}, ...]`` best match first. A
+    provider that already holds the article text also sets ``content``, and
+    ScrapeService uses it instead of fetching the page.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def search_async(self, query: str, max_results: int = 3, lang: str = None) -> List[Dict]:
+        ...
+
+    def search(self, query: str, max_results: int = 3, lang: str = None) -> List[Dict]:
+        """Blocking facade over ``search_async`` for synchronous callers"""
+        return runtime.run(self.search_async(query, max_results, lang))
+
+
+def get_search_provider(name: str = SEARCH_PROVIDER) -> SearchProvider:
+    """Shared provider named by SEARCH_PROVIDER; "auto" falls back to the local index without Google credentials"""
+    if name == "auto":
+        name = "google" if GOOGLE_API_KEY and GOOGLE_CX else "local"
+    if name == "google":
+        from .google_search_service import google_search
+        return google_search
+    if name == "local":
+        from .local_search import local_search
+        return local_search
+    raise ValueError(f"Unknown search provider {name!r}, expected one of {', '.join(PROVIDERS)} or auto")
@@ -0,0 +1,86 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from sqlalchemy import text
+from ..config.settings import SEARCH_LANGUAGES
+from ..database import engine
+from ..utils.logger import logger
+
+# Columns matched by the public search filter, per table
+SEARCHABLE = {
+    "claims": ("text",),
+    "sources": ("title", "domain", "source_name"),
+}
+
+
+@dataclass
+class SearchMatch:
+    """SQL fragments for one search term: a WHERE condition and a relevance score (higher is better)"""
+    condition: str
+    rank: str
+    params: Dict = field(default_factory=dict)
+
+
+class TextSearch:
+    """
+    Relevance-ranked full-text search for the public listing filters.
+
+    The indexes come from migration 0003. On Postgres each searchable table
+    has a generated ``search_vector`` column with a GIN index. The vector
+    combines the ``simple`` config, which matches exact tokens in any
+    language, with a stemming config for each of ``SEARCH_LANGUAGES`` the
+    server has in pg_ts_config. On SQLite (local/dev), external content
+    FTS5 tables are kept in sync by triggers. Other backends fall back to
+    ILIKE.
+    """
+
+    def __init__(self, languages: Optional[List[str]] = None, dialect: Optional[str] = None):
+        languages = SEARCH_LANGUAGES if languages is None else languages
+        self.languages = [lang for lang in languages if lang != "simple"]
+        self.dialect = dialect or engine.dialect.name
+        self._configs: Optional[List[str]] = None
+
+    @property
+    def configs(self) -> List[str]:
+        """'simple' plus the requested languages the Postgres server has a text search config for"""
+        if self._configs is None:
+            self._configs = self.available_configs(engine)
+        return self._configs
+
+    def available_configs(self, bind) -> List[str]:
+        with bind.connect() as conn:
+            installed = set(conn.execute(
+                text("SELECT cfgname FROM pg_ts_config WHERE cfgname = ANY(:names)"),
+                {"names": self.languages}
+            ).scalars())
+        missing = [lang for lang in self.languages if lang not in installed]
+        if missing:
+            logger.warning(f"No Postgres text search config for {', '.join(missing)}; searching without it")
+        return ["simple", *[lang for lang in self.languages if lang in installed]]
+
+    def match(self, table: str, search: str, alias: Optional[str] = None) -> SearchMatch:
+        alias = f"{table}." if alias is None else alias
+        if self.dialect == "postgresql":
+            query = " || ".join(f"websearch_to_tsquery('{config}', :search)" for config in self.configs)
+            return SearchMatch(
+                f"{alias}search_vector @@ ({query})",
+                f"ts_rank({alias}search_vector, ({query}))::float8",
+                {"search": search}
+            )
+        if self.dialect == "sqlite":
+            tokens = re.findall(r"\w+", search)
+            if not tokens:
+                return SearchMatch("1=0", "0")
+            # Quoted prefix terms: user input cannot inject FTS5 query syntax
+            fts_query = " ".join('"{}"*'.format(token.replace('"', '""')) for token in tokens)
+            fts = f"{table}_fts"
+            return SearchMatch(
+                f"{alias}rowid IN (SELECT rowid FROM {fts} WHERE {fts} MATCH :search)",
+                f"coalesce((SELECT -bm25({fts}) FROM {fts} WHERE {fts} MATCH :search AND rowid = {alias}rowid), 0)",
+                {"search": fts_query}
+            )
+        columns = " OR ".join(f"{alias}{column} ILIKE :search" for column in SEARCHABLE[table])
+        return SearchMatch(f"({columns})", "0", {"search": f"%{search}%"})
+
+
+text_search = TextSearch()
@@ -0,0 +1,128 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from ..config.settings import VERDICT_CACHE_SIZE, VERDICT_CACHE_DEFAULT_TTL, VERDICT_CACHE_TTLS
+from ..database import get_db
+from ..models.claim_model import Claim
+from ..models.source import Source
+from ..models.analysis import Analysis
+from ..utils.logger import logger
+
+
+class VerdictCache:
+    """Claim verdicts keyed by fingerprint: in-process LRU in front of the claims table"""
+
+    def __init__(self, max_size: int = VERDICT_CACHE_SIZE, ttls: Optional[Dict[str, int]] = None,
+                 default_ttl: int = VERDICT_CACHE_DEFAULT_TTL):
+        self.max_size = max_size
+        self.ttls = ttls if ttls is not None else VERDICT_CACHE_TTLS
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "db_hits": 0, "misses": 0}
+
+    def ttl_for(self, category: Optional[str]) -> int:
+        return self.ttls.get(category or "general", self.default_ttl)
+
+    def get(self, fingerprint: str) -> Optional[Dict]:
+        """Return a fresh verdict from memory, falling back to the claims table"""
+        result = self._get_memory(fingerprint)
+        if result is not None:
+            self.stats["memory_hits"] += 1
+            return result
+
+        try:
+            result = self._load_from_db(fingerprint)
+        except Exception as e:
+            logger.warning(f"Verdict cache DB lookup failed: {e}")
+            result = None
+
+        if result is None:
+            self.stats["misses"] += 1
+        else:
+            self.stats["db_hits"] += 1
+        return result
+
+    def put(self, fingerprint: str, result: Dict, created_at: Optional[float] = None):
+        expires_at = (created_at or time.time()) + self.ttl_for(result.get("category"))
+        if expires_at <= time.time():
+            return
+        with self._lock:
+            self._entries[fingerprint] = (expires_at, result)
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, fingerprint: str):
+        with self._lock:
+            self._entries.pop(fingerprint, None)
+
+    def _get_memory(self, fingerprint: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.time():
+                del self._entries[fingerprint]
+                return None
+            self._entries.move_to_end(fingerprint)
+            return result
+
+    def _load_from_db(self, fingerprint: str) -> Optional[Dict]:
+        with get_db() as db:
+            claim = (
+                db.query(Claim)
+                .filter(Claim.fingerprint == fingerprint)
+                .order_by(Claim.created_at.desc())
+                .first()
+            )
+            if claim is None or claim.created_at is None:
+                return None
+
+            created_at = claim.created_at
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            age = (datetime.now(timezone.utc) - created_at).total_seconds()
+            if age >= self.ttl_for(claim.category):
+                return None
+
+            rows = (
+                db.query(Analysis, Source)
+                .join(Source, Analysis.source_id == Source.id)
+                .filter(Analysis.claim_id == uuid.UUID(str(claim.id)))
+                .all()
+            )
+            result = self._build_result(claim, rows)
+
+        self.put(fingerprint, result, created_at=created_at.timestamp())
+        return result
+
+    def _build_result(self, claim: Claim, rows: List[Tuple[Analysis, Source]]) -> Dict:
+        sources = [{
+            "url": source.url,
+            "title": source.title or "",
+            "snippet": source.snippet or "",
+            "content": source.content or "",
+            "source": source.source_name,
+            "relevant": analysis.support not in ("Unknown", "Uncertain"),
+            "support": analysis.support,
+            "confidence": analysis.confidence,
+            "reason": analysis.reason,
+        } for analysis, source in rows]
+        return {
+            "status": "success",
+            "claim_id": claim.id,
+            "verdict": claim.verdict,
+            "confidence": claim.confidence,
+            "explanation": claim.explanation,
+            "conclusion": claim.conclusion,
+            "category": claim.category,
+            "sources": sources,
+        }
+
+
+verdict_cache = VerdictCache()
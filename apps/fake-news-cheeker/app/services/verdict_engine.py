@@ -0,0 +1,57 @@
+from typing import Dict, List, Optional, Tuple
+from .analyze_service import AnalyzeService
+
+
+class IncrementalVerdict:
+    """
+    Tracks per-source analyses as they complete and reports when the final
+    verdict can no longer change, so outstanding work can be cancelled.
+
+    The verdict is settled when the authoritative-source override fires, or
+    when the weighted support stays in the same verdict band whether every
+    remaining source turns out fully supporting or fully refuting at maximum
+    weight. Only a verdict in the True band can settle that way: the model
+    may flag any source authoritative, so every remaining source could still
+    trigger the override and turn a lower verdict into True.
+    """
+
+    def __init__(self, analyzer: AnalyzeService, total: int):
+        self.analyzer = analyzer
+        self.total = total
+        self.results: List[Dict] = []
+        self.override_fired = False
+        self._max_weight = max(analyzer.SOURCE_CREDIBILITY.values())
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.total - len(self.results))
+
+    def add(self, result: Dict):
+        self.results.append(result)
+        if not self.override_fired:
+            relevant = self.analyzer._filter_and_weight_sources([result])
+            self.override_fired = bool(relevant) and self.analyzer._triggers_override(relevant[0])
+
+    def is_decided(self) -> bool:
+        if self.override_fired or self.remaining == 0:
+            return True
+
+        bounds = self.support_bounds()
+        if bounds is None:
+            return False
+        low, high = bounds
+        return self.analyzer._verdict_label(low) == self.analyzer._verdict_label(high) == "True"
+
+    def support_bounds(self) -> Optional[Tuple[float, float]]:
+        """Range of weighted support reachable once the remaining sources are in"""
+        relevant = self.analyzer._filter_and_weight_sources(self.results)
+        weights = [self.analyzer._source_weight(s["source"]) * s["temporal_weight"] for s in relevant]
+        total_weight = sum(weights)
+        if total_weight == 0:
+            return None
+        support = sum(
+            w * self.analyzer.SUPPORT_SCORES.get(s["support"], 0.0) for w, s in zip(weights, relevant)
+        )
+        # Temporal weights never exceed 1.0, so a source weighs at most its credibility
+        extra = self.remaining * self._max_weight
+        return support / (total_weight + extra), (support + extra) / (total_weight + extra)
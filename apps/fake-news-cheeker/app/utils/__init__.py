@@ -1,7 +1,7 @@
-
 from .logger import logger
-from .cleaner import clean_text
+from .cleaner import clean_text, claim_fingerprint
+from .sse import format_sse
 
 
 
-__all__ = ["logger", "clean_text"]
+__all__ = ["logger", "clean_text", "claim_fingerprint", "format_sse"]
@@ -1,6 +1,11 @@
 import re
+import hashlib
 
 def clean_text(text: str) -> str:
     text = text.lower()
     text = re.sub(r'[^\w\s]', '', text)
     return re.sub(r'\s+', ' ', text).strip()
+
+def claim_fingerprint(text: str) -> str:
+    """Stable key for a claim: identical after case, punctuation and whitespace normalization"""
+    return hashlib.sha256(clean_text(text).encode("utf-8")).hexdigest()
@@ -0,0 +1,71 @@
+import csv
+import io
+import zlib
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+EXPORT_FORMATS = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+CHUNK_SIZE = 64 * 1024
+
+
+def export_chunks(rows: Iterable[Union[List[str], Dict]], fmt: str, dumps: Callable[[Any], str],
+                  filters: Optional[Dict] = None) -> Iterator[str]:
+    """
+    Encode rows as they arrive, yielding roughly CHUNK_SIZE pieces. ``rows``
+    starts with the column names, as PublicService.stream_query yields them.
+    ``json`` keeps the ``{"data": [...], "filters": {...}}`` shape of the
+    original export endpoints.
+    """
+    rows = iter(rows)
+    columns = next(rows, [])
+    buffer = io.StringIO()
+    if fmt == "csv":
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(_csv_value(value) for value in row.values())
+            if buffer.tell() >= CHUNK_SIZE:
+                yield _drain(buffer)
+    elif fmt == "ndjson":
+        for row in rows:
+            buffer.write(dumps(row) + "\n")
+            if buffer.tell() >= CHUNK_SIZE:
+                yield _drain(buffer)
+    else:
+        buffer.write('{"data":[')
+        for i, row in enumerate(rows):
+            buffer.write(("," if i else "") + dumps(row))
+            if buffer.tell() >= CHUNK_SIZE:
+                yield _drain(buffer)
+        buffer.write('],"filters":' + dumps(filters or {}) + "}")
+    if buffer.tell():
+        yield _drain(buffer)
+
+
+def gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _drain(buffer: io.StringIO) -> str:
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
@@ -0,0 +1,113 @@
+import re
+from typing import Optional
+from selectolax.parser import HTMLParser
+
+# Removed with their whole subtree before any text is read
+UNWANTED_TAGS = ("script", "style", "noscript", "header", "footer", "nav", "aside", "form", "iframe")
+UNWANTED_CLASSES = ("ad", "sidebar", "related", "comments", "newsletter", "social", "share")
+
+# Article containers, best first; the first one holding enough text wins
+CONTENT_SELECTORS = (
+    "article",
+    "[itemprop='articleBody']",
+    ".article-content",
+    ".post-content",
+    ".entry-content",
+    ".story-body",
+    ".content-body",
+    "main",
+)
+MIN_CONTENT_CHARS = 200
+
+# Applied in order, each to the output of the previous one (a later
+# pattern can span text an earlier one left, e.g. "©\n2024"). Each pattern
+# comes with the lowercased words every one of its matches starts with.
+BOILERPLATE = (
+    (r"\b(?:Advertisement|Sponsored|Related:|Also Read:|Read more:|Sign up for)\b.*",
+     ("advertisement", "sponsored", "related:", "also read:", "read more:", "sign up for")),
+    (r"©\s*\d{4}.*", ("©",)),
+    (r"All rights reserved.*", ("all rights reserved",)),
+    (r"Terms of Use|Privacy Policy", ("terms of use", "privacy policy")),
+    (r"Comments.*", ("comments",)),
+)
+
+MAX_CONTENT_CHARS = 8000
+
+# All unwanted nodes are found in a single pass over the tree
+_UNWANTED_SELECTOR = ", ".join([*UNWANTED_TAGS, *(f".{cls}" for cls in UNWANTED_CLASSES)])
+_BOILERPLATE = [(re.compile(pattern, re.I), triggers) for pattern, triggers in BOILERPLATE]
+_WHITESPACE = re.compile(r"\s+")
+
+
+def extract_content(html: str, max_length: int = MAX_CONTENT_CHARS) -> str:
+    """Main article text of an HTML page, boilerplate removed and whitespace collapsed"""
+    if not html or len(html) < 100:
+        return ""
+    tree = HTMLParser(html)
+
+    # Matches come grouped by selector, not in document order, so a node may
+    # already sit inside a removed subtree: remove() only unlinks and is safe
+    # in any order, where decompose() would free it
+    for node in tree.css(_UNWANTED_SELECTOR):
+        node.remove()
+
+    text = _content_text(tree)
+    if text is None:
+        body = tree.body
+        if body is None:
+            return ""
+        text = body.text(deep=True, separator="\n")
+    return clean_content(text, max_length)
+
+
+def _content_text(tree: HTMLParser) -> Optional[str]:
+    """Text of the first container, by selector priority, holding enough of it"""
+    for selector in CONTENT_SELECTORS:
+        node = tree.css_first(selector)
+        if node is not None:
+            text = node.text(deep=True, separator="\n").strip()
+            if len(text) > MIN_CONTENT_CHARS:
+                return text
+    return None
+
+
+def clean_content(text: str, max_length: int = MAX_CONTENT_CHARS) -> str:
+    return _WHITESPACE.sub(" ", strip_boilerplate(text)).strip()[:max_length]
+
+
+def strip_boilerplate(text: str) -> str:
+    """
+    Remove the BOILERPLATE patterns, in order. Same result as one
+    ``re.sub(..., flags=re.I)`` per pattern, but each pattern is only tried
+    at offsets where ``str.find`` located one of its trigger words: a
+    case-insensitive pattern gets no literal-prefix scan from ``re`` and
+    would otherwise be attempted at every offset of the text.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):  # A case mapping changed the length: offsets would not line up
+        for pattern, _ in _BOILERPLATE:
+            text = pattern.sub("", text)
+        return text
+
+    for pattern, triggers in _BOILERPLATE:
+        starts = set()
+        for trigger in triggers:
+            at = lowered.find(trigger)
+            while at != -1:
+                starts.add(at)
+                at = lowered.find(trigger, at + 1)
+        if not starts:
+            continue
+        spans, end = [], 0
+        for start in sorted(starts):
+            if start < end:
+                continue
+            match = pattern.match(text, start)
+            if match:
+                spans.append((end, start))
+                end = match.end()
+        if spans:
+            # The lowercased copy is cut at the same offsets so it stays aligned
+            text = "".join([*(text[a:b] for a, b in spans), text[end:]])
+            lowered = "".join([*(lowered[a:b] for a, b in spans), lowered[end:]])
+    return text
@@ -0,0 +1,37 @@
+from typing import Any, FrozenSet, Optional
+from ..config.settings import CONTENT_PREVIEW_CHARS
+
+# Fields trimmed from API responses unless requested by name
+BULKY_FIELDS = frozenset({"content"})
+
+
+def requested_fields(include: Optional[str]) -> FrozenSet[str]:
+    """Parse an ``include=content,...`` query value"""
+    return frozenset(field.strip() for field in (include or "").split(",") if field.strip())
+
+
+def shape(data: Any, include: FrozenSet[str] = frozenset(), limit: int = CONTENT_PREVIEW_CHARS) -> Any:
+    """
+    Copy of ``data`` with bulky text fields cut to a ``limit``-character
+    preview (dropped when ``limit`` is 0), except those named in ``include``.
+    Only dicts and lists are walked; the input is not modified.
+    """
+    trimmed = BULKY_FIELDS - include
+    if not trimmed:
+        return data
+    return _shape(data, trimmed, limit)
+
+
+def _shape(data: Any, trimmed: FrozenSet[str], limit: int) -> Any:
+    if isinstance(data, dict):
+        shaped = {}
+        for key, value in data.items():
+            if key in trimmed and isinstance(value, str):
+                if limit:
+                    shaped[key] = value if len(value) <= limit else value[:limit] + "…"
+            else:
+                shaped[key] = _shape(value, trimmed, limit)
+        return shaped
+    if isinstance(data, list):
+        return [_shape(item, trimmed, limit) for item in data]
+    return data
@@ -0,0 +1,7 @@
+from typing import Any
+from ..core.json_provider import dumps
+
+def format_sse(event: str, data: Any) -> str:
+    """Encode one Server-Sent Events message"""
+    payload = dumps(data)
+    return f"event: {event}\ndata: {payload}\n\n"
@@ -0,0 +1,10 @@
+"""
+ASGI entry point.
+
+    gunicorn -c gunicorn.conf.py asgi:app   # production
+    uvicorn asgi:app --port 5000            # single worker
+"""
+from main import create_app
+from app.asgi import create_asgi_app
+
+app = create_asgi_app(create_app())
@@ -0,0 +1,17 @@
+import multiprocessing
+import os
+
+# Each uvicorn worker runs one event loop that serves many verifications at
+# once, so a few workers per host are enough
+bind = os.getenv("BIND", "0.0.0.0:5000")
+workers = int(os.getenv("WEB_CONCURRENCY", min(4, multiprocessing.cpu_count())))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Verifications stream for as long as scraping and the LLM take
+timeout = int(os.getenv("WORKER_TIMEOUT", 180))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -3,23 +3,39 @@ from flask_cors import CORS
 from dotenv import load_dotenv
 
 from app.database import init_db
-from app.routes import claim_bp, search_bp, analyze_bp
-from app.routes.public_routes import public_bp
+from app.routes import public_bp
+from app.services.claim_index import claim_index
+from app.services.counters import stat_counters
+from app.services.aggregates import hourly_aggregates
+from app.services.persistence import persistence_queue
+from app.core.json_provider import init_json
+from app.core.extraction_pool import extraction_pool
 
 def create_app():
     # Load environment variables
     load_dotenv()
     # Initialize database
     init_db()
+    # Load recent claims into the near-duplicate index without blocking startup
+    claim_index.build_in_background()
+    # First deploy only: tally existing rows into the stat counters
+    stat_counters.ensure_initialized_in_background()
+    # Keep the hourly dashboard aggregates current
+    hourly_aggregates.start_refresher()
+    # Start the write-behind worker now so records spilled by an earlier run
+    # are replayed without waiting for the first verification
+    persistence_queue.start()
+    # Spawn the extraction worker processes before the first large page
+    extraction_pool.start()
     # Create Flask app
     app = Flask(__name__)
+    # orjson encoder for every jsonify response, when installed
+    init_json(app)
     # Enable CORS
     CORS(app)
 
-    # Register blueprints
-    app.register_blueprint(claim_bp)
-    app.register_blueprint(search_bp)
-    app.register_blueprint(analyze_bp)
+    # Register blueprints. The claim, search and analysis APIs are served by
+    # the ASGI app in front of this one (see asgi.py and app/asgi)
     app.register_blueprint(public_bp)
 
     # Health check endpoint
@@ -30,6 +46,8 @@ def create_app():
     return app
 
 if __name__ == '__main__':
-    # Always run this with: python -m main
-    app = create_app()
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Development server for the whole API (python main.py). The Flask app
+    # alone only serves /public and /health, so this runs the ASGI entry
+    # point, with the same routing as gunicorn.conf.py in production
+    import uvicorn
+    uvicorn.run("asgi:app", host='0.0.0.0', port=5000, reload=True)
@@ -0,0 +1,46 @@
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import text
+from app.database import Base, DATABASE_URL, engine
+import app.models  # noqa: F401  (registers the tables on Base.metadata)
+
+config = context.config
+
+# The app configures its own logging when it runs the migrations on startup
+if config.config_file_name is not None and not config.attributes.get("embedded"):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# Arbitrary key shared by every process: only one worker migrates at a time
+MIGRATION_LOCK_ID = 7_241_905
+
+
+def run_migrations_offline():
+    """Emit the SQL instead of running it (`alembic upgrade head --sql`)"""
+    context.configure(url=DATABASE_URL, target_metadata=target_metadata, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    with engine.connect() as connection:
+        postgres = connection.dialect.name == "postgresql"
+        if postgres:
+            # Session-level lock: it survives the commits of autocommit blocks
+            connection.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+            connection.commit()
+        try:
+            context.configure(connection=connection, target_metadata=target_metadata)
+            with context.begin_transaction():
+                context.run_migrations()
+        finally:
+            if postgres:
+                connection.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+                connection.commit()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,103 @@
+"""Baseline schema
+
+Databases created before migrations existed (by ``create_all`` plus
+ad-hoc ALTERs) already hold some or all of this, so every table, column
+and index is only created when missing.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def claims_columns():
+    return [
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("verdict", sa.String(20), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=False),
+        sa.Column("explanation", sa.Text(), nullable=False),
+        sa.Column("conclusion", sa.Text(), nullable=False),
+        sa.Column("category", sa.String(50), nullable=False),
+        sa.Column("fingerprint", sa.String(64)),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    ]
+
+
+def sources_columns():
+    return [
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("url", sa.Text(), nullable=False, unique=True),
+        sa.Column("domain", sa.String(255), nullable=False),
+        sa.Column("title", sa.Text()),
+        sa.Column("snippet", sa.Text()),
+        sa.Column("content", sa.Text()),
+        sa.Column("published_date", sa.DateTime(timezone=True)),
+        sa.Column("source_name", sa.String(100), nullable=False),
+        sa.Column("credibility_score", sa.Float()),
+        sa.Column("last_scraped_at", sa.DateTime(timezone=True)),
+        sa.Column("etag", sa.Text()),
+        sa.Column("last_modified", sa.String(64)),
+    ]
+
+
+def analyses_columns():
+    return [
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("claim_id", UUID(as_uuid=True), sa.ForeignKey("claims.id"), nullable=False),
+        sa.Column("source_id", UUID(as_uuid=True), sa.ForeignKey("sources.id"), nullable=False),
+        sa.Column("support", sa.String(20), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=False),
+        sa.Column("analysis_text", sa.Text()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    ]
+
+
+def stat_counters_columns():
+    return [
+        sa.Column("name", sa.String(255), primary_key=True),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+    ]
+
+
+# Creation order respects the analyses foreign keys
+TABLES = [
+    ("claims", claims_columns),
+    ("sources", sources_columns),
+    ("analyses", analyses_columns),
+    ("stat_counters", stat_counters_columns),
+]
+
+
+def upgrade():
+    if op.get_context().as_sql:
+        # Offline SQL script: nothing to inspect, assume an empty database
+        existing, inspector = set(), None
+    else:
+        inspector = sa.inspect(op.get_bind())
+        existing = set(inspector.get_table_names())
+    for name, columns in TABLES:
+        if name not in existing:
+            op.create_table(name, *columns())
+            continue
+        # Columns added to the models after the table was first created
+        present = {column["name"] for column in inspector.get_columns(name)}
+        for column in columns():
+            if column.name not in present:
+                op.add_column(name, column)
+
+    op.create_index("ix_claims_fingerprint", "claims", ["fingerprint"], if_not_exists=True)
+
+
+def downgrade():
+    for name, _ in reversed(TABLES):
+        op.drop_table(name)
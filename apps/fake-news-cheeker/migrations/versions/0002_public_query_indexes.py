@@ -0,0 +1,64 @@
+"""Indexes for the public listing, filter and stats queries
+
+Each index matches one PublicService access path: the filter columns
+first, then the (sort, id) keyset so listings and cursor pages are read
+in index order. Partial indexes cover the fixed filters of the
+high-confidence and supported listings. On Postgres they are built
+CONCURRENTLY so writes continue during the migration.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def indexes(dialect):
+    # Sources sort "last_scraped_at DESC NULLS LAST"; a plain backward scan
+    # on Postgres would put NULLs first. SQLite sorts NULLs lowest, so its
+    # plain index already matches.
+    if dialect == "postgresql":
+        scraped = [sa.text("last_scraped_at DESC NULLS LAST"), sa.text("id DESC")]
+    else:
+        scraped = ["last_scraped_at", "id"]
+    return [
+        # /public/claims
+        ("ix_claims_created_at", "claims", ["created_at", "id"], None),
+        ("ix_claims_category_created_at", "claims", ["category", "created_at", "id"], None),
+        ("ix_claims_verdict_created_at", "claims", ["verdict", "created_at", "id"], None),
+        ("ix_claims_high_confidence", "claims", ["created_at", "id"], "confidence > 0.8"),
+        # /public/sources
+        ("ix_sources_last_scraped_at", "sources", scraped, None),
+        ("ix_sources_domain_last_scraped_at", "sources", ["domain", *scraped], None),
+        # /public/analyses, the claim/source joins and the 24h stats window
+        ("ix_analyses_claim_id", "analyses", ["claim_id"], None),
+        ("ix_analyses_source_id", "analyses", ["source_id"], None),
+        ("ix_analyses_created_at", "analyses", ["created_at", "id"], None),
+        ("ix_analyses_support_created_at", "analyses", ["support", "created_at", "id"], None),
+        ("ix_analyses_supported", "analyses", ["created_at", "id"], "support = 'Supported'"),
+    ]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in indexes(dialect):
+            op.create_index(
+                name, table, columns, if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                sqlite_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(indexes(dialect)):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,110 @@
+"""Full-text search columns behind the public search filters
+
+Postgres: a generated ``search_vector`` column plus a GIN index on claims
+and sources. The vector combines the ``simple`` config (exact tokens, any
+language) with a stemming config for each of SEARCH_LANGUAGES the server
+has in pg_ts_config. A column created earlier outside migrations is
+rebuilt so it picks up the current language list.
+
+SQLite (local/dev): external content FTS5 tables kept in sync by triggers.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import context, op
+import sqlalchemy as sa
+from app.config.settings import SEARCH_LANGUAGES
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# Columns matched by the public search filter, per table
+SEARCHABLE = {
+    "claims": ("text",),
+    "sources": ("title", "domain", "source_name"),
+}
+
+
+def search_configs():
+    languages = [lang for lang in SEARCH_LANGUAGES if lang != "simple"]
+    if not context.is_offline_mode():
+        installed = set(op.get_bind().execute(
+            sa.text("SELECT cfgname FROM pg_ts_config WHERE cfgname = ANY(:names)"), {"names": languages}
+        ).scalars())
+        languages = [lang for lang in languages if lang in installed]
+    return ["simple", *languages]
+
+
+def upgrade():
+    dialect = op.get_context().dialect.name
+    if dialect == "postgresql":
+        upgrade_postgres()
+    elif dialect == "sqlite":
+        upgrade_sqlite()
+
+
+def downgrade():
+    dialect = op.get_context().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            for table in SEARCHABLE:
+                op.drop_index(f"ix_{table}_search", table_name=table, if_exists=True, postgresql_concurrently=True)
+        for table in SEARCHABLE:
+            op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        for table in SEARCHABLE:
+            for suffix in ("ai", "ad", "au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
+
+
+def upgrade_postgres():
+    configs = search_configs()
+    for table, columns in SEARCHABLE.items():
+        document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        vector = " || ".join(f"to_tsvector('{config}', {document})" for config in configs)
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED"
+        )
+    # The column rewrite above holds its lock for the whole transaction;
+    # the indexes are built afterwards without blocking writes
+    with op.get_context().autocommit_block():
+        for table in SEARCHABLE:
+            op.create_index(
+                f"ix_{table}_search", table, ["search_vector"], if_not_exists=True,
+                postgresql_using="gin", postgresql_concurrently=True,
+            )
+
+
+def upgrade_sqlite():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for table, columns in SEARCHABLE.items():
+        fts = f"{table}_fts"
+        cols = ", ".join(columns)
+        new_cols = ", ".join(f"new.{column}" for column in columns)
+        old_cols = ", ".join(f"old.{column}" for column in columns)
+        op.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table}', "
+            f"content_rowid='rowid', tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new_cols}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_cols}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_cols}); "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new_cols}); END"
+        )
+        if fts not in existing:
+            # Index rows written before the FTS table existed
+            op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
@@ -0,0 +1,26 @@
+"""Hourly aggregate table behind /public/stats
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "stat_buckets",
+        sa.Column("metric", sa.String(255), primary_key=True),
+        sa.Column("bucket", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("stat_buckets")
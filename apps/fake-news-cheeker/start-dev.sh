@@ -19,6 +19,6 @@ if [ requirements.txt -nt venv/pyvenv.cfg ]; then
     pip install -r requirements.txt
 fi
 
-# Start the Flask application
-echo "Starting Flask backend server..."
+# Start the development server (uvicorn, see main.py)
+echo "Starting backend server..."
 python3 main.py 
\ No newline at end of file
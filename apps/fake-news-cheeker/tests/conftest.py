@@ -0,0 +1,11 @@
+import os
+import tempfile
+
+# Settings are read at import time: point the app at a throwaway SQLite
+# database and data directory before any test imports it. A Postgres
+# DATABASE_URL from the environment is kept for the query plan tests.
+_data_dir = tempfile.mkdtemp(prefix="fake-news-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_data_dir, 'test.db')}")
+os.environ.setdefault("PERSIST_SPILL_DIR", os.path.join(_data_dir, "spill"))
+os.environ.setdefault("SEARCH_CACHE_PATH", "")
+os.environ.setdefault("EXTRACTION_PROCESSES", "0")
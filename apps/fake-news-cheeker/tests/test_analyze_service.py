@@ -0,0 +1,44 @@
+import asyncio
+import json
+from app.ai.deepseek_client import DeepSeekClient
+from app.services.analyze_service import AnalyzeService
+
+
+class ScriptedClient(DeepSeekClient):
+    """Returns the queued completions in turn instead of calling the LLM"""
+
+    def __init__(self, *responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.prompts = []
+
+    async def ask_async(self, prompt, system_prompt=None, max_tokens=512):
+        self.prompts.append(prompt)
+        return self.responses.pop(0)
+
+
+def analyzer(*responses):
+    service = AnalyzeService()
+    service.ai_client = ScriptedClient(*responses)
+    return service
+
+
+ARTICLE = {"url": "https://nasa.gov/mars", "title": "Water on Mars", "content": "c", "source": "nasa.gov"}
+VERDICT = json.dumps({"relevant": True, "support": "True", "confidence": 90, "reason": "Confirmed"})
+
+
+def test_analysis_recovered_on_retry_is_finalized_like_the_first_attempt():
+    first = asyncio.run(analyzer(VERDICT).analyze_source_async("NASA found water on Mars", ARTICLE))
+    service = analyzer("Sorry, I cannot answer in JSON.", VERDICT)
+    retried = asyncio.run(service.analyze_source_async("NASA found water on Mars", ARTICLE))
+
+    assert len(service.ai_client.prompts) == 2
+    assert retried == first
+    assert retried["authoritative"] is True
+
+
+def test_unparsable_retry_is_unknown():
+    service = analyzer("no json", "still no json")
+    result = asyncio.run(service.analyze_source_async("claim", ARTICLE))
+    assert result["support"] == "Unknown"
+    assert result["reason"] == "Failed to parse JSON"
@@ -0,0 +1,28 @@
+import asyncio
+import httpx
+from flask import Flask, jsonify
+from app.asgi import create_asgi_app
+
+
+def get(app, path):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.get(path)
+    return asyncio.run(run())
+
+
+def test_api_prefixes_go_to_the_async_app_and_the_rest_to_flask():
+    flask_app = Flask(__name__)
+
+    @flask_app.route("/health")
+    def health():
+        return jsonify({"served_by": "flask"})
+
+    app = create_asgi_app(flask_app)
+
+    assert get(app, "/health").json() == {"served_by": "flask"}
+    for path in ("/api/claims/cache-stats", "/api/claims/write-queue", "/api/analysis/llm-status"):
+        response = get(app, path)
+        assert response.status_code == 200, path
+    # Only whole path segments match a prefix
+    assert get(app, "/api/claimsX").status_code == 404
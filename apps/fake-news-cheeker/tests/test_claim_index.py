@@ -0,0 +1,98 @@
+import time
+from app.services.claim_index import EVICT_EVERY, ClaimIndex, claim_tokens, stem
+
+FINGERPRINT = "ab" * 32
+
+
+def test_paraphrase_matches():
+    index = ClaimIndex()
+    index.add(FINGERPRINT, "NASA found water on Mars")
+    match = index.find("Water discovered on Mars by NASA")
+    assert match is not None
+    assert match[0] == FINGERPRINT
+    assert match[1] >= index.lsh.threshold
+
+
+def test_different_entity_does_not_match():
+    index = ClaimIndex()
+    index.add(FINGERPRINT, "Biden won the election in Georgia")
+    assert index.find("Trump won the election in Georgia") is None
+
+
+def test_negations_and_numbers_must_agree():
+    index = ClaimIndex()
+    index.add(FINGERPRINT, "NASA found water on Mars in 2024")
+    assert index.find("NASA found no water on Mars in 2024") is None
+    assert index.find("NASA found water on Mars in 2023") is None
+
+
+def test_stemming():
+    assert stem("discovered") == stem("found") == stem("finds") == "discover"
+    assert stem("vaccines") == stem("vaccine")
+    assert stem("press") == "press"
+    assert stem("اكتشفت") == "اكتشفت"
+    tokens, _ = claim_tokens("The vaccines were approved and banned")
+    assert tokens == {"vaccine", "approve", "ban"}
+
+
+def test_lookups_are_counted_by_caller():
+    index = ClaimIndex()
+    index.add(FINGERPRINT, "NASA found water on Mars")
+    index.find("Water discovered on Mars by NASA")
+    assert index.stats()["hits"] == 0
+    index.record(True)
+    index.record(False)
+    stats = index.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_re_verified_claim_is_indexed_once():
+    index = ClaimIndex()
+    index.add(FINGERPRINT, "NASA found water on Mars")
+    index.add(FINGERPRINT, "NASA found water on Mars")
+    assert index.stats()["size"] == 1
+    tokens, guard = claim_tokens("NASA found water on Mars")
+    assert [key for key, _ in index.lsh.query(index.hasher.signature(tokens), guard)] == [bytes.fromhex(FINGERPRINT)]
+
+
+def test_claims_older_than_max_age_are_evicted():
+    index = ClaimIndex(max_age=3600)
+    now = time.time()
+    index.add(FINGERPRINT, "NASA found water on Mars", timestamp=now - 7200)
+    index.add("cd" * 32, "The WHO approved a malaria vaccine", timestamp=now - 60)
+    # Re-verified recently: its age restarts
+    index.add("ef" * 32, "Biden won the election in Georgia", timestamp=now - 7200)
+    index.add("ef" * 32, "Biden won the election in Georgia", timestamp=now - 60)
+
+    assert index.evict_expired() == 1
+    assert index.find("Water discovered on Mars by NASA") is None
+    assert index.find("WHO approves malaria vaccine")[0] == "cd" * 32
+    assert index.find("Biden won the election in Georgia")[0] == "ef" * 32
+    assert (index.stats()["size"], index.stats()["evicted"]) == (2, 1)
+
+    # Bands rebuilt after the eviction still take new claims
+    index.add(FINGERPRINT, "NASA found water on Mars")
+    assert index.find("Water discovered on Mars by NASA")[0] == FINGERPRINT
+
+
+def test_adds_evict_in_the_background_at_most_every_interval():
+    index = ClaimIndex(max_age=3600)
+    index.add(FINGERPRINT, "NASA found water on Mars", timestamp=time.time() - 7200)
+    assert index._evict_thread is None
+
+    index._evicted_at -= EVICT_EVERY
+    index.add("cd" * 32, "The WHO approved a malaria vaccine")
+    index._evict_thread.join(5)
+    assert (index.stats()["size"], index.stats()["evicted"]) == (1, 1)
+
+
+def test_bulk_load_keeps_the_latest_verification_of_a_claim():
+    # build_from_db sees every row of a claim verified more than once
+    index = ClaimIndex(max_age=3600)
+    tokens, guard = claim_tokens("NASA found water on Mars")
+    signature = index.hasher.signature(tokens)
+    now = time.time()
+    key = bytes.fromhex(FINGERPRINT)
+    index._flush([key, key], [signature, signature], [guard, guard], [now - 7200, now - 60])
+    assert len(index.lsh) == 1
+    assert index.evict_expired() == 0
@@ -0,0 +1,69 @@
+import uuid
+from datetime import datetime, timezone
+import pytest
+from app.database import get_db, init_db
+from app.models.stat_counter import StatCounter
+from app.services.counters import stat_counters, claims_key, sources_key, analyses_key
+from app.services.persistence import write_verifications
+
+
+def record(verdict, category, confidence, urls):
+    return {
+        "claim": {"id": str(uuid.uuid4()), "text": "claim", "verdict": verdict, "confidence": confidence,
+                  "explanation": "e", "conclusion": "c", "category": category,
+                  "fingerprint": uuid.uuid4().hex, "created_at": datetime.now(timezone.utc).isoformat()},
+        "sources": [{"url": url, "domain": url.split("/")[2], "title": "", "snippet": "", "content": "",
+                     "source_name": "test", "last_scraped_at": None, "etag": None, "last_modified": None}
+                    for url in urls],
+        "analyses": [{"id": str(uuid.uuid4()), "url": url, "support": "True", "confidence": 90.0,
+                      "reason": "", "analysis_text": ""} for url in urls],
+    }
+
+
+def counters():
+    with get_db() as db:
+        return dict(db.query(StatCounter.name, StatCounter.value).all())
+
+
+@pytest.fixture
+def tallied():
+    init_db()
+    stat_counters.rebuild()
+    return counters()
+
+
+def test_inserts_move_the_counters_in_step(tallied):
+    domain = f"{uuid.uuid4().hex[:8]}.example"
+    shared = f"https://{domain}/shared"
+    write_verifications([
+        record("False", "health", 0.95, [shared, f"https://{domain}/b"]),
+        record("True", "health", 0.5, [shared]),
+    ])
+
+    after = counters()
+    delta = {name: after.get(name, 0) - tallied.get(name, 0) for name in after}
+    assert delta[claims_key()] == 2
+    assert delta[claims_key(category="health", verdict="False")] == 1
+    assert delta["claims:high_confidence"] == 1
+    # The shared URL is one source row, cited by two analyses
+    assert delta[sources_key()] == 2
+    assert delta[sources_key(domain)] == 2
+    assert delta[analyses_key()] == 3
+    assert delta[analyses_key("True")] == 3
+
+
+def test_replayed_records_do_not_count_twice(tallied):
+    records = [record("Misleading", "politics", 0.7, [f"https://{uuid.uuid4().hex[:8]}.example/a"])]
+    write_verifications(records)
+    once = counters()
+    write_verifications(records)
+    assert counters() == once
+
+
+def test_rebuild_agrees_with_the_incremental_counts(tallied):
+    write_verifications([record("True", "science", 0.9, [f"https://{uuid.uuid4().hex[:8]}.example/a"])])
+    incremental = counters()
+    stat_counters.rebuild()
+    assert counters() == incremental
+    assert stat_counters.get(claims_key(category="science", verdict="True")) >= 1
+    assert stat_counters.get("claims:category:no-such-category") == 0
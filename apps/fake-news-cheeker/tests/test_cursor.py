@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime, timezone
+import pytest
+from flask import Flask
+from app.routes.public_routes import public_bp
+from app.services.public_service import (
+    ANALYSES_KEYSET, CLAIMS_KEYSET, SOURCES_KEYSET, InvalidCursorError, Keyset, PublicService
+)
+
+encode, decode = PublicService.encode_cursor, PublicService.decode_cursor
+NOW = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+ROW_ID = uuid.uuid4()
+
+
+def test_round_trip():
+    assert decode(encode(NOW, ROW_ID), SOURCES_KEYSET) == (NOW, str(ROW_ID))
+    assert decode(encode(None, ROW_ID), SOURCES_KEYSET) == (None, str(ROW_ID))
+    ranked = Keyset("rank", "a.id", uuid_ids=True, ranked=True)
+    assert decode(encode(0.25, ROW_ID), ranked) == (0.25, str(ROW_ID))
+
+
+@pytest.mark.parametrize("cursor, keyset", [
+    ("not base64 at all!", CLAIMS_KEYSET),
+    (encode(NOW, "1; DROP TABLE sources"), SOURCES_KEYSET),
+    (encode(NOW, "123"), ANALYSES_KEYSET),
+    (encode("2025-03-01", ROW_ID), SOURCES_KEYSET),
+    (encode(5, ROW_ID), CLAIMS_KEYSET),
+    (encode(None, ROW_ID), CLAIMS_KEYSET),
+    (encode(True, ROW_ID), Keyset("rank", "id", ranked=True)),
+    (encode({"dt": "yesterday"}, ROW_ID), CLAIMS_KEYSET),
+])
+def test_forged_cursors_are_rejected(cursor, keyset):
+    with pytest.raises(InvalidCursorError):
+        decode(cursor, keyset)
+
+
+def test_forged_cursor_is_a_400():
+    app = Flask(__name__)
+    app.register_blueprint(public_bp)
+    response = app.test_client().get("/public/sources", query_string={"cursor": encode(NOW, "not-a-uuid")})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Invalid pagination cursor"}
@@ -0,0 +1,50 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime, timezone
+from app.utils.export import export_chunks, gzip_chunks
+
+COLUMNS = ["id", "verdict", "created_at"]
+ROWS = [
+    {"id": "a", "verdict": "True", "created_at": datetime(2025, 1, 2, tzinfo=timezone.utc)},
+    {"id": "b", "verdict": None, "created_at": datetime(2025, 1, 3, tzinfo=timezone.utc)},
+]
+
+
+def export(rows, fmt):
+    return "".join(export_chunks(iter([COLUMNS, *rows]), fmt, lambda v: json.dumps(v, default=str), {"verdict": "all"}))
+
+
+def test_csv():
+    assert list(csv.reader(io.StringIO(export(ROWS, "csv")))) == [
+        COLUMNS,
+        ["a", "True", "2025-01-02T00:00:00+00:00"],
+        ["b", "", "2025-01-03T00:00:00+00:00"],
+    ]
+
+
+def test_empty_csv_keeps_the_header():
+    assert export([], "csv") == "id,verdict,created_at\r\n"
+
+
+def test_json_and_ndjson():
+    body = json.loads(export(ROWS, "json"))
+    assert [r["id"] for r in body["data"]] == ["a", "b"]
+    assert body["filters"] == {"verdict": "all"}
+    assert json.loads(export([], "json")) == {"data": [], "filters": {"verdict": "all"}}
+    assert [json.loads(line)["id"] for line in export(ROWS, "ndjson").splitlines()] == ["a", "b"]
+
+
+def test_large_exports_are_chunked_and_gzipped():
+    rows = [{"id": str(i), "verdict": "x" * 100, "created_at": None} for i in range(2000)]
+    chunks = list(export_chunks(iter([COLUMNS, *rows]), "csv", json.dumps))
+    assert len(chunks) > 1
+    body = zlib.decompress(b"".join(gzip_chunks(chunks)), 31).decode()
+    assert body == "".join(chunks)
+
+
+def test_stream_query_yields_columns_first():
+    from app.services.public_service import PublicService
+    assert list(PublicService.stream_query("SELECT 1 AS id, 'x' AS verdict WHERE 1 = 0")) == [["id", "verdict"]]
+    assert list(PublicService.stream_query("SELECT 1 AS id, 'x' AS verdict")) == [["id", "verdict"], {"id": 1, "verdict": "x"}]
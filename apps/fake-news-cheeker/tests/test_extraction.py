@@ -0,0 +1,40 @@
+import re
+import pytest
+from benchmarks.bench_extraction import CORPUS, load_corpus, reference_extract
+from app.utils.extraction import BOILERPLATE, clean_content, extract_content, strip_boilerplate
+
+
+def sequential_sub(text):
+    for pattern, _ in BOILERPLATE:
+        text = re.sub(pattern, "", text, flags=re.I)
+    return text
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "Plain article text with nothing to strip.",
+    "Lead paragraph.\nAdvertisement buy now\nSecond paragraph.",
+    "ADVERTISEMENT\nsponsored content\nRead More: elsewhere\nBody",
+    "Body text.\n© 2024 Example News. All rights reserved.",
+    "Body text.\n©\n2024 Example News",
+    "Body. All rights reserved by us\nMore body",
+    "See our Terms of Use and privacy policy here.",
+    "Body\nComments (12)\nfirst!",
+    "Copyright ©2023 then Comments: none",
+    "Unadvertisement is not a word; sponsoredby neither",
+    "Related:Related: nested triggers Related: again",
+    "Also Read: one\nSign up for the newsletter\nThe end",
+    "İstanbul haberleri\nAdvertisement\nSon dakika",
+    "خبر عاجل\nAdvertisement\nتفاصيل الخبر",
+])
+def test_strip_boilerplate_matches_sequential_re_sub(text):
+    assert strip_boilerplate(text) == sequential_sub(text)
+
+
+def test_clean_content_truncates_after_collapsing_whitespace():
+    assert clean_content("a \n\n b\tc Advertisement d", max_length=3) == "a b"
+
+
+@pytest.mark.parametrize("name, html", sorted(load_corpus(CORPUS).items()))
+def test_extract_content_matches_the_reference_extractor(name, html):
+    assert extract_content(html) == reference_extract(html)
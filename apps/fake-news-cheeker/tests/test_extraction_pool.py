@@ -0,0 +1,69 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from app.core.extraction_pool import ExtractionPool
+
+
+def upper(html):
+    return html.upper()
+
+
+def crash_in_worker(html):
+    """Kills a worker process, like a parser segfault or the OOM killer would"""
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return html.upper()
+
+
+class BrokenPool:
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool("a worker died"))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def broken_pool():
+    pool = ExtractionPool(backend="process", processes=1, threads=1)
+    broken = pool._process_pool = BrokenPool()
+    return pool, broken
+
+
+def test_small_pages_run_on_threads_and_large_ones_on_processes():
+    pool = ExtractionPool(backend="auto", processes=2, process_min_bytes=100)
+    assert not pool.uses_processes(99)
+    assert pool.uses_processes(100)
+    assert not ExtractionPool(backend="auto", processes=0).uses_processes(10 ** 6)
+
+
+def test_async_run_retries_on_a_thread_and_discards_the_broken_pool():
+    pool, broken = broken_pool()
+    assert asyncio.run(pool.run(upper, b"caf\xc3\xa9", "utf-8")) == "CAFÉ"
+    assert broken.shut_down
+    assert pool._process_pool is None
+
+
+def test_sync_run_retries_inline_and_discards_the_broken_pool():
+    pool, broken = broken_pool()
+    assert pool.run_sync(upper, "<p>text</p>") == "<P>TEXT</P>"
+    assert broken.shut_down
+    assert pool._process_pool is None
+
+
+def test_worker_crash_falls_back_and_the_next_call_gets_a_new_pool():
+    pool = ExtractionPool(backend="process", processes=1, threads=1)
+    try:
+        assert asyncio.run(pool.run(crash_in_worker, "<p>x</p>")) == "<P>X</P>"
+        assert pool._process_pool is None
+        # The replacement pool serves later pages on worker processes again
+        assert asyncio.run(pool.run(upper, "<p>y</p>")) == "<P>Y</P>"
+        assert pool._process_pool is not None
+    finally:
+        asyncio.run(pool.close())
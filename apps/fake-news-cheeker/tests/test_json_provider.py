@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime, timezone, timedelta
+import numpy as np
+import pytest
+from flask import Flask
+from app.core.json_provider import dumps, init_json
+
+pytest.importorskip("orjson")
+
+
+@pytest.fixture
+def app():
+    return init_json(Flask(__name__))
+
+
+def test_naive_datetimes_are_utc(app):
+    body = app.json.dumps({"at": datetime(2025, 1, 2, 3, 4, 5)})
+    assert body == '{"at":"2025-01-02T03:04:05+00:00"}'
+    assert dumps({"at": datetime(2025, 1, 2, 3, 4, 5)}) == body
+
+
+def test_aware_datetimes_keep_their_offset(app):
+    at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=3)))
+    assert app.json.dumps({"at": at}) == '{"at":"2025-01-02T03:04:05+03:00"}'
+
+
+def test_uuid_numpy_and_key_order(app):
+    row_id = uuid.UUID(int=1)
+    body = app.json.dumps({"z": np.float32(0.5), "id": row_id, "scores": np.array([1, 2])})
+    assert body == f'{{"z":0.5,"id":"{row_id}","scores":[1,2]}}'
+
+
+def test_response(app):
+    with app.app_context():
+        response = app.json.response({"ok": True})
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"ok": True}
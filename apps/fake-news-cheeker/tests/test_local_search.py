@@ -0,0 +1,22 @@
+import asyncio
+from datetime import datetime, timezone
+from app.database import get_db, init_db
+from app.models.source import Source
+from app.services.local_search import LocalSearchProvider
+
+
+def test_results_carry_the_date_format_the_analyzer_parses():
+    init_db()
+    published = datetime(2025, 3, 14, 9, 30, tzinfo=timezone.utc)
+    with get_db() as db:
+        db.add(Source(url="https://example.org/ganymede-ocean", domain="example.org", source_name="example.org",
+                      title="Subsurface ocean confirmed on Ganymede", content="Hubble data confirm an ocean on Ganymede.",
+                      published_date=published, last_scraped_at=published))
+        db.commit()
+
+    results = asyncio.run(LocalSearchProvider().search_async("ocean on Ganymede"))
+
+    assert [r["url"] for r in results] == ["https://example.org/ganymede-ocean"]
+    assert results[0]["date"] == "2025-03-14"
+    # AnalyzeService reads source dates with strptime(date, "%Y-%m-%d")
+    datetime.strptime(results[0]["date"], "%Y-%m-%d")
@@ -0,0 +1,31 @@
+import uuid
+import pytest
+from sqlalchemy import inspect, text
+from app.database import engine, init_db
+from app.services.public_service import PublicService
+
+pytestmark = pytest.mark.skipif(engine.dialect.name != "sqlite", reason="checks the SQLite search tables")
+
+
+@pytest.fixture(scope="module")
+def migrated():
+    init_db()
+    yield
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM claims"))
+
+
+def test_upgrade_creates_the_search_tables(migrated):
+    tables = set(inspect(engine).get_table_names())
+    assert {"claims", "sources", "analyses", "stat_buckets", "claims_fts", "sources_fts"} <= tables
+
+
+def test_claims_search_uses_the_fts_index(migrated):
+    claim_id = str(uuid.uuid4())
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO claims (id, text, verdict, confidence, explanation, conclusion, category) "
+            "VALUES (:id, 'Vaccines cause autism', 'False', 0.9, '', '', 'health')"
+        ), {"id": claim_id})
+    assert [c["id"] for c in PublicService.get_all_claims(search="vaccine")["data"]] == [claim_id]
+    assert PublicService.get_all_claims(search="measles")["data"] == []
@@ -0,0 +1,114 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from sqlalchemy.exc import OperationalError
+from app.services.persistence import PersistenceQueue
+
+
+class Writer:
+    """Stands in for write_verifications: records batches, rejects poison records"""
+
+    def __init__(self):
+        self.batches = []
+        self.available = True
+
+    def __call__(self, records):
+        if not self.available:
+            raise OperationalError("INSERT", {}, ConnectionRefusedError("database is down"))
+        if any(r.get("poison") for r in records):
+            raise ValueError("invalid input syntax for type uuid")
+        self.batches.append([r["id"] for r in records])
+
+    @property
+    def written(self):
+        return sorted(i for batch in self.batches for i in batch)
+
+
+def make_queue(writer, spill_dir, **kwargs):
+    return PersistenceQueue(writer, spill_dir=str(spill_dir), write_attempts=1,
+                            flush_interval=0.01, replay_interval=0, **kwargs)
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_are_written_in_batches(tmp_path):
+    writer = Writer()
+    q = make_queue(writer, tmp_path, batch_size=10)
+    for i in range(5):
+        assert q.submit({"id": i})
+    q.close()
+    assert writer.written == list(range(5))
+    assert q.stats["written"] == 5
+
+
+def test_poison_record_is_dead_lettered_and_does_not_block_the_batch(tmp_path):
+    writer = Writer()
+    q = make_queue(writer, tmp_path)
+    assert q._flush([{"id": 1}, {"id": 2, "poison": True}, {"id": 3}]) == []
+    assert writer.written == [1, 3]
+    [dead] = read_jsonl(q._dead_letter_path())
+    assert dead["record"] == {"id": 2, "poison": True}
+    assert "uuid" in dead["error"]
+
+
+def test_unavailable_database_spills_instead_of_dead_lettering(tmp_path):
+    writer = Writer()
+    writer.available = False
+    q = make_queue(writer, tmp_path)
+    q.submit({"id": 1})
+    q.submit({"id": 2})
+    q.close()
+    assert [r["id"] for r in read_jsonl(q._spill_path())] == [1, 2]
+    assert not os.path.exists(q._dead_letter_path())
+
+    writer.available = True
+    make_queue(writer, tmp_path)._replay_spill()
+    assert writer.written == [1, 2]
+    assert not os.listdir(tmp_path)
+
+
+def test_replay_skips_torn_lines_and_takes_over_abandoned_claims(tmp_path):
+    dead_pid = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"],
+                              capture_output=True, text=True).stdout.strip()
+    # A worker crashed mid-append, then another crashed while replaying
+    (tmp_path / "pending-1.jsonl").write_text('{"id": 1}\n{"id": 2, "cla')
+    (tmp_path / f"pending-2.jsonl.replay-{dead_pid}").write_text('{"id": 3}\n')
+    # Claimed by a live worker: not ours to replay
+    (tmp_path / f"pending-3.jsonl.replay-{os.getppid()}").write_text('{"id": 4}\n')
+
+    writer = Writer()
+    q = make_queue(writer, tmp_path)
+    q._replay_spill()
+
+    assert writer.written == [1, 3]
+    [dead] = read_jsonl(q._dead_letter_path())
+    assert dead["line"] == '{"id": 2, "cla'
+    assert sorted(os.listdir(tmp_path)) == sorted([f"pending-3.jsonl.replay-{os.getppid()}",
+                                                   os.path.basename(q._dead_letter_path())])
+
+
+def test_spill_after_torn_write_starts_a_new_line(tmp_path):
+    q = make_queue(Writer(), tmp_path)
+    with open(q._spill_path(), "w", encoding="utf-8") as f:
+        f.write('{"id": 1, "tr')
+    q._spill([{"id": 2}])
+    writer = Writer()
+    make_queue(writer, tmp_path)._replay_spill()
+    assert writer.written == [2]
+
+
+@pytest.mark.parametrize("available", [True, False])
+def test_start_replays_without_a_submit(tmp_path, available):
+    (tmp_path / "pending-1.jsonl").write_text('{"id": 7}\n')
+    writer = Writer()
+    writer.available = available
+    q = make_queue(writer, tmp_path)
+    q.start()
+    q.close()
+    assert writer.written == ([7] if available else [])
+    assert os.listdir(tmp_path) == ([] if available else [os.path.basename(q._spill_path())])
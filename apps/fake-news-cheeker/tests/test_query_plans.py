@@ -0,0 +1,90 @@
+"""
+Plan regression test for the public API queries.
+
+Calls every PublicService listing, count, stats and export path, captures
+the SQL each one issues, and EXPLAINs it with sequential scans disabled (so
+small test tables do not hide a missing index). Fails if any plan reads
+claims, sources or analyses with a Seq Scan.
+
+Needs Postgres:  DATABASE_URL=postgresql://... python -m pytest tests/test_query_plans.py
+"""
+import re
+import uuid
+from datetime import datetime, timezone
+from itertools import islice
+import pytest
+from sqlalchemy import event
+from app.database import engine, init_db
+from app.services.public_service import PublicService
+
+pytestmark = pytest.mark.skipif(engine.dialect.name != "postgresql", reason="query plans need a Postgres DATABASE_URL")
+
+CHECKED_TABLES = {"claims", "sources", "analyses"}
+TABLE_PATTERN = re.compile(r"\b(claims|sources|analyses)\b")
+
+CURSOR = PublicService.encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+CASES = {
+    "claims": lambda: PublicService.get_all_claims(),
+    "claims cursor": lambda: PublicService.get_all_claims(cursor=CURSOR),
+    "claims by category+verdict": lambda: PublicService.get_all_claims(category="health", verdict="False"),
+    "claims search": lambda: PublicService.get_all_claims(search="vaccine"),
+    "claims high confidence": lambda: PublicService.get_high_confidence_claims(),
+    "claims by category": lambda: PublicService.get_claims_by_category("health"),
+    "sources": lambda: PublicService.get_all_sources(),
+    "sources cursor": lambda: PublicService.get_all_sources(cursor=CURSOR),
+    "sources search": lambda: PublicService.get_all_sources(search="reuters"),
+    "sources by domain": lambda: PublicService.get_sources_by_domain("bbc.com"),
+    "analyses": lambda: PublicService.get_all_analyses(),
+    "analyses cursor": lambda: PublicService.get_all_analyses(cursor=CURSOR),
+    "analyses by support": lambda: PublicService.get_all_analyses(support="Refuted"),
+    "analyses search": lambda: PublicService.get_all_analyses(search="vaccine"),
+    "analyses supported": lambda: PublicService.get_supported_analyses(),
+    "analyses latest": lambda: PublicService.get_latest_analyses(),
+    "stats": lambda: PublicService.get_system_stats(),
+    "export claims": lambda: list(islice(PublicService.export_claims_csv(category="health"), 2)),
+    "export sources": lambda: list(islice(PublicService.export_sources_csv(domain="bbc.com"), 2)),
+    "export analyses": lambda: list(islice(PublicService.export_analyses_csv(support="Supported"), 2)),
+}
+
+
+def capture(fn):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if TABLE_PATTERN.search(statement):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def seq_scans(plan):
+    """Checked tables read by a Seq Scan anywhere in the plan tree"""
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in CHECKED_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found += seq_scans(child)
+    return found
+
+
+@pytest.fixture(scope="module")
+def explain():
+    init_db()
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        yield lambda statement, parameters: conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        ).scalar()[0]["Plan"]
+        conn.rollback()
+
+
+@pytest.mark.parametrize("label", CASES)
+def test_public_query_uses_an_index(explain, label):
+    for statement, parameters in capture(CASES[label]):
+        scanned = seq_scans(explain(statement, parameters))
+        assert not scanned, f"Seq Scan on {', '.join(scanned)}: {' '.join(statement.split())[:300]}"
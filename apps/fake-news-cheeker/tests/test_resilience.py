@@ -0,0 +1,128 @@
+import asyncio
+from collections import deque
+import httpx
+import pytest
+from app.ai import deepseek_client
+from app.ai.resilience import (
+    CircuitBreaker, CircuitOpenError, RetryExhaustedError, RetryPolicy, with_resilience
+)
+from app.services.analyze_service import AnalyzeService
+
+
+def status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://llm.example/v1/chat")
+    response = httpx.Response(status, request=request, headers={"Retry-After": "1"})
+    return httpx.HTTPStatusError(str(status), request=request, response=response)
+
+
+def flaky(failures):
+    """A coroutine function that raises each of ``failures`` in turn, then returns "ok" """
+    errors = list(failures)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+    return call, calls
+
+
+def test_transient_errors_are_retried():
+    call, calls = flaky([status_error(503), httpx.ConnectError("reset")])
+    wrapped = with_resilience(RetryPolicy(max_attempts=3, base_delay=0, max_delay=0), CircuitBreaker("t"))(call)
+    assert asyncio.run(wrapped()) == "ok"
+    assert len(calls) == 3
+
+
+def test_client_errors_are_not_retried():
+    call, calls = flaky([status_error(400)])
+    wrapped = with_resilience(RetryPolicy(max_attempts=3, base_delay=0), CircuitBreaker("t"))(call)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(wrapped())
+    assert len(calls) == 1
+
+
+def test_retries_exhausted():
+    call, calls = flaky([status_error(502)] * 5)
+    wrapped = with_resilience(RetryPolicy(max_attempts=2, base_delay=0, max_delay=0), CircuitBreaker("t"))(call)
+    with pytest.raises(RetryExhaustedError):
+        asyncio.run(wrapped())
+    assert len(calls) == 2
+
+
+def test_delay_is_jittered_and_honours_retry_after():
+    policy = RetryPolicy(base_delay=0.5, max_delay=8.0)
+    assert all(0 <= policy.delay(3) <= 4.0 for _ in range(100))
+    assert policy.delay(0, status_error(429)) >= 1.0
+
+
+def test_breaker_opens_on_error_rate_and_recovers_through_probe():
+    breaker = CircuitBreaker("t", failure_rate=0.5, min_calls=4, window=60, open_seconds=0)
+    for failed in (False, True, False, True):
+        breaker.before_call()
+        breaker.record_failure() if failed else breaker.record_success()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # open_seconds elapsed: one probe goes through, concurrent calls are rejected
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.metrics()["opened"] == 1
+
+
+def test_open_breaker_rejects_without_calling_upstream():
+    breaker = CircuitBreaker("t", min_calls=1, open_seconds=60)
+    call, calls = flaky([status_error(500)] * 5)
+    wrapped = with_resilience(RetryPolicy(max_attempts=3, base_delay=0, max_delay=0), breaker)(call)
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(wrapped())
+    assert len(calls) == 1
+    assert breaker.metrics()["rejected"] == 1
+
+
+def test_sync_functions_are_rejected():
+    # Backoff would block the calling thread
+    with pytest.raises(TypeError):
+        with_resilience(RetryPolicy(), CircuitBreaker("t"))(lambda: "ok")
+
+
+class UnavailableLLM:
+    """Pooled client stand-in whose every completion call gets a 503"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def post(self, url, json=None):
+        self.calls += 1
+        raise status_error(503)
+
+
+@pytest.fixture
+def unavailable_llm(monkeypatch):
+    llm = UnavailableLLM()
+    monkeypatch.setattr(deepseek_client, "_get_async_client", lambda: llm)
+    monkeypatch.setattr(deepseek_client.llm_retry_policy, "max_delay", 0)
+    # Degraded upstream with the breaker still closed
+    monkeypatch.setattr(deepseek_client.llm_breaker, "min_calls", 10 ** 6)
+    monkeypatch.setattr(deepseek_client.llm_breaker, "_calls", deque())
+    return llm
+
+
+def test_exhausted_retries_degrade_to_an_unknown_analysis(unavailable_llm):
+    article = {"url": "https://example.com/a", "title": "t", "content": "c", "source": "example.com"}
+    result = asyncio.run(AnalyzeService().analyze_source_async("claim", article))
+    assert result["support"] == "Unknown"
+    assert result["reason"] == "LLM service temporarily unavailable"
+    assert unavailable_llm.calls == deepseek_client.llm_retry_policy.max_attempts
+
+
+def test_exhausted_batch_is_not_re_asked_per_article(unavailable_llm):
+    articles = [{"url": f"https://example.com/{i}", "title": "t", "content": "c", "source": "example.com"}
+                for i in range(3)]
+    results = asyncio.run(AnalyzeService().analyze_batch_async("claim", articles))
+    assert [r["support"] for r in results] == ["Unknown"] * 3
+    assert unavailable_llm.calls == deepseek_client.llm_retry_policy.max_attempts
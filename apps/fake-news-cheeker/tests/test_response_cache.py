@@ -0,0 +1,63 @@
+import pytest
+from flask import Blueprint, Flask, jsonify, request
+from app.core.response_cache import CachePolicy, ResponseCache, write_generation
+
+
+@pytest.fixture
+def client():
+    calls = []
+    cache = ResponseCache(max_entries=2)
+    bp = Blueprint("t", __name__)
+
+    @bp.route("/items")
+    def items():
+        calls.append(request.args.get("page"))
+        return jsonify({"page": request.args.get("page"), "call": len(calls)})
+
+    @bp.route("/uncached")
+    def uncached():
+        calls.append("uncached")
+        return jsonify({"call": len(calls)})
+
+    cache.register(bp, {"items": CachePolicy(ttl=60, max_age=30)})
+    app = Flask(__name__)
+    app.register_blueprint(bp)
+    client = app.test_client()
+    client.calls, client.cache = calls, cache
+    return client
+
+
+def test_repeat_get_is_served_from_cache(client):
+    first = client.get("/items?page=1")
+    second = client.get("/items?page=1")
+    assert second.get_json() == first.get_json()
+    assert client.calls == ["1"]
+    assert second.headers["Cache-Control"] == "public, max-age=30"
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+
+def test_if_none_match_gets_a_304(client):
+    etag = client.get("/items?page=1").headers["ETag"]
+    response = client.get("/items?page=1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    assert client.cache.stats["not_modified"] == 1
+
+
+def test_write_invalidates(client):
+    client.get("/items?page=1")
+    write_generation.bump()
+    assert client.get("/items?page=1").get_json()["call"] == 2
+
+
+def test_query_args_are_part_of_the_key_and_lru_is_bounded(client):
+    for page in ("1", "2", "3", "1"):
+        client.get(f"/items?page={page}")
+    assert client.calls == ["1", "2", "3", "1"]
+
+
+def test_unregistered_views_are_not_cached(client):
+    client.get("/uncached")
+    response = client.get("/uncached")
+    assert client.calls == ["uncached", "uncached"]
+    assert "ETag" not in response.headers
@@ -0,0 +1,198 @@
+import asyncio
+import threading
+from app.services import google_search_service
+from app.services.google_search_service import GoogleSearchService
+from app.services.search_cache import CachedSearch, SearchCache, SqliteSearchStore
+
+
+class ThreadRecordingStore(SqliteSearchStore):
+    """SQLite store that notes which thread each call ran on"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def put(self, key, entry):
+        self.threads.append(threading.get_ident())
+        super().put(key, entry)
+
+
+class FailingStore:
+    def get(self, key):
+        raise OSError("disk gone")
+
+    def put(self, key, entry):
+        raise OSError("disk gone")
+
+
+def age(cache, key, seconds):
+    entry = cache._entries[key]
+    cache._entries[key] = CachedSearch(entry.results, entry.stored_at - seconds)
+
+
+def test_lru_evicts_the_least_recently_used_entry():
+    cache = SearchCache(max_size=2)
+    cache.put("a", [1])
+    cache.put("b", [2])
+    cache.get("a")
+    cache.put("c", [3])
+    assert cache.get("b") is None
+    assert cache.get("a").results == [1]
+    assert cache.stats["evictions"] == 1
+
+
+def test_stale_entries_are_served_until_the_stale_window_ends():
+    cache = SearchCache(ttl=10, stale_ttl=100)
+    cache.put("q", [1])
+    age(cache, "q", 50)
+    entry = cache.get("q")
+    assert entry.results == [1] and not cache.is_fresh(entry)
+    assert cache.stats["stale_hits"] == 1
+
+    age(cache, "q", 100)
+    assert cache.get("q") is None
+    assert cache.stats["expired"] == 1
+
+
+def test_store_survives_a_new_cache_instance(tmp_path):
+    path = str(tmp_path / "search.sqlite3")
+    SearchCache(store=SqliteSearchStore(path)).put("q", [{"url": "https://example.com"}])
+
+    cache = SearchCache(store=SqliteSearchStore(path))
+    assert cache.get("q").results == [{"url": "https://example.com"}]
+    assert cache.stats["store_hits"] == 1
+    # Promoted to memory: the next lookup does not touch the store
+    cache.store = FailingStore()
+    assert cache.get("q") is not None
+    assert cache.stats["store_errors"] == 0
+
+
+def test_store_errors_are_misses():
+    cache = SearchCache(store=FailingStore())
+    cache.put("q", [1])
+    cache._entries.clear()
+    assert cache.get("q") is None
+    assert cache.stats["store_errors"] == 2
+
+
+def test_async_store_io_runs_off_the_event_loop(tmp_path):
+    path = str(tmp_path / "search.sqlite3")
+    cache = SearchCache(store=ThreadRecordingStore(path))
+
+    async def run():
+        await cache.put_async("q", [1])
+        cache._entries.clear()
+        entry = await cache.get_async("q")
+        # Memory hit: no store call at all
+        await cache.get_async("q")
+        return threading.get_ident(), entry
+
+    loop_thread, entry = asyncio.run(run())
+    assert entry.results == [1]
+    assert len(cache.store.threads) == 2
+    assert loop_thread not in cache.store.threads
+
+
+def test_stale_hit_is_returned_and_refreshed_in_the_background(monkeypatch):
+    monkeypatch.setattr(google_search_service, "GOOGLE_API_KEY", "key")
+    monkeypatch.setattr(google_search_service, "GOOGLE_CX", "cx")
+    service = GoogleSearchService(cache=SearchCache(ttl=10, stale_ttl=100))
+    calls = []
+
+    async def search_page(query, num, lang=None, page=1):
+        calls.append(query)
+        await asyncio.sleep(0)
+        return [{"url": f"https://example.com/{len(calls)}"}]
+
+    monkeypatch.setattr(service, "_search_page", search_page)
+
+    async def run():
+        first = await asyncio.gather(*(service.search_async("claim", max_results=1) for _ in range(3)))
+        age(service.cache, "claim-1-auto", 50)
+        stale = await service.search_async("claim", max_results=1)
+        await asyncio.gather(*list(service._inflight[asyncio.get_running_loop()].values()))
+        fresh = await service.search_async("claim", max_results=1)
+        return first, stale, fresh
+
+    first, stale, fresh = asyncio.run(run())
+    assert first == [[{"url": "https://example.com/1"}]] * 3
+    assert service.stats["coalesced"] == 2
+    assert stale == [{"url": "https://example.com/1"}]
+    assert fresh == [{"url": "https://example.com/2"}]
+    assert service.stats["revalidations"] == 1
+    assert len(calls) == 2
+
+
+def single_flight_service(monkeypatch, fail=False):
+    monkeypatch.setattr(google_search_service, "GOOGLE_API_KEY", "key")
+    monkeypatch.setattr(google_search_service, "GOOGLE_CX", "cx")
+    service = GoogleSearchService(cache=SearchCache(ttl=10, stale_ttl=100))
+    service.calls = []
+    release = asyncio.Event()
+
+    async def search_page(query, num, lang=None, page=1):
+        service.calls.append((query, lang))
+        await release.wait()
+        if fail:
+            raise ConnectionError("quota exceeded")
+        return [{"url": f"https://example.com/{query}/{lang}"}]
+
+    monkeypatch.setattr(service, "_search_page", search_page)
+    return service, release
+
+
+def test_concurrent_misses_share_one_upstream_call(monkeypatch):
+    service, release = single_flight_service(monkeypatch)
+
+    async def run():
+        same = [asyncio.ensure_future(service.search_async("claim", max_results=1)) for _ in range(5)]
+        other = asyncio.ensure_future(service.search_async("claim", max_results=1, lang="ar"))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*same, other)
+        return results, dict(service._inflight[asyncio.get_running_loop()])
+
+    results, inflight = asyncio.run(run())
+    assert results[:5] == [[{"url": "https://example.com/claim/None"}]] * 5
+    assert results[5] == [{"url": "https://example.com/claim/ar"}]
+    # One call per distinct query; the other callers joined it
+    assert len(service.calls) == 2 and set(service.calls) == {("claim", None), ("claim", "ar")}
+    assert service.stats["coalesced"] == 4
+    assert inflight == {}
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_fetch(monkeypatch):
+    service, release = single_flight_service(monkeypatch)
+
+    async def run():
+        leaver = asyncio.ensure_future(service.search_async("claim", max_results=1))
+        stayer = asyncio.ensure_future(service.search_async("claim", max_results=1))
+        await asyncio.sleep(0)
+        leaver.cancel()
+        release.set()
+        return await stayer, leaver.cancelled()
+
+    result, cancelled = asyncio.run(run())
+    assert cancelled
+    assert result == [{"url": "https://example.com/claim/None"}]
+    assert len(service.calls) == 1
+
+
+def test_failed_fetch_is_shared_but_not_cached(monkeypatch):
+    service, release = single_flight_service(monkeypatch, fail=True)
+
+    async def run():
+        waiters = [asyncio.ensure_future(service.search_async("claim", max_results=1)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+        await service.search_async("claim", max_results=1)
+        return results
+
+    assert asyncio.run(run()) == [[]] * 3
+    # Every waiter got the one failed answer; the next search goes upstream again
+    assert len(service.calls) == 2
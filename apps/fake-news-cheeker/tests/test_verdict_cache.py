@@ -0,0 +1,73 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.database import get_db, init_db
+from app.models.claim_model import Claim
+from app.services.verdict_cache import VerdictCache
+
+TTLS = {"finance": 3600, "science": 72 * 3600}
+
+
+def result(category):
+    return {"status": "success", "verdict": "True", "category": category, "sources": []}
+
+
+def test_ttl_follows_the_claim_category():
+    cache = VerdictCache(ttls=TTLS, default_ttl=600)
+    assert cache.ttl_for("finance") == 3600
+    assert cache.ttl_for("science") == 72 * 3600
+    assert cache.ttl_for("sports") == 600
+    assert cache.ttl_for(None) == 600
+
+
+def test_memory_entries_expire_per_category(monkeypatch):
+    cache = VerdictCache(ttls=TTLS, default_ttl=600)
+    monkeypatch.setattr(cache, "_load_from_db", lambda fingerprint: None)
+    now = time.time()
+    cache.put("stock", result("finance"), created_at=now - 2 * 3600)
+    cache.put("mars", result("science"), created_at=now - 2 * 3600)
+
+    # A two-hour-old finance verdict is already stale; a science one is not
+    assert cache.get("stock") is None
+    assert cache.get("mars")["category"] == "science"
+    assert cache.stats == {"memory_hits": 1, "db_hits": 0, "misses": 1}
+
+
+def test_lru_keeps_the_most_recently_used(monkeypatch):
+    cache = VerdictCache(max_size=2, ttls=TTLS)
+    monkeypatch.setattr(cache, "_load_from_db", lambda fingerprint: None)
+    for fingerprint in ("a", "b"):
+        cache.put(fingerprint, result("science"))
+    assert cache.get("a") is not None
+    cache.put("c", result("science"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+@pytest.fixture
+def stored_claim():
+    init_db()
+
+    def store(category, age):
+        fingerprint = uuid.uuid4().hex
+        with get_db() as db:
+            db.add(Claim(text="claim", verdict="False", confidence=80.0, explanation="e", conclusion="c",
+                         category=category, fingerprint=fingerprint,
+                         created_at=datetime.now(timezone.utc) - age))
+            db.commit()
+        return fingerprint
+    return store
+
+
+def test_database_fallback_honours_the_category_ttl(stored_claim):
+    cache = VerdictCache(ttls=TTLS, default_ttl=600)
+    fresh = stored_claim("science", timedelta(hours=2))
+    stale = stored_claim("finance", timedelta(hours=2))
+
+    assert cache.get(fresh)["verdict"] == "False"
+    assert cache.get(stale) is None
+    assert cache.stats == {"memory_hits": 0, "db_hits": 1, "misses": 1}
+    # The loaded verdict keeps the claim's age: it is served from memory now
+    assert cache.get(fresh) is not None
+    assert cache.stats["memory_hits"] == 1
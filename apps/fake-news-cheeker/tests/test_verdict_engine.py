@@ -0,0 +1,98 @@
+import asyncio
+from datetime import date
+import pytest
+from app.services.analyze_service import AnalyzeService
+from app.services.claim_service import ClaimService
+from app.services.verdict_engine import IncrementalVerdict
+
+
+def analysis(source, support="True", confidence=90, authoritative=False):
+    return {"url": f"https://{source}/a", "source": source, "date": date.today().isoformat(), "relevant": True,
+            "support": support, "confidence": confidence, "authoritative": authoritative}
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return AnalyzeService()
+
+
+def test_authoritative_override_settles(analyzer):
+    engine = IncrementalVerdict(analyzer, total=4)
+    engine.add(analysis("nasa.gov", authoritative=True))
+    assert engine.is_decided()
+
+
+def test_true_band_settles_before_every_source_is_in(analyzer):
+    engine = IncrementalVerdict(analyzer, total=4)
+    for source in ("reuters", "bbc"):
+        engine.add(analysis(source))
+        assert not engine.is_decided()
+    engine.add(analysis("ap"))
+    assert engine.is_decided()
+
+
+def test_non_true_verdict_stays_open_while_sources_remain(analyzer):
+    # Any remaining source may come back flagged authoritative and flip the verdict to True
+    engine = IncrementalVerdict(analyzer, total=4)
+    for source in ("reuters", "bbc", "ap"):
+        engine.add(analysis(source, support="False"))
+    assert not engine.is_decided()
+    engine.add(analysis("example.com", support="False"))
+    assert engine.is_decided()
+
+
+class FakeScraper:
+    def __init__(self, urls):
+        self.results = [{"url": url, "title": url, "source": url.split("/")[2]} for url in urls]
+
+    async def search_async(self, query, max_results=4):
+        return self.results
+
+    async def iter_scraped(self, search_results):
+        for result in search_results:
+            yield {**result, "content": "text", "status": "success"}
+
+
+class FakeAnalyzer(AnalyzeService):
+    """The first source confirms the claim at once; the others take far longer"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls, self.cancelled = [], []
+
+    async def analyze_batch_async(self, claim, articles):
+        self.calls.append([a["url"] for a in articles])
+        if articles[0]["source"] == "nasa.gov":
+            return [analysis("nasa.gov", confidence=95, authoritative=True)]
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            self.cancelled.extend(a["url"] for a in articles)
+            raise
+        return [analysis(a["source"], support="False") for a in articles]
+
+
+class FakeQueue:
+    def __init__(self):
+        self.records = []
+
+    def submit(self, record):
+        self.records.append(record)
+
+
+def test_clear_cut_claim_cancels_outstanding_work():
+    service = ClaimService()
+    urls = ["https://nasa.gov/water", "https://example.com/1", "https://example.org/2", "https://example.net/3"]
+    service.scraper = FakeScraper(urls)
+    service.analyzer = FakeAnalyzer()
+    service.persistence = FakeQueue()
+    service.early_termination = True
+    service.stream_batch_size = 1
+
+    result = asyncio.run(asyncio.wait_for(service.verify_claim_async("NASA confirms ice at the lunar south pole"), 5))
+
+    assert result["verdict"] == "True"
+    assert result["early_stop"] == {"analyzed": 1, "total": 4}
+    assert len(service.analyzer.calls) == 4
+    assert sorted(service.analyzer.cancelled) == sorted(urls[1:])
+    assert len(service.persistence.records) == 1